@@ -0,0 +1,74 @@
+'''Compare grouping the instances of a model and aggregating their fields
+with a loop over each instance, against
+:meth:`~panda_core_data.model.Model.aggregate`, the first time and after the
+result is cached.
+
+Usage::
+
+    python benchmarks/bench_aggregations.py [instances] [kinds]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import random
+import sys
+import time
+
+from panda_core_data import DataCore
+from panda_core_data.model import Model
+
+DataCore(name="aggregations", validate=False)
+
+
+class Items(Model, data_name="items", core_name="aggregations"):
+    name: str
+    kind: str
+    value: int
+
+
+def naive_aggregate() -> dict:
+    result = {}
+    for item in Items.all_instances:
+        group = result.setdefault(item.kind, {"total": 0, "n": 0,
+                                              "top": None})
+        group["total"] += item.value
+        group["n"] += 1
+        if group["top"] is None or item.value > group["top"]:
+            group["top"] = item.value
+    return result
+
+
+def aggregate() -> dict:
+    return Items.aggregate(group_by="kind", total=("value", "sum"),
+                           n=("name", "count"), top=("value", "max"))
+
+
+def measure(label: str, function) -> dict:
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    print(f"{label:24} {elapsed * 1000:10.2f} ms")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    kinds = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    random.seed(0)
+    Items.from_frame({"name": [f"item {index}" for index in range(count)],
+                      "kind": [f"kind {random.randrange(kinds)}"
+                               for _ in range(count)],
+                      "value": [random.randrange(count)
+                                for _ in range(count)]}, update=False)
+
+    naive = measure("loop over instances", naive_aggregate)
+    first = measure("first aggregate", aggregate)
+    cached = measure("cached aggregate", aggregate)
+    assert naive == first == cached
+
+    Items.wrapper.instances[0].value += 1
+    measure("aggregate after change", aggregate)
+
+
+if __name__ == "__main__":
+    main()
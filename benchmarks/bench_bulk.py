@@ -0,0 +1,59 @@
+'''Compare creating many instances by calling the constructor of the model
+in a loop against :meth:`~panda_core_data.model.Model.bulk_create`, with
+and without writing their raws into a packed storage.
+
+Usage::
+
+    python benchmarks/bench_bulk.py [instances]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import os
+import sys
+import tempfile
+import time
+
+from panda_core_data import DataCore
+from panda_core_data.model import Model
+
+DataCore(name="bulk", validate=False)
+
+
+class Items(Model, data_name="items", core_name="bulk"):
+    name: str
+    value: int
+    weight: float = 1.0
+
+
+def constructor_loop(records: list):
+    for record in records:
+        Items(**record)
+
+
+def measure(label: str, function, *args):
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:24} {elapsed * 1000:10.2f} ms")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    records = [{"name": f"item {index}", "value": index}
+               for index in range(count)]
+    rows = [(f"item {index}", index) for index in range(count)]
+
+    loop = measure("constructor loop", constructor_loop, records)
+    dicts = measure("bulk_create dicts", Items.bulk_create, records)
+    tuples = measure("bulk_create tuples", Items.bulk_create, rows)
+    print(f"{'speedup dicts':24} {loop / dicts:10.2f}x")
+    print(f"{'speedup tuples':24} {loop / tuples:10.2f}x")
+
+    with tempfile.TemporaryDirectory() as folder:
+        measure("bulk_create packed", Items.bulk_create, records,
+                os.path.join(folder, "items.sqlite"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+'''Compare loading the same raws uncompressed and compressed with each codec,
+from a cold page cache. The cache of each raw is dropped with
+:func:`os.posix_fadvise` before loading, so the raws are read from the disk
+again, which is where compression pays off.
+
+Usage::
+
+    python benchmarks/bench_compression.py [raws]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import json
+import os
+from os.path import join
+import sys
+import tempfile
+import time
+
+from panda_core_data import DataCore
+from panda_core_data.model import Model
+from panda_core_data.storages import convert_raws
+from panda_core_data.storages.compression import CODECS
+
+FORMATS = ["json"] + [f"json.{compression}" for compression in CODECS]
+
+
+def folder_size(path: str) -> int:
+    return sum(os.path.getsize(join(root, name))
+               for root, _, names in os.walk(path) for name in names)
+
+
+def drop_cache(path: str):
+    for root, _, names in os.walk(path):
+        for name in names:
+            file_descriptor = os.open(join(root, name), os.O_RDONLY)
+            try:
+                os.fdatasync(file_descriptor)
+                os.posix_fadvise(file_descriptor, 0, 0,
+                                 os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(file_descriptor)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    with tempfile.TemporaryDirectory() as root:
+        items_dir = join(root, "json", "items")
+        os.makedirs(items_dir)
+        for index in range(count):
+            with open(join(items_dir, f"item_{index}.json"), "w") as raw:
+                json.dump({"data": [
+                    {"name": f"item {index}"},
+                    {"description": f"item number {index} " * 20},
+                    {"value": index},
+                    {"weight": index / 3},
+                ]}, raw)
+
+        for extension in FORMATS[1:]:
+            convert_raws(join(root, "json"), join(root, extension), extension)
+
+        for extension in FORMATS:
+            folder = join(root, extension)
+            data_core = DataCore(name=extension, validate=False)
+
+            class Items(Model, data_name="items", core_name=extension):
+                name: str
+                description: str
+                value: int
+                weight: float
+
+            drop_cache(folder)
+            start = time.perf_counter()
+            data_core.recursively_instance_model(folder)
+            elapsed = time.perf_counter() - start
+            assert len(Items.wrapper.instances) == count
+            for instance in Items.all_instances:
+                instance.close()
+
+            print(f"{extension:10} {elapsed * 1000:10.2f} ms "
+                  f"{folder_size(folder) / 1024:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
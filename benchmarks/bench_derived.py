@@ -0,0 +1,75 @@
+'''Compare reading a value computed from the fields of each instance through
+a property, which computes it on every read, against a
+:func:`~panda_core_data.derived.derived` field, which is cached until the
+fields it read change. Some of the instances change between the reads.
+
+Usage::
+
+    python benchmarks/bench_derived.py [instances] [reads]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import random
+import sys
+import time
+from typing import List
+
+from panda_core_data import DataCore
+from panda_core_data.derived import derived
+from panda_core_data.model import Model
+
+DataCore(name="derived", validate=False)
+
+
+class Items(Model, data_name="items", core_name="derived"):
+    name: str
+    weights: List[float]
+    bonus: float = 0.0
+
+    @property
+    def computed_weight(self) -> float:
+        return sum(self.weights) * (1 + self.bonus)
+
+    @derived
+    def total_weight(self) -> float:
+        return sum(self.weights) * (1 + self.bonus)
+
+
+def read_all(reads: int, attribute: str) -> float:
+    total = 0.0
+    instances = Items.wrapper.snapshot()
+    for read in range(reads):
+        for instance in instances[read::reads * 10]:
+            instance.bonus = read / 10
+        for instance in instances:
+            total += getattr(instance, attribute)
+    return total
+
+
+def measure(label: str, function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:24} {elapsed * 1000:10.2f} ms")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    reads = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    random.seed(0)
+    Items.from_frame({"name": [f"item {index}" for index in range(count)],
+                      "weights": [[random.random() for _ in range(20)]
+                                  for _ in range(count)]}, update=False)
+
+    expected = measure("property", read_all, reads, "computed_weight")
+    for instance in Items.all_instances:
+        instance.bonus = 0.0
+    measure("precompute", Items.precompute_derived)
+    cached = measure("derived", read_all, reads, "total_weight")
+    assert abs(expected - cached) < 1e-6 * abs(expected)
+
+
+if __name__ == "__main__":
+    main()
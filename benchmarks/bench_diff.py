@@ -0,0 +1,84 @@
+'''Compare diffing two versions of a model by reading and comparing the
+fields of each pair of instances against :meth:`DataCore.diff`, without
+hashes, while the content hashes of both versions are computed and once they
+are cached.
+
+Usage::
+
+    python benchmarks/bench_diff.py [instances] [changes]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import random
+import sys
+import time
+from typing import List
+
+from panda_core_data import DataCore
+from panda_core_data.diff import content_hashes
+from panda_core_data.model import Model
+
+OLD = DataCore(name="diff_old", validate=False)
+NEW = DataCore(name="diff_new", validate=False)
+
+
+class OldItems(Model, data_name="items", core_name="diff_old"):
+    name: str
+    value: int
+    weight: float
+    tags: List[str]
+
+
+class NewItems(Model, data_name="items", core_name="diff_new"):
+    name: str
+    value: int
+    weight: float
+    tags: List[str]
+
+
+def naive_diff() -> int:
+    new_items = {item.name: item for item in NewItems.all_instances}
+    entries = 0
+    for item in OldItems.all_instances:
+        other = new_items.pop(item.name, None)
+        if other is None or dict(item.items()) != dict(other.items()):
+            entries += 1
+    return entries + len(new_items)
+
+
+def core_diff() -> int:
+    return sum(1 for _ in OLD.diff(NEW))
+
+
+def hash_both() -> int:
+    content_hashes(OldItems)
+    return len(content_hashes(NewItems).hashes)
+
+
+def measure(label: str, function):
+    start = time.perf_counter()
+    entries = function()
+    elapsed = time.perf_counter() - start
+    print(f"{label:24} {elapsed * 1000:10.2f} ms {entries:8} entries")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    changes = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    random.seed(0)
+    records = [(f"item {index}", index, random.random(), ["tool", "metal"])
+               for index in range(count)]
+    OldItems.bulk_create(records)
+    NewItems.bulk_create(records[changes:])
+    for item in random.sample(list(NewItems.all_instances), changes):
+        item.value = -1
+
+    measure("naive diff", naive_diff)
+    measure("diff", core_diff)
+    measure("content hashes", hash_both)
+    measure("diff, hashes cached", core_diff)
+
+
+if __name__ == "__main__":
+    main()
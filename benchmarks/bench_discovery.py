@@ -0,0 +1,73 @@
+'''Compare finding the raws of a large tree with a glob per extension, how
+the raws were found before, against a single :func:`os.scandir` pass per
+folder with :func:`~panda_core_data.storages.iter_raw_files`. Each raw found
+is checked with ``is_file`` three times, like the loaders do, and the tree is
+fingerprinted with the stat of each raw.
+
+Usage::
+
+    python benchmarks/bench_discovery.py [raws] [folders]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import os
+from os.path import join
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+from panda_core_data.storages import (fingerprint_raws, get_raw_extensions,
+                                      iter_raw_files)
+
+
+def glob_discovery(root: str) -> int:
+    found = []
+    folders = [path for path in Path(root).iterdir() if path.is_dir()]
+    for folder in folders:
+        for extension in get_raw_extensions():
+            for raw_file in folder.glob(f"*.{extension}"):
+                for _ in range(3):
+                    raw_file.is_file()
+                found.append(raw_file)
+    fingerprint_raws(found, root)
+    return len(found)
+
+
+def scandir_discovery(root: str) -> int:
+    found = []
+    for raw_file in iter_raw_files(root):
+        for _ in range(3):
+            raw_file.is_file()
+        found.append(raw_file)
+    fingerprint_raws(found, root)
+    return len(found)
+
+
+def measure(label: str, function, root: str) -> int:
+    start = time.perf_counter()
+    found = function(root)
+    elapsed = time.perf_counter() - start
+    print(f"{label:24} {elapsed * 1000:10.2f} ms {found:8} raws")
+    return found
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    folders = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    with tempfile.TemporaryDirectory() as root:
+        for folder in range(folders):
+            os.makedirs(join(root, f"model_{folder}"))
+        for index in range(count):
+            folder = join(root, f"model_{index % folders}")
+            with open(join(folder, f"raw_{index}.json"), "w"):
+                pass
+
+        globbed = measure("glob per extension", glob_discovery, root)
+        scanned = measure("scandir single pass", scandir_discovery, root)
+        assert globbed == scanned == count
+
+
+if __name__ == "__main__":
+    main()
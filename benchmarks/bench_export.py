@@ -0,0 +1,62 @@
+'''Compare exporting all instances of a model into NDJSON with ``items()`` and
+:func:`json.dumps` against :meth:`~panda_core_data.model.Model.export` in
+each format.
+
+Usage::
+
+    python benchmarks/bench_export.py [instances]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import json
+from os.path import getsize, join
+import sys
+import tempfile
+import time
+from typing import List
+
+from panda_core_data import data_core
+from panda_core_data.model import Model
+
+
+class Items(Model, data_name="items"):
+    name: str
+    description: str
+    value: int
+    weight: float
+    tags: List[str]
+
+
+def naive_export(path: str):
+    with open(path, "w") as output:
+        for instance in Items.all_instances:
+            output.write(json.dumps(dict(instance.items())) + "\n")
+
+
+def measure(label: str, function, path: str):
+    start = time.perf_counter()
+    function(path)
+    elapsed = time.perf_counter() - start
+    print(f"{label:24} {elapsed * 1000:10.2f} ms "
+          f"{getsize(path) / 1024 / 1024:8.1f} MiB")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for index in range(count):
+        Items(f"item {index}", f"item number {index}", index, index / 3,
+              ["common", "tool"])
+    assert len(data_core.get_model_type("items").wrapper.instances) == count
+
+    with tempfile.TemporaryDirectory() as root:
+        measure("items() + json.dumps", naive_export,
+                join(root, "naive.ndjson"))
+        for export_format in ("ndjson", "csv", "arrow"):
+            measure(f"export {export_format}",
+                    lambda path, export_format=export_format: Items.export(
+                        path, format=export_format),
+                    join(root, f"items.{export_format}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+'''Measure how much memory of a loaded data core stays shared with forked
+workers, with and without :meth:`~panda_core_data.DataCore.freeze`.
+
+Each worker handles "requests" that read a few instances and allocate some
+garbage, so the garbage collector runs a full collection now and then, which
+is what usually ends up copying the pages of the parent. Linux only, since it
+reads `/proc/self/smaps_rollup`.
+
+Usage::
+
+    python benchmarks/bench_fork_sharing.py [instances]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import gc
+import os
+import random
+import sys
+from typing import Dict, List
+
+from panda_core_data import DataCore
+from panda_core_data.model import Model
+
+
+def memory_usage() -> Dict[str, int]:
+    "Read the memory counters of the current process in kB"
+    usage = {}
+    with open("/proc/self/smaps_rollup") as smaps:
+        for line in smaps:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                usage[parts[0].rstrip(":")] = int(parts[1])
+    return usage
+
+
+def worker(write_pipe: int, instances: List[Model]):
+    for _ in range(2000):
+        instance = random.choice(instances)
+        garbage = [dict(instance.items()) for _ in range(20)]
+        del garbage
+    gc.collect()
+
+    usage = memory_usage()
+    os.write(write_pipe, f"{usage['Private_Dirty']} {usage['Rss']}".encode())
+    os._exit(0)  # pylint: disable=protected-access
+
+
+def run(instance_count: int, freeze: bool):
+    data_core = DataCore(name=f"fork_sharing_{freeze}")
+
+    class Item(Model, core_name=data_core.name):
+        name: str
+        description: str
+        value: int
+        tags: List[str]
+
+    for index in range(instance_count):
+        Item(f"item {index}", f"description of item {index}", index,
+             [f"tag {index % 10}"])
+
+    if freeze:
+        data_core.freeze(read_only=True)
+
+    instances = list(Item.all_instances)
+    read_pipe, write_pipe = os.pipe()
+    pid = os.fork()
+    if not pid:
+        worker(write_pipe, instances)
+
+    os.waitpid(pid, 0)
+    private_dirty, rss = map(int, os.read(read_pipe, 100).split())
+    shared = 100 * (rss - private_dirty) / rss
+    print(f"freeze={freeze!s:5} worker rss={rss / 1024:8.1f} MiB "
+          f"private={private_dirty / 1024:8.1f} MiB shared={shared:5.1f}%")
+
+
+def main():
+    instance_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    # Each case runs in it's own process, gc.freeze is global.
+    for case in ("no_freeze", "freeze"):
+        pid = os.fork()
+        if not pid:
+            run(instance_count, case == "freeze")
+            os._exit(0)  # pylint: disable=protected-access
+        os.waitpid(pid, 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+'''Compare the time to parse the same raws, and their size on disk, in each
+raw format. The raws are written in json and converted into the others with
+:func:`~panda_core_data.storages.convert_raws` and
+:func:`~panda_core_data.storages.sqlite_db.pack_raws`.
+
+Usage::
+
+    python benchmarks/bench_formats.py [raws]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import json
+import os
+from os.path import join
+import sys
+import tempfile
+import time
+
+from panda_core_data.storages import (convert_raws, get_extension,
+                                      get_storage_from_extension,
+                                      iter_raw_files)
+from panda_core_data.storages.sqlite_db import SqliteDB, pack_raws
+
+FORMATS = ["json", "yaml", "msgpack", "cbor"]
+
+
+def folder_size(path: str) -> int:
+    return sum(os.path.getsize(join(root, name))
+               for root, _, names in os.walk(path) for name in names)
+
+
+def parse_all(path: str) -> int:
+    parsed = 0
+    for raw_file in iter_raw_files(path):
+        storage = get_storage_from_extension(get_extension(raw_file))(raw_file)
+        try:
+            parsed += len(storage.read()["data"])
+        finally:
+            storage.close()
+    return parsed
+
+
+def parse_packed(path: str) -> int:
+    storage = SqliteDB(path)
+    try:
+        return len(storage.read_records())
+    finally:
+        storage.close()
+
+
+def measure(label: str, function, path: str, size: int):
+    start = time.perf_counter()
+    function(path)
+    elapsed = time.perf_counter() - start
+    print(f"{label:10} {elapsed * 1000:10.2f} ms {size / 1024:10.1f} KiB")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    with tempfile.TemporaryDirectory() as root:
+        items_dir = join(root, "json", "items")
+        os.makedirs(items_dir)
+        for index in range(count):
+            with open(join(items_dir, f"item_{index}.json"), "w") as raw:
+                json.dump({"data": [
+                    {"name": f"item {index}"},
+                    {"description": f"item number {index}"},
+                    {"value": index},
+                    {"weight": index / 3},
+                    {"tags": ["common", "tool"]},
+                ]}, raw)
+
+        for extension in FORMATS[1:]:
+            convert_raws(join(root, "json"), join(root, extension), extension)
+        pack_raws(join(root, "json"), join(root, "mod.sqlite"))
+
+        for extension in FORMATS:
+            folder = join(root, extension)
+            measure(extension, parse_all, folder, folder_size(folder))
+        measure("sqlite", parse_packed, join(root, "mod.sqlite"),
+                os.path.getsize(join(root, "mod.sqlite")))
+
+
+if __name__ == "__main__":
+    main()
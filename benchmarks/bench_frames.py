@@ -0,0 +1,80 @@
+'''Compare building a pandas data frame from the instances of a model, and
+instances from a data frame, with a loop over each instance against
+:meth:`~panda_core_data.model.Model.to_frame` and
+:meth:`~panda_core_data.model.Model.from_frame`.
+
+Usage::
+
+    python benchmarks/bench_frames.py [instances]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import sys
+import time
+
+import pandas
+
+from panda_core_data import DataCore
+from panda_core_data.model import Model
+
+DataCore(name="naive", validate=False)
+DataCore(name="bulk", validate=False)
+
+
+class NaiveItems(Model, data_name="items", core_name="naive"):
+    name: str
+    description: str
+    value: int
+    weight: float
+
+
+class BulkItems(Model, data_name="items", core_name="bulk"):
+    name: str
+    description: str
+    value: int
+    weight: float
+
+
+def measure(label: str, function) -> float:
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f"{label:32} {elapsed * 1000:10.2f} ms")
+    return elapsed
+
+
+def naive_from_frame(frame: pandas.DataFrame):
+    for row in frame.itertuples(index=False):
+        NaiveItems(*row)
+
+
+def naive_to_frame() -> pandas.DataFrame:
+    return pandas.DataFrame([dict(instance.items())
+                             for instance in NaiveItems.all_instances])
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    frame = pandas.DataFrame({
+        "name": [f"item {index}" for index in range(count)],
+        "description": [f"item number {index}" for index in range(count)],
+        "value": range(count),
+        "weight": [index / 3 for index in range(count)],
+    })
+
+    measure("from frame, instance loop", lambda: naive_from_frame(frame))
+    measure("from_frame", lambda: BulkItems.from_frame(frame, update=False))
+    assert len(NaiveItems.wrapper.instances) == count
+    assert len(BulkItems.wrapper.instances) == count
+
+    measure("to frame, instance loop", naive_to_frame)
+    measure("to_frame", BulkItems.to_frame)
+    measure("to_frame, cached columns", BulkItems.to_frame)
+    measure("to_frame, arrow", lambda: BulkItems.to_frame(backend="arrow"))
+
+    frame["value"] *= 2
+    measure("from_frame, update by name", lambda: BulkItems.from_frame(frame))
+
+
+if __name__ == "__main__":
+    main()
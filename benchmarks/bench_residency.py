@@ -0,0 +1,82 @@
+'''Compare the memory used by the instances of a model loaded from raws with
+all of them in memory, against
+:meth:`~panda_core_data.model.Model.limit_residency`, and the time to read
+them with a skewed access pattern, where most reads are of a few instances.
+
+Usage::
+
+    python benchmarks/bench_residency.py [raws] [resident] [reads]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import gc
+import json
+from os.path import join
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import List
+
+from panda_core_data import DataCore
+from panda_core_data.model import Model
+
+data_core = DataCore(name="residency", validate=False)
+
+
+class Items(Model, data_name="items", core_name="residency"):
+    name: str
+    description: str
+    weights: List[float]
+
+
+def read_skewed(instances: list, reads: int) -> float:
+    random.seed(1)
+    hot = instances[:len(instances) // 20]
+    total = 0.0
+    for _ in range(reads):
+        chosen = random.choice(hot if random.random() < 0.9 else instances)
+        total += chosen.weights[0]
+    return total
+
+
+def measure(label: str, instances: list, reads: int):
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    read_skewed(instances, reads)
+    elapsed = time.perf_counter() - start
+    print(f"{label:24} {memory / 2 ** 20:8.1f} MiB {elapsed * 1000:10.2f} ms")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    resident = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    reads = int(sys.argv[3]) if len(sys.argv) > 3 else 100000
+
+    with tempfile.TemporaryDirectory() as root:
+        folder = join(root, "items")
+        os.makedirs(folder)
+        for index in range(count):
+            with open(join(folder, f"item_{index}.json"), "w") as raw:
+                json.dump({"data": [{"name": f"item {index}"},
+                                    {"description": "lorem ipsum " * 100},
+                                    {"weights": [index / 3] * 200}]}, raw)
+
+        tracemalloc.start()
+        data_core.recursively_instance_model(root)
+        instances = Items.wrapper.snapshot()
+        measure("all in memory", instances, reads)
+
+        residency = Items.limit_residency(max_instances=resident)
+        measure(f"at most {resident} resident", instances, reads)
+        print(f"{residency.hits} hits, {residency.misses} misses, "
+              f"{residency.evictions} evictions")
+        residency.close()
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+'''Compare searching the name and description of all instances with a
+substring scan, against the inverted index of
+:meth:`~panda_core_data.model.Model.search`. Building the index is compared
+with restoring it from the cache file saved after loading.
+
+Usage::
+
+    python benchmarks/bench_search.py [instances] [queries]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from os.path import join
+import random
+import sys
+import tempfile
+import time
+
+from panda_core_data import DataCore
+from panda_core_data.model import Model
+from panda_core_data.search import search_index
+
+DataCore(name="search", validate=False)
+
+random.seed(0)
+WORDS = ["".join(random.choices("abcdefghijklmnopqrstuvwxyz",
+                                k=random.randrange(4, 10)))
+         for _ in range(5000)]
+
+
+class Items(Model, data_name="items", core_name="search",
+            search_fields=("name", "description")):
+    name: str
+    description: str
+
+
+def scan_queries(queries: list) -> int:
+    found = 0
+    for query in queries:
+        found += len([item for item in Items.all_instances
+                      if query in item.name.lower() or
+                      query in item.description.lower()])
+    return found
+
+
+def index_queries(queries: list) -> int:
+    return sum(len(Items.search(query)) for query in queries)
+
+
+def index_pages(queries: list) -> int:
+    return sum(len(Items.search(query, limit=20)) for query in queries)
+
+
+def measure(label: str, function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:24} {elapsed * 1000:10.2f} ms")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    query_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    random.seed(0)
+    Items.from_frame({
+        "name": [f"{random.choice(WORDS)} {random.choice(WORDS)} {index}"
+                 for index in range(count)],
+        "description": [" ".join(random.choices(WORDS, k=8))
+                        for _ in range(count)]}, update=False)
+    queries = [random.choice(WORDS)[:4] for _ in range(query_count)]
+    index = search_index(Items)
+
+    measure("build index", index.build)
+    with tempfile.TemporaryDirectory() as cache_folder:
+        path = join(cache_folder, "items.search.pickle")
+        index.save(path, "fingerprint")
+        assert measure("restore index", index.restore, path, "fingerprint")
+
+    scanned = measure("substring scan", scan_queries, queries)
+    searched = measure("search index", index_queries, queries)
+    measure("search first 20", index_pages, queries)
+    print(f"{scanned} instances found by the scan, {searched} by the index")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+'''Compare how long a :mod:`multiprocessing` worker takes to get the data of
+a mod by loading the raws again and by attaching to a core exported with
+:meth:`~panda_core_data.DataCore.export_shared`.
+
+Usage::
+
+    python benchmarks/bench_shared_core.py [raws]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import json
+from multiprocessing import get_context
+from os import makedirs
+from os.path import join
+import sys
+import tempfile
+import time
+
+MODEL = """from panda_core_data.model import Model
+
+class Items(Model, data_name="items"):
+    name: str
+    description: str
+    value: int
+"""
+
+
+def create_mod(root: str, raw_count: int) -> str:
+    "Create a mods folder with `raw_count` json raws"
+    mods_folder = join(root, "mods")
+    raws_folder = join(mods_folder, "core", "raws", "models", "items")
+    makedirs(raws_folder)
+    makedirs(join(mods_folder, "core", "models"))
+
+    with open(join(mods_folder, "core", "models", "items.py"), "w") as model:
+        model.write(MODEL)
+
+    for index in range(raw_count):
+        with open(join(raws_folder, f"{index}.json"), "w") as raw:
+            json.dump({"data": [{"name": f"item {index}"},
+                                {"description": f"item number {index}"},
+                                {"value": index}]}, raw)
+    return mods_folder
+
+
+def load_worker(mods_folder: str) -> float:
+    from panda_core_data import data_core
+
+    start = time.perf_counter()
+    data_core(mods_folder, templates_folder=False)
+    elapsed = time.perf_counter() - start
+    assert len(data_core.get_model_type("items").wrapper.instances)
+    return elapsed
+
+
+def attach_worker(segment_name: str) -> float:
+    from panda_core_data.shared_core import attach_shared_core
+
+    start = time.perf_counter()
+    attached = attach_shared_core(segment_name)
+    elapsed = time.perf_counter() - start
+    assert len(attached.get_model_type("items"))
+    attached.close()
+    return elapsed
+
+
+def main():
+    raw_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    context = get_context("spawn")
+
+    with tempfile.TemporaryDirectory() as root:
+        mods_folder = create_mod(root, raw_count)
+
+        with context.Pool(1) as pool:
+            load_time = pool.apply(load_worker, (mods_folder,))
+
+        from panda_core_data import data_core
+        data_core(mods_folder, templates_folder=False)
+
+        with data_core.export_shared() as exported:
+            with context.Pool(1) as pool:
+                attach_time = pool.apply(attach_worker, (exported.name,))
+            size = exported.segment.size
+
+    print(f"{raw_count} raws, segment of {size / 1024 / 1024:.1f} MiB")
+    print(f"load raws in worker:   {load_time * 1000:10.2f} ms")
+    print(f"attach shared memory:  {attach_time * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
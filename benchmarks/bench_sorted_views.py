@@ -0,0 +1,65 @@
+'''Compare getting the first page of a leaderboard after each change to an
+instance by sorting all instances, against a view of
+:meth:`~panda_core_data.model.Model.order_by` which is kept sorted.
+
+Usage::
+
+    python benchmarks/bench_sorted_views.py [instances] [requests]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import random
+import sys
+import time
+
+from panda_core_data import DataCore
+from panda_core_data.model import Model
+
+DataCore(name="sorted_views", validate=False)
+
+
+class Items(Model, data_name="items", core_name="sorted_views"):
+    name: str
+    value: int
+
+
+def naive_requests(requests: int, instances: list):
+    for request in range(requests):
+        instances[request % len(instances)].value = -request
+        sorted(Items.all_instances, key=lambda item: item.value,
+               reverse=True)[:20]
+
+
+def view_requests(requests: int, instances: list):
+    view = Items.order_by("value", descending=True)
+    for request in range(requests):
+        instances[request % len(instances)].value = request
+        view.page(0, 20)
+
+
+def measure(label: str, function, *args):
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:24} {elapsed * 1000:10.2f} ms")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    random.seed(0)
+    Items.from_frame({"name": [f"item {index}" for index in range(count)],
+                      "value": [random.randrange(count)
+                                for _ in range(count)]}, update=False)
+    instances = list(Items.all_instances)
+    random.shuffle(instances)
+
+    measure("sort on each request", naive_requests, requests, instances)
+    measure("first order_by", Items.order_by("value", descending=True).page,
+            0, 20)
+    measure("order_by view", view_requests, requests, instances)
+
+
+if __name__ == "__main__":
+    main()
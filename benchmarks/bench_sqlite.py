@@ -0,0 +1,88 @@
+'''Compare loading a folder with a json raw per instance against the same raws
+packed into a single SQLite file with
+:func:`~panda_core_data.storages.sqlite_db.pack_raws`.
+
+Usage::
+
+    python benchmarks/bench_sqlite.py [raws]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import json
+from os import makedirs
+from os.path import join
+import sys
+import tempfile
+import time
+
+from panda_core_data import DataCore
+from panda_core_data.model import Model
+from panda_core_data.storages.sqlite_db import pack_raws
+
+DataCore(name="files", validate=False)
+DataCore(name="packed", validate=False)
+
+
+class FileItems(Model, data_name="items", core_name="files"):
+    name: str
+    description: str
+    value: int
+    weight: float
+
+
+class PackedItems(Model, data_name="items", core_name="packed"):
+    name: str
+    description: str
+    value: int
+    weight: float
+
+
+def measure(label: str, function) -> float:
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f"{label:32} {elapsed * 1000:10.2f} ms")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    with tempfile.TemporaryDirectory() as root:
+        files_dir = join(root, "files")
+        items_dir = join(files_dir, "items")
+        packed_dir = join(root, "packed")
+        makedirs(items_dir)
+        makedirs(packed_dir)
+        for index in range(count):
+            with open(join(items_dir, f"item_{index}.json"), "w") as raw:
+                json.dump({"data": [
+                    {"name": f"item {index}"},
+                    {"description": f"item number {index}"},
+                    {"value": index},
+                    {"weight": index / 3},
+                ]}, raw)
+
+        measure("pack_raws", lambda: pack_raws(
+            files_dir, join(packed_dir, "mod.sqlite")))
+        measure("load json files", lambda: FileItems.data_core.
+                recursively_instance_model(files_dir))
+        measure("load packed sqlite", lambda: PackedItems.data_core.
+                recursively_instance_model(packed_dir))
+        assert len(FileItems.wrapper.instances) == count
+        assert len(PackedItems.wrapper.instances) == count
+
+        items = list(PackedItems.all_instances)
+        storage = items[0]._storage.record_storage("items", "item_0")
+
+        def save_all():
+            with storage.batch():
+                for item in items:
+                    item.save_to_file()
+
+        measure("save all, one transaction", save_all)
+        storage.close()
+
+
+if __name__ == "__main__":
+    main()
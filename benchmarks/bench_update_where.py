@@ -0,0 +1,76 @@
+'''Compare changing and removing the instances that match a query with a
+loop over the instances, like it had to be done before, against
+:meth:`~panda_core_data.model.Model.update_where` and
+:meth:`~panda_core_data.model.Model.delete_where`, with a sorted view of the
+model kept up to date and the instances saved into a packed storage.
+
+Usage::
+
+    python benchmarks/bench_update_where.py [instances] [matches]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import os
+import sys
+import tempfile
+import time
+
+from tinydb import Query
+
+from panda_core_data import DataCore
+from panda_core_data.model import Model
+
+DataCore(name="update_where", validate=False)
+
+
+class Items(Model, data_name="items", core_name="update_where"):
+    name: str
+    value: int
+    rare: bool = False
+
+
+def loop_update(limit: int):
+    for item in Items.all_instances:
+        if item.value < limit:
+            item.rare = True
+            item.value += 1
+            item.save_to_file()
+
+
+def loop_delete(start: int, stop: int):
+    for item in tuple(Items.all_instances):
+        if start <= item.value < stop:
+            Items.wrapper.instances.remove(item)
+
+
+def measure(label: str, function, *args):
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:24} {elapsed * 1000:10.2f} ms")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    matches = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    with tempfile.TemporaryDirectory() as folder:
+        packed = os.path.join(folder, "items.sqlite")
+        Items.bulk_create([(f"item {index}", index) for index in range(count)],
+                          packed)
+        Items.order_by("value").page(0, 10)
+
+        measure("loop update and save", loop_update, matches)
+        measure("update_where save",
+                lambda: Items.update_where(Query().value < matches,
+                                           save=True, rare=True,
+                                           value=matches))
+        # the instances of each range weren't changed by the updates
+        measure("loop delete", loop_delete, matches + 1, matches * 2)
+        measure("delete_where",
+                lambda: Items.delete_where((Query().value >= matches * 2) &
+                                           (Query().value < matches * 3)))
+
+
+if __name__ == "__main__":
+    main()
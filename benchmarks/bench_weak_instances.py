@@ -0,0 +1,62 @@
+'''Compare the memory used after creating and dropping many instances at
+runtime, like a long running server does, with the default registry, which
+keeps every instance, against a model with `weak_instances=True`.
+
+Usage::
+
+    python benchmarks/bench_weak_instances.py [instances]
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import gc
+import sys
+import time
+import tracemalloc
+
+from panda_core_data import DataCore
+from panda_core_data.model import Model
+
+DataCore(name="weak_instances", validate=False)
+
+
+class StrongItems(Model, data_name="strong_items", core_name="weak_instances"):
+    name: str
+    value: int
+
+
+class WeakItems(Model, data_name="weak_items", core_name="weak_instances",
+                weak_instances=True):
+    name: str
+    value: int
+
+
+def churn(model: type, count: int):
+    for index in range(count):
+        instance = model(f"item {index}", index)
+        instance.value += 1
+
+
+def measure(label: str, model: type, count: int):
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    churn(model, count)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    print(f"{label:24} {elapsed * 1000:10.2f} ms "
+          f"{retained / 2 ** 20:8.2f} MiB retained "
+          f"{len(model.wrapper.instances):8} instances")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    tracemalloc.start()
+    measure("strong registry", StrongItems, count)
+    measure("weak registry", WeakItems, count)
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,9 @@ from os.path import join
 
 from argparse import ArgumentParser
 from panda_core_data import __version__
+from panda_core_data.custom_exceptions import PCDInvalidPath
+from panda_core_data.storages import convert_raws, is_packed_raw
+from panda_core_data.storages.sqlite_db import pack_raws
 
 __date__ = '2019-07-26'
 __updated__ = '2019-07-26'
@@ -68,12 +71,36 @@ def main(argv=None):
                         help="set raw extension. The available extensions are yaml and json "
                         "[default: %default]")
 
+    parser.add_argument("--convert", dest="convert", metavar="FOLDER",
+                        help="convert the raws inside the folder into another format, "
+                        "packed formats like sqlite write all raws into a single file and "
+                        "the sub folders are the models")
+    parser.add_argument("--into", dest="into", metavar="PATH",
+                        help="file, for packed formats, or folder the converted raws are "
+                        "written into")
+    parser.add_argument("--format", dest="format",
+                        help="extension of the converted raws, like sqlite, msgpack or cbor "
+                        "[default: sqlite]")
+
     # set defaults
-    parser.set_defaults(outfile=".", raw_extension="json")
+    parser.set_defaults(outfile=".", raw_extension="json", format="sqlite")
 
     # process options
     opts = parser.parse_args(argv)
 
+    if opts.convert:
+        if not opts.into:
+            parser.error("--convert needs --into")
+        if is_packed_raw(opts.format):
+            try:
+                written = pack_raws(opts.convert, opts.into)
+            except PCDInvalidPath as invalid_path:
+                parser.error(str(invalid_path))
+        else:
+            written = convert_raws(opts.convert, opts.into, opts.format)
+        print(f"{written} raws were converted into {opts.into}")
+        return
+
     if opts.outdir:
         if opts.raw_extension == "yaml":
             base_raw = BASE_JSON_RAW
@@ -1,16 +1,23 @@
 '''
 :author: Leandro (Cerberus1746) Benedet Garcia
 '''
+import gc
 from os.path import isdir, join
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional
 
 from .custom_exceptions import (PCDDataCoreIsNotUnique, PCDInvalidPathType,
-                                PCDTypeError, PCDInvalidPath)
+                                PCDTypeError, PCDInvalidPath,
+                                PCDValidationError, PCDReadOnly)
+from .derived import precompute_core
+from .reference_graph import ReferenceGraph
+from .references import ReferenceResolver
+from .search import build_search_indexes
 from .custom_typings import PathType, Union
 from .data_core_bases import BaseData
 from .data_core_bases import DataModel
 from .data_core_bases import DataTemplate
+from .data_core_bases.dependency_graph import DependencyGraph
 
 
 #pylint: disable=invalid-name
@@ -21,18 +28,31 @@ class DataCore(DataModel, DataTemplate):
     "Class where everything is kept."
 
     def __init__(self, *args, name: Optional[str] = None,
-                 replace: bool = False, **kwargs):
+                 replace: bool = False, validate: bool = True,
+                 cache_folder: Optional[PathType] = None, **kwargs):
         """Start a new instance for the DataCore
 
         :param str name: name of the core data instance
         :param excluded_extensions: extensions to be ignored
         :param replace: if instances of data_core of the same name should
                         be replaced
+        :param validate: if the raws should be validated against the field
+                         annotations while loading. Set it to False in
+                         production if the raws were already validated.
+        :param cache_folder: folder where the search indexes are saved after
+                             loading, so they aren't built again while the
+                             raws don't change
         :type excluded_extensions: List[str]"""
         from .storages import auto_convert_to_pathlib
         self.auto_convert_to_pathlib = auto_convert_to_pathlib
 
         self.folders = {}
+        self.validate_raws = validate
+        self.cache_folder = cache_folder
+        self.read_only = False
+        self.dependency_graph = DependencyGraph(self)
+        self.references = ReferenceResolver(self)
+        self.reference_graph = ReferenceGraph(self)
 
         DataModel.__init__(self)
         DataTemplate.__init__(self)
@@ -91,7 +111,19 @@ class DataCore(DataModel, DataTemplate):
                                      templates. Default is the
                                      'templates_folder' param
         :type raw_templates_folder: :class:`~pathlib.Path` or str or bool
-        :raise PCDInvalidPath: If any of the folders are invalid"""
+        :param validate: Overwrites the `validate` parameter of the core
+        :type validate: bool
+        :param cache_folder: Overwrites the `cache_folder` parameter of the
+                             core
+        :type cache_folder: :class:`~pathlib.Path` or str
+        :raise PCDInvalidPath: If any of the folders are invalid
+        :raise PCDValidationError: If any of the loaded raws are invalid
+        :raise PCDCircularDependency: If the dependencies have a cycle
+        :raise PCDDanglingReference: If a reference field points to an
+                                     instance that doesn't exist"""
+        if self.read_only:
+            raise PCDReadOnly(f"The data core {self.name} is read only")
+
         #=======================================================================
         # Extract params from kwarg
         #=======================================================================
@@ -103,6 +135,9 @@ class DataCore(DataModel, DataTemplate):
         self.excluded_extensions = kwargs.pop("excluded_extensions",
                                               self.excluded_extensions)
 
+        self.validate_raws = kwargs.pop("validate", self.validate_raws)
+        self.cache_folder = kwargs.pop("cache_folder", self.cache_folder)
+
         raw_models_folder = kwargs.pop("raw_models_folder", models_folder)
         raw_templates_folder = kwargs.pop("raw_templates_folder",
                                           templates_folder)
@@ -146,9 +181,119 @@ class DataCore(DataModel, DataTemplate):
 
         self.recursively_instance_model(self.get_folder("raw_models"))
 
-        for current_instance in self.all_model_instances:
-            if current_instance.has_dependencies:
-                current_instance.add_dependencies()
+        if self.validate_raws:
+            self.validate()
+
+        self.resolve_references()
+        self.dependency_graph.build()
+        build_search_indexes(self, self.cache_folder)
+        precompute_core(self)
+
+    def validate(self, raise_errors: bool = True) -> List[str]:
+        """Validate and coerce the fields of all instances against their
+        annotations, one type at a time.
+
+        :param raise_errors: if an exception should be raised when an
+                             invalid field is found
+        :return: list of all errors found
+        :raise PCDValidationError: If `raise_errors` is True and any of the
+                                   instances are invalid"""
+        from .validators import validate_instances
+
+        errors = []
+        for template_type in self.all_templates:
+            instanced = template_type.instanced()
+            if instanced:
+                errors.extend(validate_instances(template_type, [instanced]))
+
+        for model_type in self.all_models:
+            errors.extend(validate_instances(model_type,
+                                             model_type.all_instances))
+
+        if errors and raise_errors:
+            raise PCDValidationError(errors)
+        return errors
+
+    def resolve_references(self, raise_errors: bool = True) -> List[str]:
+        """Replace the keys in the :class:`~panda_core_data.references.Ref`
+        fields of all instances by the instances they point to. It's done
+        while loading the raws, call it again if instances with references
+        were created afterwards.
+
+        :param raise_errors: if an exception should be raised when a
+                             reference couldn't be found
+        :return: a message for each reference that couldn't be found
+        :raise PCDDanglingReference: If `raise_errors` is True and any
+                                     reference couldn't be found"""
+        return self.references.resolve(raise_errors)
+
+    def freeze(self, read_only: bool = False):
+        """Prepare the core to be shared with forked processes.
+
+        Everything that would otherwise be created on first use is created
+        now, the instance lists are compacted and then all objects tracked by
+        the garbage collector are moved to a permanent generation with
+        :func:`gc.freeze`. That way, processes forked after this call don't
+        write into the memory pages of the core when the garbage collector
+        runs, so those pages stay shared with the parent.
+
+        Reference counting still writes into the objects that a worker
+        actually uses.
+
+        :param read_only: If True, any attempt to change, create or remove
+                          instances or to load more raws raises
+                          :class:`~panda_core_data.custom_exceptions.PCDReadOnly`.
+                          It can't be undone."""
+        from .references import reference_fields
+        from .validators import get_validator
+        from .data_core_bases import GroupInstance
+
+        for data_type in self.dependency_graph.order:
+            get_validator(data_type)
+            reference_fields(data_type)
+            data_type.parents  # pylint: disable=pointless-statement
+
+            instances = data_type.wrapper.instances
+            if isinstance(instances, GroupInstance):
+                instances.compact()
+
+            if read_only:
+                # pylint: disable=protected-access
+                data_type._make_read_only()
+                if isinstance(instances, GroupInstance):
+                    instances.read_only = True
+
+        if read_only:
+            self.read_only = True
+
+        gc.collect()
+        gc.freeze()
+
+    def diff(self, other: "DataCore"
+             ) -> Iterator["panda_core_data.diff.PatchEntry"]:
+        """Compare the instances of this core, the old version, with the ones
+        of another core, the new version, see
+        :func:`~panda_core_data.diff.diff_cores`. Use
+        :func:`~panda_core_data.diff.write_patch` to write the entries.
+
+        :param other: the new version
+        :return: generator of the added, removed and changed instances"""
+        from .diff import diff_cores
+        return diff_cores(self, other)
+
+    def export_shared(self, name: Optional[str] = None
+                      ) -> 'panda_core_data.shared_core.SharedCoreExport':
+        """Export all instances of the core into shared memory, so
+        :mod:`multiprocessing` workers can read them with
+        :func:`~panda_core_data.shared_core.attach_shared_core` without
+        loading the raws.
+
+        :param name: name of the shared memory segment, a random one is used
+                     by default
+        :return: the handle of the segment, it must be unlinked once the
+                 workers are done"""
+        from .shared_core import export_shared_core
+        return export_shared_core(self, name)
 
     def get_folder(self, folder_type: str):
         try:
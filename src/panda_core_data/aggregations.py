@@ -0,0 +1,248 @@
+'''Aggregations of the fields of all instances of a model, optionally grouped
+by other fields. They are computed over the cached columns of
+:func:`~panda_core_data.frames.field_columns`, with numpy when it's installed,
+and cached until an instance of the model changes.
+
+.. code:: python
+
+    Items.aggregate(group_by="kind", total=("value", "sum"),
+                    n=("name", "count"))
+    # {"weapon": {"total": 120, "n": 4}, "armor": {"total": 80, "n": 2}}
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from itertools import count, repeat
+from operator import is_not
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .custom_exceptions import PCDKeyError, PCDTypeError
+from .frames import field_columns
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+AGGREGATIONS = ("sum", "mean", "min", "max", "count")
+"The supported aggregation functions"
+
+Aggregation = Tuple[str, str]
+
+
+NumericColumn = Tuple["numpy.ndarray", Optional["numpy.ndarray"]]
+
+
+def _numeric_array(column: List[Any]) -> Optional[NumericColumn]:
+    """The column as a numeric array and which of it's values are present,
+    None if they all are. Missing values are masked instead of becoming NaN,
+    so columns of integers keep an integer dtype. Returns None if the column
+    isn't numeric or doesn't fit into a numeric dtype, like integers over 64
+    bits."""
+    present = None
+    values = column
+    if None in column:
+        present = numpy.fromiter(map(is_not, column, repeat(None)),
+                                 dtype=bool, count=len(column))
+        values = [value for value in column if value is not None]
+    try:
+        array = numpy.asarray(values)
+    except (TypeError, ValueError):
+        return None
+    if array.ndim != 1 or array.dtype.kind not in "biuf":
+        return None
+    if array.dtype.kind == "b":
+        array = array.astype(numpy.int64)
+    if present is not None:
+        full = numpy.zeros(len(column), dtype=array.dtype)
+        full[present] = array
+        array = full
+    return array, present
+
+
+def _reduce_numpy(function: str, column: List[Any],
+                  numeric: Optional[NumericColumn], inverse: "numpy.ndarray",
+                  group_count: int) -> Optional[List[Any]]:
+    """Aggregate the column for each group, returns None if the column isn't
+    numeric"""
+    if function == "count":
+        if None in column:
+            present = numpy.fromiter(map(is_not, column, repeat(None)),
+                                     dtype=bool, count=len(column))
+            inverse = inverse[present]
+        return numpy.bincount(inverse, minlength=group_count).tolist()
+
+    if numeric is None:
+        return None
+    values, present = numeric
+    if present is not None:
+        values = values[present]
+        inverse = inverse[present]
+
+    counts = numpy.bincount(inverse, minlength=group_count)
+    if function in ("sum", "mean"):
+        if values.dtype.kind == "f":
+            sums = numpy.bincount(inverse, weights=values,
+                                  minlength=group_count)
+        else:
+            # bincount only sums floats, which would round big integers
+            sums = numpy.zeros(group_count, dtype=values.dtype)
+            numpy.add.at(sums, inverse, values)
+        if function == "sum":
+            return sums.tolist()
+        return [total / count if count else None
+                for total, count in zip(sums.tolist(), counts.tolist())]
+
+    reducer = numpy.minimum if function == "min" else numpy.maximum
+    order = numpy.argsort(inverse, kind="stable")
+    sorted_inverse = inverse[order]
+    starts = numpy.flatnonzero(numpy.r_[True, sorted_inverse[1:] !=
+                                        sorted_inverse[:-1]]) if len(order) \
+        else numpy.array([], dtype=numpy.intp)
+    results: List[Any] = [None] * group_count
+    if len(starts):
+        reduced = reducer.reduceat(values[order], starts).tolist()
+        for group, value in zip(sorted_inverse[starts].tolist(), reduced):
+            results[group] = value
+    return results
+
+
+def _reduce_python(function: str, column: List[Any], inverse: Sequence[int],
+                   group_count: int) -> List[Any]:
+    buckets: List[List[Any]] = [[] for _ in range(group_count)]
+    for group, value in zip(inverse, column):
+        if value is not None:
+            buckets[group].append(value)
+
+    if function == "count":
+        return [len(bucket) for bucket in buckets]
+    if function == "sum":
+        return [sum(bucket) for bucket in buckets]
+    if function == "mean":
+        return [sum(bucket) / len(bucket) if bucket else None
+                for bucket in buckets]
+    reducer = min if function == "min" else max
+    return [reducer(bucket) if bucket else None for bucket in buckets]
+
+
+def _check_aggregations(data_type: type,
+                        aggregations: Dict[str, Aggregation]):
+    # pylint: disable=protected-access
+    for name, aggregation in aggregations.items():
+        if not isinstance(aggregation, tuple) or len(aggregation) != 2:
+            raise PCDTypeError(f"The aggregation {name} must be a tuple of a "
+                               "field name and a function name")
+        field_name, function = aggregation
+        if field_name not in data_type._field_index:
+            raise PCDKeyError(field_name)
+        if function not in AGGREGATIONS:
+            raise PCDTypeError(f"The function {function} of {name} is not "
+                               f"supported, use one of {AGGREGATIONS}")
+
+
+def _unhashable_field(columns: Dict[str, Any],
+                      group_fields: Tuple[str, ...]) -> str:
+    "The first field the instances are grouped by with an unhashable value"
+    for field_name in group_fields:
+        try:
+            dict.fromkeys(columns[field_name])
+        except TypeError:
+            return field_name
+    return ", ".join(group_fields)
+
+
+def aggregate(data_type: type,
+              group_by: Union[str, Sequence[str], None] = None,
+              **aggregations: Aggregation) -> Dict[Any, Any]:
+    """Aggregate the fields of all instances of the type. Missing values are
+    ignored, like in SQL. The result is cached until the
+    :attr:`~panda_core_data.data_core_bases.base_data.GroupWrapper.version` of
+    the type changes, so it must not be changed.
+
+    :param data_type: the type of the instances
+    :param group_by: field, or fields, the instances are grouped by. With
+                     many fields the groups are tuples of their values
+    :param aggregations: the name of each result and a tuple of the field
+                         name and the function, which is `sum`, `mean`,
+                         `min`, `max` or `count`
+    :return: the name and value of each result or, with `group_by`, a
+             dictionary of them for each group, in the order the groups were
+             first seen
+    :raise PCDKeyError: If any of the fields doesn't exist
+    :raise PCDTypeError: If any of the aggregations is invalid or a value of
+                         the `group_by` fields can't be hashed, like a list"""
+    # pylint: disable=protected-access
+    if group_by is None:
+        group_fields: Tuple[str, ...] = ()
+    elif isinstance(group_by, str):
+        group_fields = (group_by,)
+    else:
+        group_fields = tuple(group_by)
+    for field_name in group_fields:
+        if field_name not in data_type._field_index:
+            raise PCDKeyError(field_name)
+    _check_aggregations(data_type, aggregations)
+
+    cache = data_type.__dict__.get("_aggregate_cache")
+    if cache is None:
+        cache = {}
+        data_type._aggregate_cache = cache
+    cache_key = (group_by if isinstance(group_by, str) else group_fields,
+                 tuple(sorted(aggregations.items())))
+    version = data_type.wrapper.version
+    cached = cache.get(cache_key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    field_names = dict.fromkeys(group_fields)
+    field_names.update((field_name, None) for field_name, _
+                       in aggregations.values())
+    columns = field_columns(data_type, field_names)
+    row_count = len(next(iter(columns.values()), ()))
+
+    index: Dict[Any, int] = {}
+    if group_fields:
+        if isinstance(group_by, str):
+            keys = columns[group_by]
+        else:
+            keys = list(zip(*(columns[field_name]
+                              for field_name in group_fields)))
+        try:
+            index = dict(zip(dict.fromkeys(keys), count()))
+        except TypeError as unhashable:
+            field_name = _unhashable_field(columns, group_fields)
+            raise PCDTypeError(f"The instances of {data_type.__name__} can't "
+                               f"be grouped by {field_name}, it's values "
+                               "must be hashable") from unhashable
+        inverse: Any = map(index.__getitem__, keys)
+    else:
+        inverse = repeat(0, row_count)
+    group_count = len(index) if group_fields else 1
+
+    if numpy is not None:
+        inverse = numpy.fromiter(inverse, dtype=numpy.intp, count=row_count)
+    else:
+        inverse = list(inverse)
+
+    results = {}
+    arrays: Dict[str, Any] = {}
+    for name, (field_name, function) in aggregations.items():
+        column = columns[field_name]
+        values = None
+        if numpy is not None:
+            if function != "count" and field_name not in arrays:
+                arrays[field_name] = _numeric_array(column)
+            values = _reduce_numpy(function, column, arrays.get(field_name),
+                                   inverse, group_count)
+        if values is None:
+            values = _reduce_python(function, column, inverse, group_count)
+        results[name] = values
+
+    if group_fields:
+        result = {group: {name: values[position]
+                          for name, values in results.items()}
+                  for group, position in index.items()}
+    else:
+        result = {name: values[0] for name, values in results.items()}
+
+    cache[cache_key] = (version, result)
+    return result
@@ -0,0 +1,332 @@
+'''Creation, change and removal of many instances of a model at once,
+optionally writing their raws.
+
+.. code:: python
+
+    from tinydb import Query
+
+    Items.bulk_create([{"name": "sword", "value": 10}, ("axe", 12)])
+    Items.bulk_create(records, path="mod/items.sqlite")  # one packed file
+    Items.bulk_create(records, path="mod/models/items", extension="msgpack")
+
+    Items.update_where(Query().value > 10, save=True, rare=True)
+    Items.delete_where(lambda item: item.name.startswith("old"))
+
+The instances are checked before anything is changed and the wrapper of the
+model is changed once, so the views of the model are updated once and the
+raws are written together. Raws that already exist are never replaced
+unless `overwrite=True` is passed to :func:`bulk_create`.
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from contextlib import ExitStack
+from itertools import count
+from operator import attrgetter
+from pathlib import Path
+from typing import (Any, Callable, Dict, Iterable, List, Optional, Sequence,
+                    Union)
+
+from .custom_exceptions import (PCDInvalidRaw, PCDKeyError, PCDReadOnly,
+                                PCDTypeError)
+from .custom_typings import PathType
+from .derived import discard_derived
+from .references import dereferenced_items
+from .storages import get_extension, get_storage_from_extension, is_packed_raw
+from .utils import paused_gc
+from .validators import check_rows
+
+Record = Union[Dict[str, Any], Sequence[Any]]
+
+Query = Callable[[Any], bool]
+"""A :class:`tinydb.queries.Query` or any function that receives an instance
+and returns if it matches, TinyDB queries read the fields through the
+mapping methods of the instances"""
+
+
+def _check_writable(data_type: type):
+    if data_type.wrapper.read_only:
+        raise PCDReadOnly(f"The instances of {data_type.data_name} are read "
+                          "only")
+
+
+def _build_instances(data_type: type, records: Iterable[Record]
+                     ) -> List[Any]:
+    "Create the instances without adding them into the wrapper"
+    # pylint: disable=protected-access
+    field_count = len(data_type._field_names)
+    fast_init = data_type._fast_init
+    positional_init = data_type._positional_init
+    new = object.__new__
+    instances: List[Any] = []
+    append = instances.append
+    try:
+        for record in records:
+            instance = new(data_type)
+            if record.__class__ is dict:
+                fast_init(instance, record)
+            elif len(record) > field_count:
+                raise PCDTypeError(
+                    f"Row {len(instances)} has {len(record)} values but "
+                    f"{data_type.data_name} only has {field_count} fields")
+            else:
+                positional_init(instance, record)
+            append(instance)
+    except PCDInvalidRaw as invalid_raw:
+        raise PCDInvalidRaw(f"{invalid_raw} in the row {len(instances)}"
+                            ) from invalid_raw
+    return instances
+
+
+def _raw_names(data_type: type, instances: List[Any]) -> List[str]:
+    "The names of the raws of the instances, which are their keys"
+    # pylint: disable=protected-access
+    key_field = data_type.key_field
+    if key_field not in data_type._field_index:
+        raise PCDKeyError(key_field)
+
+    names = [str(instance.__dict__[key_field]) for instance in instances]
+    if len(set(names)) != len(names):
+        raise PCDInvalidRaw(f"The {key_field} of the instances must be "
+                            "unique to write their raws")
+    return names
+
+
+def _existing_raws(names: Iterable[str]) -> PCDInvalidRaw:
+    names = sorted(names)
+    shown = ", ".join(names[:5]) + (", ..." if len(names) > 5 else "")
+    return PCDInvalidRaw(f"{len(names)} raws already exist: {shown}, pass "
+                         "overwrite=True to replace them")
+
+
+def _write_packed(data_type: type, instances: List[Any], path: Path,
+                  overwrite: bool):
+    "Write all raws into a packed storage with a single transaction"
+    # pylint: disable=protected-access
+    names = _raw_names(data_type, instances)
+    storage = get_storage_from_extension(get_extension(path))(path)
+    try:
+        if not overwrite:
+            existing = storage.record_names(data_type.data_name)
+            existing.intersection_update(names)
+            if existing:
+                raise _existing_raws(existing)
+        storage.write_records(data_type.data_name, (
+            (name, dict(dereferenced_items(instance)))
+            for name, instance in zip(names, instances)))
+        for name, instance in zip(names, instances):
+            instance._attach_storage(storage.record_storage(
+                data_type.data_name, name))
+    finally:
+        storage.close()
+
+
+def _write_raws(data_type: type, instances: List[Any], folder: Path,
+                extension: str, overwrite: bool):
+    "Write a raw for each instance inside the folder"
+    # pylint: disable=protected-access
+    names = _raw_names(data_type, instances)
+    storage_class = get_storage_from_extension(
+        get_extension(Path(f"raw.{extension}")))
+    if getattr(storage_class, "packed", False):
+        raise PCDTypeError(f"The extension {extension} is of a packed "
+                           "storage, pass the path of the file instead")
+
+    raw_files = [folder / f"{name}.{extension}" for name in names]
+    if not overwrite:
+        existing = [raw_file.name for raw_file in raw_files
+                    if raw_file.exists()]
+        if existing:
+            raise _existing_raws(existing)
+
+    folder.mkdir(parents=True, exist_ok=True)
+    for raw_file, instance in zip(raw_files, instances):
+        # a new storage reads the file, it must not have an older raw
+        raw_file.write_bytes(b"")
+        # the storage is kept open, like the storages of loaded raws
+        storage = storage_class(raw_file)
+        storage.write({instance.DEFAULT_TABLE: [
+            {field_name: value} for field_name, value
+            in dereferenced_items(instance)]})
+        instance._attach_storage(storage)
+        data_type.raws.append(raw_file)
+
+
+def bulk_create(data_type: type, records: Iterable[Record],
+                path: Optional[PathType] = None, extension: str = "json",
+                overwrite: bool = False) -> List[Any]:
+    """Create an instance of the type for each record. The records are
+    dictionaries of fields or tuples of values in the order of the fields,
+    missing fields use their defaults. All instances are checked first and
+    then added at once, so nothing is added if any record is invalid.
+
+    With `path` the raw of each instance is written as well, named after
+    it's `key_field`. If the path is a packed storage, like a `.sqlite` file,
+    all raws are written into it with a single transaction, otherwise it's a
+    folder and a raw with the extension is written for each instance. Raws
+    that already exist are only replaced with `overwrite`.
+
+    :param data_type: the type of the instances
+    :param records: the fields of each instance
+    :param path: the packed storage or folder the raws are written into
+    :param extension: the extension of the raws written into a folder, with
+                      the compression one for compressed raws
+    :param overwrite: if raws that already exist are replaced
+    :return: the instances, in the order of the records
+    :raise PCDReadOnly: If the instances of the type are read only
+    :raise PCDTypeError: If a tuple has more values than fields
+    :raise PCDInvalidRaw: If a record lacks a required field or, when the
+                          raws are written, the keys aren't unique or any
+                          raw exists without `overwrite`
+    :raise PCDValidationError: If the core validates raws and any record is
+                               invalid
+    :raise PCDDanglingReference: If a reference field points to an instance
+                                 that doesn't exist"""
+    # pylint: disable=protected-access
+    _check_writable(data_type)
+    with paused_gc():
+        instances = _build_instances(data_type, records)
+    check_rows(data_type, zip(count(), instances,
+                              map(attrgetter("__dict__"), instances)),
+               "the records")
+
+    if path is not None:
+        path = Path(path)
+        if is_packed_raw(path):
+            _write_packed(data_type, instances, path, overwrite)
+            data_type.raws.append(path)
+        else:
+            _write_raws(data_type, instances, path, extension, overwrite)
+
+    data_type._register_instances(instances)
+    if hasattr(data_type, "__post_init__"):
+        for instance in instances:
+            instance.__post_init__()
+    return instances
+
+
+def _matching(data_type: type, query: Query) -> List[Any]:
+    return [instance for instance in data_type.wrapper.snapshot()
+            if query(instance)]
+
+
+def save_raws(instances: Iterable[Any]) -> int:
+    """Write the raws of the instances loaded from raws, the raws inside the
+    same packed storage are written with a single transaction
+
+    :param instances: the instances, the ones without a raw are ignored
+    :return: how many raws were written"""
+    # pylint: disable=protected-access
+    saved = 0
+    with ExitStack() as stack:
+        batched = set()
+        for instance in instances:
+            storage = instance.__dict__.get("_storage")
+            if storage is None:
+                continue
+            if getattr(storage, "packed", False) and \
+                    storage.path not in batched:
+                # the storage of the instance is closed when it's saved, so
+                # the batch uses another one
+                packed = type(storage)(storage.path)
+                stack.callback(packed.close)
+                stack.enter_context(packed.batch())
+                batched.add(storage.path)
+            instance.save_to_file()
+            saved += 1
+    return saved
+
+
+def update_where(data_type: type, query: Query, save: bool = False,
+                 **changes: Any) -> List[Any]:
+    """Change the fields of all instances of the type that match the query.
+    Like :meth:`~panda_core_data.data_type.DataType.update`, each instance
+    gets a new field table, but all of them are checked first and the
+    wrapper of the type is changed once.
+
+    :param data_type: the type of the instances
+    :param query: selects the changed instances, see :data:`Query`
+    :param save: if the raws of the changed instances are written, see
+                 :func:`save_raws`
+    :param changes: the new value of each changed field
+    :return: the changed instances
+    :raise PCDKeyError: If any of the changes isn't a field
+    :raise PCDReadOnly: If the instances of the type are read only
+    :raise PCDValidationError: If the core validates raws and any changed
+                               instance is invalid
+    :raise PCDDanglingReference: If a reference field points to an instance
+                                 that doesn't exist"""
+    # pylint: disable=protected-access
+    for key in changes:
+        if key not in data_type._field_index:
+            raise PCDKeyError(key)
+
+    wrapper = data_type.wrapper
+    with wrapper.lock:
+        _check_writable(data_type)
+        matched = _matching(data_type, query)
+        field_tables = []
+        for instance in matched:
+            field_table = dict(instance.__dict__)
+            field_table.update(changes)
+            # copies of the field table have the cached derived values
+            discard_derived(field_table)
+            field_tables.append(field_table)
+        check_rows(data_type, zip(count(), matched, field_tables),
+                   "the changed instances")
+
+        for instance, field_table in zip(matched, field_tables):
+            object.__setattr__(instance, "__dict__", field_table)
+        if matched:
+            wrapper.changed((), (), matched, tuple(changes))
+
+        if save:
+            save_raws(matched)
+    return matched
+
+
+def _delete_raws(instances: List[Any]):
+    "Delete the raws of the instances, with one transaction per packed file"
+    packed: Dict[Any, Dict[str, List[str]]] = {}
+    for instance in instances:
+        storage = instance.__dict__.get("_storage")
+        if storage is None:
+            continue
+        storage.close()
+        if getattr(storage, "packed", False):
+            packed.setdefault((type(storage), storage.path), {}).setdefault(
+                storage.model, []).append(storage.name)
+        else:
+            try:
+                storage.path.unlink()
+            except FileNotFoundError:
+                pass
+
+    for (storage_class, path), models in packed.items():
+        storage = storage_class(path)
+        try:
+            for model, names in models.items():
+                storage.delete_records(model, names)
+        finally:
+            storage.close()
+
+
+def delete_where(data_type: type, query: Query, delete_raws: bool = False
+                 ) -> List[Any]:
+    """Remove all instances of the type that match the query with a single
+    change of it's wrapper, see
+    :meth:`~panda_core_data.data_core_bases.base_data.GroupInstance.remove_many`
+
+    :param data_type: the type of the instances
+    :param query: selects the removed instances, see :data:`Query`
+    :param delete_raws: if the raws of the removed instances are deleted as
+                        well, the raws inside the same packed storage are
+                        deleted with a single transaction
+    :return: the removed instances
+    :raise PCDReadOnly: If the instances of the type are read only"""
+    with data_type.wrapper.lock:
+        _check_writable(data_type)
+        matched = _matching(data_type, query)
+        data_type.wrapper.instances.remove_many(matched)
+        if delete_raws:
+            _delete_raws(matched)
+    return matched
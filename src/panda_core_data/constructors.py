@@ -0,0 +1,218 @@
+'''Generation of the specialized constructors used to build
+:class:`~panda_core_data.data_type.DataType` instances from raws.
+
+Just like :mod:`dataclasses` does with the `__init__` method, the source of
+the constructor is generated once per class and compiled with :func:`exec`, so
+loading a raw is a single straight-line function instead of a loop of
+:func:`setattr` calls.
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from dataclasses import fields, MISSING
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .custom_exceptions import PCDInvalidRaw
+
+
+def _coerce_int(value: Any) -> Any:
+    """Convert `value` to :class:`int` if it can be done without losing
+    information, otherwise `value` is returned untouched.
+
+    :param value: value read from the raw
+    :return: the coerced value"""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _coerce_float(value: Any) -> Any:
+    """Convert `value` to :class:`float` if it can be done without losing
+    information, otherwise `value` is returned untouched.
+
+    :param value: value read from the raw
+    :return: the coerced value"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _coerce_str(value: Any) -> Any:
+    """Convert numbers to :class:`str`, anything else is returned untouched.
+
+    :param value: value read from the raw
+    :return: the coerced value"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+COERCERS: Dict[type, Callable[[Any], Any]] = {
+    int: _coerce_int,
+    float: _coerce_float,
+    str: _coerce_str,
+}
+"Types that the generated constructors coerce, together with their coercer"
+
+
+def merge_records(table_data: Optional[Dict[int, Dict[str, Any]]]
+                  ) -> Dict[str, Any]:
+    """Merge the documents of a raw table into a single record.
+
+    Raws are usually written as a list of dictionaries with one field each,
+    this transforms them into a single dictionary that can be passed to the
+    generated constructor.
+
+    :param table_data: the table as returned by the storage `read` method
+    :return: dictionary containing all fields of the raw"""
+    record = {}
+    if table_data:
+        for document in table_data.values():
+            record.update(document)
+    return record
+
+
+def _missing_field(data_type: type, field_name: str) -> PCDInvalidRaw:
+    return PCDInvalidRaw(f"The raw for '{data_type.__name__}' is missing the "
+                         f"field '{field_name}'")
+
+
+def _set_extra_fields(instance: Any, record: Dict[str, Any],
+                      field_names: frozenset):
+    """Keys in the raw that aren't fields are kept as plain attributes, that's
+    how raws were always loaded."""
+    instance_dict = instance.__dict__
+    for key, value in record.items():
+        if key not in field_names:
+            instance_dict[key] = value
+
+
+def _coercion(field: Any, index: int, namespace: Dict[str, Any]) -> List[str]:
+    "The lines that coerce `value` if the type of the field has a coercer"
+    coercer = COERCERS.get(field.type)
+    if coercer is None:
+        return []
+    namespace[f"_coerce_{index}"] = coercer
+    return [f"    if value.__class__ is not {field.type.__name__}:\n"
+            f"        value = _coerce_{index}(value)"]
+
+
+def build_fast_init(data_type: type) -> Callable[[Any, Dict[str, Any]], None]:
+    """Generate the constructor that assigns all fields of a raw record into
+    an already created instance of `data_type`.
+
+    The generated function applies the dataclass defaults and default
+    factories, coerces values of :class:`int`, :class:`float` and
+    :class:`str` fields (see :data:`COERCERS`) and raises
+    :class:`~panda_core_data.custom_exceptions.PCDInvalidRaw` if a required
+    field is missing.
+
+    :param data_type: a class already processed as a dataclass
+    :return: method with the signature `(self, record)`"""
+    namespace: Dict[str, Any] = {
+        "_data_type": data_type,
+        "_missing_field": _missing_field,
+        "_set_extra_fields": _set_extra_fields,
+    }
+    all_fields = fields(data_type)
+    namespace["_field_names"] = frozenset(field.name for field in all_fields)
+
+    body = ["    self_dict = self.__dict__"]
+    for index, field in enumerate(all_fields):
+        name = repr(field.name)
+        dflt = f"_dflt_{index}"
+
+        if field.default is not MISSING:
+            namespace[dflt] = field.default
+            body.append(f"    value = record.get({name}, {dflt})")
+        elif field.default_factory is not MISSING:
+            namespace[dflt] = field.default_factory
+            body.append(f"    value = record[{name}] if {name} in record "
+                        f"else {dflt}()")
+        elif field.init:
+            body.append(f"    try:\n"
+                        f"        value = record[{name}]\n"
+                        f"    except KeyError:\n"
+                        f"        raise _missing_field(_data_type, {name}) "
+                        f"from None")
+        else:
+            # Same as the dataclass __init__, fields that aren't in the init
+            # and without defaults are left unset.
+            body.append(f"    if {name} in record:\n"
+                        f"        self_dict[{name}] = record[{name}]")
+            continue
+
+        body.extend(_coercion(field, index, namespace))
+        body.append(f"    self_dict[{name}] = value")
+
+    body.append("    if not _field_names.issuperset(record):\n"
+                "        _set_extra_fields(self, record, _field_names)")
+
+    source = "def __pcd_fast_init__(self, record):\n" + "\n".join(body)
+    # pylint: disable=exec-used
+    exec(source, namespace)
+
+    fast_init = namespace["__pcd_fast_init__"]
+    fast_init.__qualname__ = f"{data_type.__qualname__}._fast_init"
+    return fast_init
+
+
+def build_positional_init(data_type: type
+                          ) -> Callable[[Any, Sequence[Any]], None]:
+    """Generate the constructor that assigns the values of a row, in the
+    order of the fields, into an already created instance of `data_type`.
+
+    Like :func:`build_fast_init`, missing trailing values use the defaults,
+    values are coerced and a missing required field raises
+    :class:`~panda_core_data.custom_exceptions.PCDInvalidRaw`. Rows with more
+    values than fields must be rejected by the caller.
+
+    :param data_type: a class already processed as a dataclass
+    :return: method with the signature `(self, row)`"""
+    namespace: Dict[str, Any] = {
+        "_data_type": data_type,
+        "_missing_field": _missing_field,
+    }
+
+    body = ["    self_dict = self.__dict__",
+            "    length = len(row)"]
+    for index, field in enumerate(fields(data_type)):
+        name = repr(field.name)
+        dflt = f"_dflt_{index}"
+
+        if field.default is not MISSING:
+            namespace[dflt] = field.default
+            body.append(f"    value = row[{index}] if length > {index} "
+                        f"else {dflt}")
+        elif field.default_factory is not MISSING:
+            namespace[dflt] = field.default_factory
+            body.append(f"    value = row[{index}] if length > {index} "
+                        f"else {dflt}()")
+        elif field.init:
+            body.append(f"    if length <= {index}:\n"
+                        f"        raise _missing_field(_data_type, {name})\n"
+                        f"    value = row[{index}]")
+        else:
+            body.append(f"    if length > {index}:\n"
+                        f"        self_dict[{name}] = row[{index}]")
+            continue
+
+        body.extend(_coercion(field, index, namespace))
+        body.append(f"    self_dict[{name}] = value")
+
+    source = "def __pcd_positional_init__(self, row):\n" + "\n".join(body)
+    # pylint: disable=exec-used
+    exec(source, namespace)
+
+    positional_init = namespace["__pcd_positional_init__"]
+    positional_init.__qualname__ = f"{data_type.__qualname__}._positional_init"
+    return positional_init
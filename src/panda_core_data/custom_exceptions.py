@@ -55,9 +55,32 @@ class PCDInvalidPathType(KeyError, PCDException):
 class PCDKeyError(KeyError, PCDException):
     "Same as :class:`KeyError`, but with :class:`PCDException`"
 
+class PCDReadOnly(PCDException):
+    "Exception raised if something tries to change a read only data core"
+
+
+class PCDCircularDependency(PCDTypeError):
+    "Exception raised if the dependencies of the data types have a cycle"
+
+
 class PCDInvalidBaseData(PCDTypeError):
     "Exception raised if a base doesn't have a method"
 
 
 class PCDRawFileNotSupported(PCDTypeError):
     "Exception raised if the package can't read the extension"
+
+
+class PCDValidationError(PCDTypeError):
+    """Exception raised if the fields of one or more instances don't match
+    their annotations. All errors found are in the `errors` attribute"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__("The following fields are invalid:\n" +
+                         "\n".join(errors))
+
+
+class PCDDanglingReference(PCDValidationError):
+    """Exception raised if a reference field points to an instance that
+    doesn't exist. All dangling references are in the `errors` attribute"""
@@ -1,3 +1,4 @@
 from .data_model import DataModel
 from .data_template import DataTemplate
-from .base_data import BaseData, GroupWrapper
+from .base_data import (BaseData, GroupWrapper, GroupInstance,
+                        WeakGroupInstance)
@@ -1,19 +1,32 @@
 ''':created: 2019-07-22
 
 :author: Leandro (Cerberus1746) Benedet Garcia'''
+from collections.abc import Sequence
 from dataclasses import dataclass
 from glob import iglob
 from importlib import import_module
+from itertools import count, groupby, islice
+from operator import itemgetter
 from os.path import join
 import sys
+from threading import RLock
 from types import ModuleType
-from typing import Optional, Dict, List, Callable, Union
+from typing import (Any, Optional, Dict, List, Callable, Union, Iterator,
+                    Iterable, Tuple)
+from weakref import ref
 
 from ..custom_exceptions import (PCDTypeError, PCDInvalidBaseData,
-                                 PCDFolderIsEmpty, PCDDuplicatedModuleName)
+                                 PCDFolderIsEmpty, PCDDuplicatedModuleName,
+                                 PCDReadOnly, PCDInvalidRaw)
 from ..custom_typings import PathType
 from ..data_type import DataType
-from ..storages import auto_convert_to_pathlib
+from ..storages import (auto_convert_to_pathlib, get_extension,
+                        get_storage_from_extension, scan_folder)
+from ..utils import paused_gc
+
+# how many removals the kept positions of the instances can be behind of
+# before they are computed again
+_MAX_SHIFTED = 64
 
 
 @dataclass(repr=False)
@@ -23,20 +36,426 @@ class Group(dict):
     group_name: str
 
 
-@dataclass(repr=False)
-class GroupInstance(list):
-    "Class that is used to store Instances"
-    data_type: DataType
+class GroupInstance(Sequence):
+    """Class that is used to store Instances, it's a sequence that compares
+    equal to a list of the same instances and has the methods of lists that
+    find, add or remove instances.
+
+    Readers never take a lock, each read works on a snapshot, which is a
+    tuple of the backing list and how many items of it are visible. The
+    backing list is only ever appended to, so the visible part of a snapshot
+    never changes. Writers serialize through `lock` and publish a new snapshot
+    with a single assignment, removals copy the backing list before changing
+    it, just like RCU does.
+
+    Once an instance is removed or replaced the position of each instance is
+    kept, so they are found without searching the whole list.
+
+    :param data_type: The type of the instances
+    :param lock: The lock writers must hold, if not supplied a new one is
+                 created"""
+
+    def __init__(self, data_type: DataType, lock: Optional[RLock] = None):
+        self.data_type = data_type
+        self.lock = lock or RLock()
+        self.read_only = False
+        self._items: List[DataType] = []
+        self._snapshot: Tuple[List[DataType], int] = (self._items, 0)
+        # the id of each instance and it's position, which removals moved
+        # back by `_shifted` positions at most
+        self._positions: Optional[Dict[int, int]] = None
+        self._shifted = 0
+
+    # readers ------------------------------------------------------------------
+    def __iter__(self) -> Iterator[DataType]:
+        items, visible = self._snapshot
+        return islice(items, visible)
+
+    def __reversed__(self) -> Iterator[DataType]:
+        return reversed(self.snapshot())
+
+    def __len__(self) -> int:
+        return self._snapshot[1]
+
+    def __getitem__(self, index: Union[int, slice]
+                    ) -> Union[DataType, List[DataType]]:
+        items, visible = self._snapshot
+        if index.__class__ is slice:
+            return items[:visible][index]
+        if index < 0:
+            index += visible
+        if not 0 <= index < visible:
+            raise IndexError("GroupInstance index out of range")
+        return items[index]
+
+    def __contains__(self, instance: DataType) -> bool:
+        return any(current is instance for current in self)
+
+    def __bool__(self) -> bool:
+        return self._snapshot[1] > 0
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, GroupInstance):
+            other = list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.snapshot())
+
+    def index(self, value: DataType, start: int = 0,
+              stop: int = sys.maxsize) -> int:
+        """Position of the first instance equal to `value`, like
+        :meth:`list.index`
+
+        :raise ValueError: If no instance is equal to it"""
+        return self.snapshot().index(value, start, stop)
+
+    def count(self, value: DataType) -> int:
+        "How many instances are equal to `value`, like :meth:`list.count`"
+        return self.snapshot().count(value)
+
+    def snapshot(self) -> Tuple[DataType, ...]:
+        """Get all the instances that are currently stored
+
+        :return: tuple containing the instances"""
+        return tuple(self)
+
+    # writers ------------------------------------------------------------------
+    def _check_writable(self):
+        if self.read_only:
+            raise PCDReadOnly(f"The instances of {self.data_type.data_name} "
+                              "are read only")
+
+    def _publish(self, items: List[DataType],
+                 added: Optional[Iterable[DataType]] = None,
+                 removed: Optional[Iterable[DataType]] = None):
+        self._items = items
+        self._snapshot = (items, len(items))
+        if added is None and removed is None:
+            self.data_type.wrapper.changed()
+        else:
+            self.data_type.wrapper.changed(added or (), removed or (), ())
+
+    def _index(self, instance: DataType) -> int:
+        # instances are dataclasses that compare their fields, so they must be
+        # found by identity
+        items = self._items
+        load = self._load
+        positions = self._positions
+        if positions is None or self._shifted > _MAX_SHIFTED:
+            positions = dict(zip(map(id, map(load, items)), count()))
+            self._positions = positions
+            self._shifted = 0
+        position = positions.get(id(instance))
+        if position is not None:
+            for index in range(min(position, len(items) - 1),
+                               max(position - self._shifted, 0) - 1, -1):
+                if load(items[index]) is instance:
+                    return index
+        raise ValueError(f"{instance!r} is not in the instances")
+
+    def _store(self, instance: DataType) -> Any:
+        "What is kept in the backing list for the instance"
+        return instance
+
+    @staticmethod
+    def _load(item: Any) -> Optional[DataType]:
+        "The instance of an item of the backing list"
+        return item
+
+    def append(self, instance: DataType):
+        "Add a new instance"
+        with self.lock:
+            self._check_writable()
+            self._items.append(self._store(instance))
+            if self._positions is not None:
+                self._positions[id(instance)] = len(self._items) - 1
+            self._publish(self._items, added=(instance,))
+
+    def extend(self, instances: Iterable[DataType]):
+        "Add all instances, which are published at once"
+        with self.lock:
+            self._check_writable()
+            instances = tuple(instances)
+            if self._positions is not None:
+                self._positions.update(zip(map(id, instances),
+                                           count(len(self._items))))
+            self._items.extend(map(self._store, instances))
+            self._publish(self._items, added=instances)
+
+    def remove(self, instance: DataType):
+        """Remove the instance, the backing list is copied, so use
+        :meth:`remove_many` to remove many instances at once
+
+        :raise ValueError: If the instance isn't stored"""
+        with self.lock:
+            self._check_writable()
+            index = self._index(instance)
+            items = list(self._items)
+            del items[index]
+            del self._positions[id(instance)]
+            self._shifted += 1
+            self._publish(items, removed=(instance,))
+
+    def pop(self, index: int = -1) -> DataType:
+        """Remove the instance at the position and return it, see
+        :meth:`remove`
+
+        :raise IndexError: If there's no instance at the position"""
+        with self.lock:
+            instance = self[index]
+            self.remove(instance)
+            return instance
+
+    def insert(self, index: int, instance: DataType):
+        "Add a new instance before the position, like :meth:`list.insert`"
+        with self.lock:
+            self._check_writable()
+            current = self.snapshot()
+            if index < 0:
+                index = max(index + len(current), 0)
+            if index >= len(current):
+                self.append(instance)
+                return
+            position = self._index(current[index])
+            items = list(self._items)
+            items.insert(position, self._store(instance))
+            # the instances after it moved forward
+            self._positions = None
+            self._publish(items, added=(instance,))
+
+    def remove_many(self, instances: Iterable[DataType]) -> int:
+        """Remove all the instances with a single copy of the backing list,
+        instances that aren't stored are ignored
+
+        :return: how many instances were removed"""
+        with self.lock:
+            self._check_writable()
+            # kept alive, so their ids aren't reused meanwhile
+            instances = tuple(instances)
+            removed_ids = set(map(id, instances))
+            items = []
+            removed = []
+            for item in self._items:
+                instance = self._load(item)
+                if id(instance) in removed_ids:
+                    removed.append(instance)
+                else:
+                    items.append(item)
+            if removed:
+                self._positions = None
+                self._publish(items, removed=removed)
+            return len(removed)
+
+    def replace(self, old: DataType, new: DataType):
+        """Replace the instance `old` by `new` keeping it's position
+
+        :raise ValueError: If `old` isn't stored"""
+        with self.lock:
+            self._check_writable()
+            index = self._index(old)
+            items = list(self._items)
+            items[index] = self._store(new)
+            del self._positions[id(old)]
+            self._positions[id(new)] = index
+            self._publish(items, added=(new,), removed=(old,))
+
+    def clear(self):
+        "Remove all instances"
+        with self.lock:
+            self._check_writable()
+            self._positions = None
+            self._publish([])
+
+    def compact(self):
+        """Copy the instances into a list without any spare capacity, the
+        list used for appending usually allocates more than it needs"""
+        with self.lock:
+            items = list(self._items)
+            self._items = items
+            self._snapshot = (items, len(items))
+
+
+class WeakGroupInstance(GroupInstance):
+    """Same as :class:`GroupInstance`, except that instances that weren't
+    loaded from a raw are kept through weak references. Once nothing else
+    references them they are skipped by readers and removed by the next
+    writers, so instances created and dropped at runtime don't accumulate.
+
+    Sorted views and search indexes keep the instances they hold alive, so
+    they can't be used with it. The
+    :class:`~panda_core_data.reference_graph.ReferenceGraph` keeps the
+    instances that have references alive while it's used.
+
+    :param data_type: The type of the instances
+    :param lock: The lock writers must hold, if not supplied a new one is
+                 created"""
+
+    def __init__(self, data_type: DataType, lock: Optional[RLock] = None):
+        super().__init__(data_type, lock)
+        self._collected = 0
+
+    def _store(self, instance: DataType) -> Any:
+        if instance.__dict__.get("_storage") is not None:
+            return instance
+        return ref(instance, self._on_collected)
+
+    @staticmethod
+    def _load(item: Any) -> Optional[DataType]:
+        return item() if item.__class__ is ref else item
+
+    def _on_collected(self, _):
+        """Called by the garbage collector, which might be in any thread,
+        even one holding the lock, so it only marks the caches of the type
+        as stale, without the lock"""
+        # pylint: disable=protected-access
+        # a lost increment only delays the removal of the references
+        self._collected += 1
+        self.data_type.wrapper._new_version()
+
+    # readers ------------------------------------------------------------------
+    def __iter__(self) -> Iterator[DataType]:
+        items, visible = self._snapshot
+        for item in islice(items, visible):
+            if item.__class__ is ref:
+                item = item()
+                if item is None:
+                    continue
+            yield item
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __getitem__(self, index: Union[int, slice]
+                    ) -> Union[DataType, List[DataType]]:
+        if index.__class__ is slice:
+            return list(self.snapshot()[index])
+        try:
+            return self.snapshot()[index]
+        except IndexError:
+            raise IndexError("GroupInstance index out of range") from None
+
+    def __bool__(self) -> bool:
+        return any(True for _ in self)
+
+    # writers ------------------------------------------------------------------
+    def _live_items(self) -> List[Any]:
+        return [item for item in self._items
+                if item.__class__ is not ref or item() is not None]
+
+    def _publish(self, items: List[Any],
+                 added: Optional[Iterable[DataType]] = None,
+                 removed: Optional[Iterable[DataType]] = None):
+        # the collected references are removed once they are half the list
+        if self._collected * 2 > len(items):
+            self._collected = 0
+            self._positions = None
+            items = self._live_items()
+        super()._publish(items, added, removed)
+
+    def compact(self):
+        with self.lock:
+            self._collected = 0
+            self._positions = None
+            items = self._live_items()
+            self._items = items
+            self._snapshot = (items, len(items))
 
 
 @dataclass(repr=False)
 class GroupWrapper():
-    "Class that is used to store Models or Templates"
+    """Class that is used to store Models or Templates
+
+    `lock` is held by everything that writes into the instances of the type,
+    readers don't use it. `version` changes every time an instance is added,
+    removed or changed, so anything computed from the instances can be cached
+    until it changes. Things that are kept up to date instead, like
+    :class:`~panda_core_data.sorted_views.SortedView`, add a function into
+    `listeners` and are cached in `views`. With `weak` the instances that
+    weren't loaded from raws are kept by a :class:`WeakGroupInstance`.
+
+    Setting a field of an instance only changes `version` and calls the
+    listeners once something read `version` or `listeners`, see
+    :meth:`track_writes`, until then field writes are plain attribute
+    writes."""
     data_type: DataType
     instances: Optional[GroupInstance] = None
+    weak: bool = False
 
     def __post_init__(self):
-        self.instances = GroupInstance(self.data_type)
+        self.lock = RLock()
+        self.read_only = False
+        self.tracking_writes = False
+        # next() is atomic, so concurrent changes always get new versions
+        self._versions = count(1)
+        self._version = 0
+        instances_class = WeakGroupInstance if self.weak else GroupInstance
+        self.instances = instances_class(self.data_type, self.lock)
+        self._listeners: List[Callable] = []
+        self.views: Dict[Any, Any] = {}
+
+    @property
+    def version(self) -> int:
+        "Changes every time an instance is added, removed or changed"
+        if not self.tracking_writes:
+            self.track_writes()
+        return self._version
+
+    @property
+    def listeners(self) -> List[Callable]:
+        """Functions called by :meth:`changed`, with the instances that were
+        added, removed and updated and the changed fields"""
+        if not self.tracking_writes:
+            self.track_writes()
+        return self._listeners
+
+    def track_writes(self):
+        """Make field writes of the instances change `version` and call the
+        listeners. Until then, the instances of models without derived fields
+        use the plain `object.__setattr__`, since nothing was computed from
+        their fields yet. It can't be undone."""
+        with self.lock:
+            self.tracking_writes = True
+            data_type = self.data_type
+            # read only types and types with their own __setattr__ keep them
+            if data_type.__dict__.get("__setattr__") is object.__setattr__:
+                data_type.__setattr__ = DataType.__setattr__
+
+    def _new_version(self):
+        self._version = next(self._versions)
+
+    def changed(self, added: Optional[Iterable[DataType]] = None,
+                removed: Optional[Iterable[DataType]] = None,
+                updated: Optional[Iterable[DataType]] = None,
+                fields: Optional[Tuple[str, ...]] = None):
+        """Mark the instances of the type as changed. Each function in
+        `listeners` is called with the instances that were added, removed and
+        which fields were changed, and the names of the changed fields. If
+        none of the instances are supplied anything might have changed and
+        they are all None.
+
+        :param added: the new instances
+        :param removed: the removed instances
+        :param updated: the instances whose fields changed
+        :param fields: the fields that changed in the updated instances, None
+                       if any of them might have changed"""
+        self._new_version()
+        if self._listeners:
+            for listener in tuple(self._listeners):
+                listener(added, removed, updated, fields)
+
+    def snapshot(self) -> Tuple[DataType, ...]:
+        """Get all instances of the type, templates have at most one
+
+        :return: tuple containing the instances"""
+        instances = self.instances
+        if isinstance(instances, GroupInstance):
+            return instances.snapshot()
+        return (instances,)
 
     def __repr__(self) -> str:
         type_name = self.data_type.data_name
@@ -96,8 +515,7 @@ class BaseData():
 
     @staticmethod
     def folder_contents(path: 'panda_core_data.PathType'):
-        root_data = auto_convert_to_pathlib(path)
-        contents = list(root_data.iterdir())
+        contents = scan_folder(path)
 
         if not any(contents):
             raise PCDFolderIsEmpty(f"The folder {path} is empty")
@@ -177,6 +595,56 @@ class BaseData():
 
         return instanced
 
+    @staticmethod
+    def instance_packed(path: PathType, get_data_type: Callable,
+                        data_name: Optional[str] = None, **kwargs
+                        ) -> List[DataType]:
+        """Create the instances of all raws inside a packed storage, like
+        :class:`~panda_core_data.storages.sqlite_db.SqliteDB`. The raws are
+        read with a single query and the instances of each type are added at
+        once.
+
+        :param path: path to the packed raw file
+        :param get_data_type: function that gets the type by it's name
+        :param data_name: only create instances of this type, by default the
+                          type of each raw is the model name written with it
+        :return: The instanced :class:`~panda_core_data.model.DataType`
+        :raise PCDInvalidRaw: If any of the raws is invalid"""
+        path = auto_convert_to_pathlib(path)
+        storage = get_storage_from_extension(get_extension(path))(path)
+        try:
+            records = storage.read_records(data_name)
+        finally:
+            storage.close()
+
+        instanced = []
+        for model_name, rows in groupby(records, itemgetter(0)):
+            data_type = get_data_type(model_name, **kwargs)
+            created = []
+            with paused_gc():
+                for _, raw_name, record in rows:
+                    instance = object.__new__(data_type)
+                    # pylint: disable=protected-access
+                    try:
+                        instance._fast_init(record)
+                    except PCDInvalidRaw as invalid_raw:
+                        raise PCDInvalidRaw(
+                            f"{invalid_raw} in the raw {raw_name} of the file "
+                            f"{path}") from invalid_raw
+                    instance._attach_storage(storage.record_storage(
+                        model_name, raw_name))
+                    created.append(instance)
+
+            # pylint: disable=protected-access
+            data_type._register_instances(created)
+            if hasattr(data_type, "__post_init__"):
+                for instance in created:
+                    instance.__post_init__()
+            data_type.raws.append(path)
+            instanced.extend(created)
+
+        return instanced
+
     @staticmethod
     def recursively_instance_data() -> List[DataType]:
         """Instance :class:`~panda_core_data.model.DataType` recursively based on
@@ -2,14 +2,17 @@
 :created: 2019-07-22
 :author: Leandro (Cerberus1746) Benedet Garcia
 '''
-from typing import Iterator, Tuple
+import os
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
 
 #pylint: disable=unused-import
 import panda_core_data.model
 
 from ..custom_exceptions import PCDInvalidPathType
 from ..custom_typings import PathType
-from ..storages import is_excluded_extension, raw_glob_iterator
+from ..storages import (auto_convert_to_pathlib, is_excluded_extension,
+                        is_packed_raw, iter_raw_files)
+from ..streaming import iter_detached
 from .base_data import BaseData, Group
 
 
@@ -47,20 +50,68 @@ class DataModel(BaseData):
                        ) -> 'panda_core_data.model.Model':
         return self.get_data_type(model_name, self.all_model_types, **kwargs)
 
+    def iter_models(self, path: PathType,
+                    model: Union[str, type, None] = None, workers: int = 0,
+                    where: Optional[Callable[[Any], bool]] = None,
+                    validate: Optional[bool] = None, recursive: bool = True
+                    ) -> Iterator['panda_core_data.model.Model']:
+        """Read the raws inside the path one at a time, yielding model
+        instances that aren't added into the core, so the memory used doesn't
+        depend on how many raws there are.
+
+        :param path: folder with the raws of `model` or, if no model is
+                     supplied, with a sub folder of raws for each model, like
+                     :meth:`recursively_instance_model`
+        :param model: the model, or it's name, of the raws
+        :param workers: how many threads read the raws, see
+                        :func:`~panda_core_data.streaming.iter_detached`
+        :param where: only instances for which it returns True are yielded
+        :param validate: if the fields should be validated and coerced, the
+                         default is the `validate` parameter of the core
+        :param recursive: if the raws inside sub folders should be read too
+        :yield Model: the instances
+        :raise PCDTypeError: If the model doesn't exist"""
+        if validate is None:
+            validate = getattr(self, "validate_raws", False)
+
+        if model is None:
+            path = auto_convert_to_pathlib(path)
+            with os.scandir(path) as entries:
+                folders = sorted(entry.name for entry in entries
+                                 if entry.is_dir())
+            for folder in folders:
+                yield from self.iter_models(path / folder, folder, workers,
+                                            where, validate, recursive)
+            return
+
+        if isinstance(model, str):
+            model = self.get_model_type(model)
+
+        raw_files = iter_raw_files(path, self.excluded_extensions, recursive)
+        yield from iter_detached(model, raw_files, workers, where, validate)
+
     def recursively_instance_model(self, path: PathType, *args, **kwargs
-                                   ) -> Iterator['panda_core_data.model.Model']:
+                                   ) -> List['panda_core_data.model.Model']:
         instaced_models = []
         for model_path in self.folder_contents(path):
-            is_excluded = is_excluded_extension(model_path,
-                                                self.excluded_extensions)
-            if model_path.is_file() and not is_excluded:
+            if model_path.is_file():
+                if is_excluded_extension(model_path, self.excluded_extensions):
+                    continue
+                if is_packed_raw(model_path):
+                    instaced_models.extend(self.instance_packed(
+                        model_path, self.get_model_type, **kwargs))
+                    continue
                 raise PCDInvalidPathType(f"The path '{model_path}' must be a "
                                          "folder and needs to  have a model "
                                          "name.")
 
-            for raw_file in raw_glob_iterator(model_path,
-                                              self.excluded_extensions):
-                instaced_models.append(self.instance_model(model_path.stem,
-                                                           raw_file, *args,
-                                                           **kwargs))
-            return instaced_models
+            for raw_file in iter_raw_files(model_path,
+                                           self.excluded_extensions):
+                if is_packed_raw(raw_file):
+                    instaced_models.extend(self.instance_packed(
+                        raw_file, self.get_model_type, model_path.stem,
+                        **kwargs))
+                else:
+                    instaced_models.append(self.instance_model(
+                        model_path.stem, raw_file, *args, **kwargs))
+        return instaced_models
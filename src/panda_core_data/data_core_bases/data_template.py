@@ -2,14 +2,13 @@
 :created: 2019-07-22
 :author: Leandro (Cerberus1746) Benedet Garcia
 '''
-from pathlib import Path
 from typing import Tuple, Iterator, List
 
 # pylint: disable=unused-import
 import panda_core_data.model
 
 from ..custom_typings import PathType
-from ..storages import raw_glob_iterator
+from ..storages import get_raw_name, is_packed_raw, raw_glob_iterator
 from .base_data import BaseData, Group
 
 
@@ -57,7 +56,12 @@ class DataTemplate(BaseData):
             **kwargs) -> List['panda_core_data.model.Template']:
         instanced_data = []
         for raw_file in raw_glob_iterator(path, self.excluded_extensions):
-            raw_data_name = Path(raw_file).stem
+            if is_packed_raw(raw_file):
+                instanced_data.extend(self.instance_packed(
+                    raw_file, self.get_template_type, **kwargs))
+                continue
+
+            raw_data_name = get_raw_name(raw_file)
             instanced = self.instance_template(
                 raw_data_name, raw_file, *args, **kwargs)
             instanced_data.append(instanced)
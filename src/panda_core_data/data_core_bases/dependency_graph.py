@@ -0,0 +1,119 @@
+'''Dependency graph between the data types of a
+:class:`~panda_core_data.DataCore`
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from ..custom_exceptions import PCDCircularDependency
+
+
+class DependencyGraph():
+    """Graph of the `dependencies` of all models and templates of a core.
+
+    It's built once, the first time it's needed, in topological order, so the
+    transitive dependencies of each type are computed only once. The `parents`
+    of a type, which map the name of each template it depends on, directly or
+    not, to the template instance, are resolved once per type and shared by
+    all it's instances.
+
+    :param data_core: the core which the graph belongs to"""
+
+    def __init__(self, data_core: "panda_core_data.DataCore"):
+        self.data_core = data_core
+        self._order: Optional[Tuple[type, ...]] = None
+        self._closures: Dict[type, Tuple[type, ...]] = {}
+        self._parents: Dict[type, Mapping[str, "DataType"]] = {}
+
+    def invalidate(self):
+        "Discard the graph, it's built again when needed"
+        self._order = None
+        self._closures = {}
+        self._parents = {}
+
+    def invalidate_parents(self):
+        "Discard the resolved parents, used when a template is instanced"
+        self._parents = {}
+
+    def _direct_dependencies(self, data_type: type) -> List[type]:
+        return [self.data_core.get_template_type(dependency_name)
+                for dependency_name in data_type.dependencies]
+
+    def build(self) -> Tuple[type, ...]:
+        """Sort all types of the core so every type comes after it's
+        dependencies and compute their transitive dependencies.
+
+        :return: the types in topological order
+        :raise PCDCircularDependency: If a type depends on itself, directly or
+                                      not"""
+        if self._order is not None:
+            return self._order
+
+        order = []
+        closures = {}
+        in_progress = set()
+
+        for root in self.data_core.all_templates + self.data_core.all_models:
+            if root in closures:
+                continue
+
+            in_progress.add(root)
+            stack = [(root, iter(self._direct_dependencies(root)))]
+            while stack:
+                data_type, pending = stack[-1]
+                dependency = next(pending, None)
+
+                if dependency is None:
+                    stack.pop()
+                    in_progress.discard(data_type)
+
+                    closure = {}
+                    for direct in self._direct_dependencies(data_type):
+                        closure[direct] = None
+                        closure.update(dict.fromkeys(closures[direct]))
+                    closures[data_type] = tuple(closure)
+                    order.append(data_type)
+
+                elif dependency in in_progress:
+                    cycle = [current for current, _ in stack]
+                    cycle = cycle[cycle.index(dependency):] + [dependency]
+                    raise PCDCircularDependency(
+                        "Circular dependency found: " +
+                        " -> ".join(current.data_name for current in cycle))
+
+                elif dependency not in closures:
+                    in_progress.add(dependency)
+                    stack.append((dependency, iter(
+                        self._direct_dependencies(dependency))))
+
+        self._order = tuple(order)
+        self._closures = closures
+        return self._order
+
+    @property
+    def order(self) -> Tuple[type, ...]:
+        "All types of the core, each one after it's dependencies"
+        return self.build()
+
+    def closure(self, data_type: type) -> Tuple[type, ...]:
+        """All templates the type depends on, directly or not
+
+        :param data_type: a type of the core
+        :return: the templates, the direct dependencies come first"""
+        self.build()
+        return self._closures.get(data_type, ())
+
+    def parents_of(self, data_type: type) -> Mapping[str, "DataType"]:
+        """Get the instances of all templates the type depends on
+
+        :param data_type: a type of the core
+        :return: a read only mapping of template names to their instances"""
+        parents = self._parents.get(data_type)
+        if parents is None:
+            parents = MappingProxyType({
+                dependency.data_name: dependency.instanced()
+                for dependency in self.closure(data_type)})
+            self._parents[data_type] = parents
+        return parents
@@ -4,7 +4,10 @@
 :author: Leandro (Cerberus1746) Benedet Garcia'''
 from dataclasses import dataclass, _process_class, fields
 from inspect import signature
-from typing import Any, Optional, Dict, Union, List
+from pathlib import Path
+from types import MappingProxyType
+from typing import (Any, Callable, Optional, Dict, FrozenSet, Iterator, List,
+                    Mapping, Sequence, Tuple, Union)
 
 from tinydb import TinyDB
 from tinydb.queries import Query
@@ -12,34 +15,62 @@ from tinydb.queries import Query
 # pylint: disable=unused-import
 import panda_core_data
 
+from .constructors import (build_fast_init, build_positional_init,
+                           merge_records)
 from .custom_exceptions import (PCDDuplicatedTypeName, PCDTypeError,
-                                PCDNeedsToBeInherited, PCDKeyError)
+                                PCDNeedsToBeInherited, PCDKeyError,
+                                PCDInvalidRaw, PCDValidationError,
+                                PCDReadOnly, PCDDanglingReference)
 from .custom_typings import PathType
+from .derived import DerivedField, discard_derived, invalidate_derived
+from .references import dereferenced_items, reference_fields
+from .search import search_index
 from .storages import (auto_convert_to_pathlib, get_storage_from_extension,
                        get_extension)
 from .utils import check_if_valid_instance
 
 
+class DependencyParents():
+    """Descriptor of :attr:`DataType.parents`. The parents are resolved by the
+    :class:`~panda_core_data.data_core_bases.dependency_graph.DependencyGraph`
+    of the core, once per type, and shared by all instances."""
+    empty: Mapping[str, "DataType"] = MappingProxyType({})
+
+    def __get__(self, instance: Optional["DataType"], owner: type
+                ) -> Mapping[str, "DataType"]:
+        graph = getattr(getattr(owner, "data_core", None), "dependency_graph",
+                        None)
+        if graph is None or "wrapper" not in owner.__dict__:
+            return self.empty
+        return graph.parents_of(owner)
+
+
 class DataType(TinyDB):
     """Base for all the model types, be it template or model
 
     Internally it uses the TinyDB database"""
-    __weakref__ = ("_current_index", "_keys_cache")
 
     DEFAULT_TABLE: str = 'data'
-    parents: Dict[str, "DataType"] = {}
+    parents: Mapping[str, "DataType"] = DependencyParents()
     query: Query = Query()
     raws: list = []
 
     data_name: str = "DataType"
+    key_field: str = "name"
+    search_fields: Tuple[str, ...] = ()
 
     dependencies: List[str]
+    _fast_init: Callable[["DataType", Dict[str, Any]], None]
+    _positional_init: Callable[["DataType", Sequence[Any]], None]
     data_group: "Group"
     data_core: "DataCore"
     wrapper: "GroupWrapper"
 
-    _current_index: int = -1
-    _keys_cache: List[str] = []
+    _field_names: Tuple[str, ...] = ()
+    _field_index: Dict[str, int] = {}
+    _removed_fields: FrozenSet[str] = frozenset()
+    _derived_fields: Dict[str, "DerivedField"] = {}
+    _residency: Optional["ResidencyManager"] = None
 
     def __new__(cls, *_, db_file: Optional[PathType] = None, **__):
         """Method that handles the instancing of the models and templates, this
@@ -62,7 +93,22 @@ class DataType(TinyDB):
         raise AttributeError(f"type object '{type(self).__name__}' has no "
                              f"attribute '{attr_name}'")
 
-    __setattr__ = object.__setattr__
+    def __setattr__(self, attr_name: str, value: Any):
+        """Same as the default, which was overwritten by TinyDB, but changing
+        a field also marks the instances of the type as changed. Types whose
+        writes aren't tracked use `object.__setattr__` instead, see
+        :meth:`~panda_core_data.data_core_bases.base_data.GroupWrapper.track_writes`"""
+        if attr_name in self._derived_fields:
+            raise PCDTypeError(f"The derived field {attr_name} can't be set")
+        field_table = self.__dict__
+        # fields set for the first time are being set by the constructor
+        changed = attr_name in self._field_index and (
+            attr_name in field_table or "_removed_fields" in field_table)
+        object.__setattr__(self, attr_name, value)
+        if changed:
+            self.wrapper.changed((), (), (self,), (attr_name,))
+            if self._derived_fields:
+                invalidate_derived(self, attr_name)
 
     def __repr__(self) -> str:
         return_value = []
@@ -107,62 +153,69 @@ class DataType(TinyDB):
             return setattr(self, key, value)
         raise PCDKeyError(key)
 
-    def _build_keys(self) -> List[str]:
-        keys_list = []
-        for key in self.__dict__:
-            if key in self:
-                keys_list.append(key)
-
-        return keys_list
-
     # mapping methods ----------------------------------------------------------
-    def __iter__(self):
-        self._current_index = -1
-        self._keys_cache = self._build_keys()
-        yield from self._keys_cache
-
-    def __next__(self):
-        self._current_index += 1
-        if self._current_index < len(self._keys_cache):
-            return self._keys_cache[self._current_index]
-        raise StopIteration()
+    def __iter__(self) -> Iterator[str]:
+        removed = self._removed_fields
+        if removed:
+            return (key for key in self._field_names if key not in removed)
+        return iter(self._field_names)
 
     def __getitem__(self, key: Union[str, int]) -> Any:
-        if isinstance(key, int) and key < len(self):
-            return list(self.values())[key]
+        if isinstance(key, int):
+            try:
+                if self._removed_fields:
+                    key = tuple(self)[key]
+                else:
+                    key = self._field_names[key]
+            except IndexError:
+                raise PCDKeyError(key) from None
         return self._in_fields(key)
 
     def __setitem__(self, key: str, value: Any):
         self._set_field(key, value)
 
     def __len__(self) -> int:
-        return len(self.__dict__) - 3
+        return len(self._field_names) - len(self._removed_fields)
 
     def __delitem__(self, key: str) -> Any:
+        self._check_writable()
         if key in self:
-            del self.__dataclass_fields__[key]
-            del self.__annotations__[key]
-            return self.__dict__.pop(key)
+            self._removed_fields = self._removed_fields | {key}
+            value = self.__dict__.pop(key)
+            self.wrapper.changed((), (), (self,), (key,))
+            invalidate_derived(self, key)
+            return value
         raise PCDKeyError(key)
 
     def __contains__(self, key: str):
-        return (key not in ["dataclass_instanced", "_current_index",
-                            "_keys_cache"] and key in self.__dict__)
-
-    def values(self):
-        for key in self:
-            yield self[key]
-
-    def items(self):
-        for key in self:
-            yield key, self[key]
+        return key in self._field_index and key not in self._removed_fields
+
+    def _field_table_items(self) -> Iterator[Tuple[str, Any]]:
+        """All values are read from the same field table, so a concurrent
+        :meth:`update` or :meth:`reload` is seen entirely or not at all."""
+        field_table = self.__dict__
+        removed = field_table.get("_removed_fields", ())
+        for key in self._field_names:
+            if key in field_table:
+                yield key, field_table[key]
+            elif key not in removed:
+                yield key, getattr(self, key)
+
+    def values(self) -> Iterator[Any]:
+        for _, value in self._field_table_items():
+            yield value
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return self._field_table_items()
 
     def clear(self):
-        while True:
-            try:
-                del self[next(self)]
-            except StopIteration:
-                break
+        self._check_writable()
+        instance_dict = self.__dict__
+        for key in self._field_names:
+            instance_dict.pop(key, None)
+        self._removed_fields = frozenset(self._field_names)
+        self.wrapper.changed((), (), (self,))
+        invalidate_derived(self)
 
     pop = __delitem__
     keys = __iter__
@@ -208,7 +261,20 @@ class DataType(TinyDB):
                               class name is used.
         :type template_name: None or str
         :param dependency_list: :class:`Template` to be used as dependency.
-        :type dependency_list: list[str]"""
+        :type dependency_list: list[str]
+        :param key_field: The field which identifies the instances in the
+                          :class:`~panda_core_data.references.Ref` fields of
+                          other models, the default is `name`.
+        :type key_field: str
+        :param search_fields: The string fields indexed for
+                              :meth:`~panda_core_data.model.Model.search`.
+        :type search_fields: tuple[str]
+        :param weak_instances: If the instances that weren't loaded from raws
+                               are removed once nothing else references
+                               them, see
+                               :class:`~panda_core_data.data_core_bases.base_data.WeakGroupInstance`
+        :type weak_instances: bool"""
+        # pylint: disable=protected-access
         from .data_core_bases import GroupWrapper
 
         if not hasattr(data_type, "dataclass_args"):
@@ -218,17 +284,13 @@ class DataType(TinyDB):
             def new_init(self, *init_args, db_file: Optional[str] = None,
                          default_table: str = DataType.DEFAULT_TABLE,
                          **init_kwargs):
-                from .model import Model
                 if db_file:
                     self.load_db(db_file, *init_args,
                                  default_table=default_table, **init_kwargs)
                 elif self.original_init:
                     self.original_init(*init_args, **init_kwargs)
 
-                if isinstance(self, Model):
-                    self.wrapper.instances.append(self)
-                else:
-                    self.wrapper.instances = self
+                self._register_instance()
 
                 if hasattr(self, "__post_init__"):
                     self.__post_init__(*init_args, **init_kwargs)
@@ -243,10 +305,25 @@ class DataType(TinyDB):
         replace = kwargs.pop("replace", False)
         data_name = kwargs.pop("data_name", data_type.__name__)
         data_type.dependencies = kwargs.pop("dependencies", [])
+        data_type.key_field = kwargs.pop("key_field", DataType.key_field)
+        data_type.search_fields = tuple(kwargs.pop("search_fields", ()))
+        weak_instances = kwargs.pop("weak_instances", False)
 
         data_type.data_name = data_name
         data_type.data_type_dict = data_type_dict
-        data_type.wrapper = GroupWrapper(data_type)
+        data_type._field_names = tuple(current_field.name for current_field
+                                       in fields(data_type))
+        data_type._field_index = {field_name: index for index, field_name
+                                  in enumerate(data_type._field_names)}
+        data_type._fast_init = build_fast_init(data_type)
+        data_type._positional_init = build_positional_init(data_type)
+        data_type.wrapper = GroupWrapper(data_type, weak=weak_instances)
+        if "__setattr__" not in data_type.__dict__:
+            data_type.__setattr__ = object.__setattr__
+        if data_type._derived_fields:
+            data_type.wrapper.track_writes()
+        if data_type.search_fields:
+            search_index(data_type)
 
         if data_name not in data_type_dict or replace:
             data_type_dict[data_name] = data_type
@@ -255,6 +332,11 @@ class DataType(TinyDB):
                 f"There's already a {type(data_type)} with the name "
                 f"{data_name}")
 
+        graph = getattr(getattr(data_type, "data_core", None),
+                        "dependency_graph", None)
+        if graph is not None:
+            graph.invalidate()
+
     @property
     def has_dependencies(self) -> bool:
         """If the model has any dependencies
@@ -263,15 +345,29 @@ class DataType(TinyDB):
         check_if_valid_instance(self, DataType)
         return any(self.dependencies)
 
-    # def load_inner_dependencies(self, dependency):
-    #    check_if_valid_instance(dependency, DataType)
-    #
-    #    tmp_dependencies = {dependency.data_name: dependency}
-    #
-    #    for current_data in dependency.parents.values():
-    #        tmp_dependencies.update(self.load_inner_dependencies(current_data))
-    #
-    #    return tmp_dependencies
+    @classmethod
+    def _make_read_only(cls):
+        """Make all instances of the class read only, it can't be undone"""
+        cls.wrapper.read_only = True
+        cls.__setattr__ = _read_only_setattr
+        cls.__delattr__ = _read_only_setattr
+
+    def _register_instance(self):
+        "Add the instance into the wrapper of it's type"
+        self.wrapper.instances.append(self)
+
+    @classmethod
+    def _register_instances(cls, instances: List["DataType"]):
+        "Add many instances into the wrapper of the type at once"
+        cls.wrapper.instances.extend(instances)
+
+    @property
+    def raw_file(self) -> Optional[Path]:
+        """The raw file the instance was loaded from
+
+        :return: path to the raw or None if it wasn't loaded from a raw"""
+        storage = self.__dict__.get("_storage")
+        return getattr(storage, "path", None)
 
     @property
     def is_instanced(self) -> bool:
@@ -294,36 +390,169 @@ class DataType(TinyDB):
         extension = get_extension(db_file)
         storage = get_storage_from_extension(extension)
 
-        TinyDB.__init__(self, db_file, *init_args, storage=storage,
-                        default_table=default_table, **kwargs)
-
-        for current_field in self.all():
-            setattr(self, list(current_field.keys())[0],
-                    list(current_field.values())[0])
+        self._attach_storage(storage(db_file, *init_args, **kwargs),
+                             default_table)
+
+        try:
+            self._fast_init(merge_records(
+                self._storage.read().get(default_table)))
+        except PCDInvalidRaw as invalid_raw:
+            raise PCDInvalidRaw(
+                f"{invalid_raw} in the file {db_file}") from invalid_raw
+
+    def _attach_storage(self, storage: "tinydb.storages.Storage",
+                        default_table: str = DEFAULT_TABLE):
+        """Same as TinyDB.__init__, except that the default table is only
+        created when it's needed, creating it reads and wraps every document
+        of the raw, which we don't use while loading."""
+        # none of them are fields, so they skip __setattr__
+        self.__dict__.update(
+            _storage=storage, _opened=True, _cls_table=self.table_class,
+            _cls_storage_proxy=self.storage_proxy_class, _table_cache={},
+            _default_table=default_table)
 
     def all(self, *arg, **kwargs):
-        return self._table.all(*arg, **kwargs)
-
-    def add_dependencies(self):
-        "Add all dependencies for the model"
-        for current_dependency in self.dependencies:
-            dependency = self.data_core.get_template_type(current_dependency)
-            dependency = dependency.instanced()
-            # if dependency.has_dependencies:
-            #    self.parents.update(self.load_inner_dependencies(dependency))
-
-            self.parents[current_dependency] = dependency
+        return self.table(self._default_table).all(*arg, **kwargs)
+
+    # writers ------------------------------------------------------------------
+    def _check_writable(self):
+        if self.wrapper.read_only:
+            raise PCDReadOnly(f"The instances of {self.data_name} are read "
+                              "only")
+
+    def _swap_field_table(self, field_table: Dict[str, Any],
+                          changed: Optional[Tuple[str, ...]] = None):
+        """Replace all attributes of the instance at once, readers holding the
+        previous table keep seeing it unchanged.
+
+        :param field_table: the new field table
+        :param changed: the fields that changed, None if any of them might
+                        have changed"""
+        self._check_writable()
+        # copies of the field table have the cached derived values
+        discard_derived(field_table)
+        object.__setattr__(self, "__dict__", field_table)
+        self.wrapper.changed((), (), (self,), changed)
+
+    def update(self, **changes: Any):
+        """Change multiple fields at once. The changes are applied to a copy of
+        the field table which then replaces the current one, so other threads
+        see either all changes or none of them.
+
+        Setting a field directly doesn't hold the lock of the wrapper, so a
+        field set by another thread while the field table is copied may be
+        lost, threads that change the same instance should use this method.
+
+        :raise PCDKeyError: If any of the keys isn't a field
+        :raise PCDDanglingReference: If a reference field points to an
+                                     instance that doesn't exist"""
+        for key in changes:
+            if key not in self:
+                raise PCDKeyError(key)
+
+        with self.wrapper.lock:
+            field_table = dict(self.__dict__)
+            field_table.update(changes)
+            self._resolve_references(field_table)
+            self._swap_field_table(field_table, tuple(changes))
+
+
+    def _resolve_references(self, field_table: Dict[str, Any]):
+        if not reference_fields(type(self)):
+            return
+
+        source = self.raw_file or f"instance of {self.data_name}"
+        errors = self.data_core.references.resolve_fields(
+            type(self), field_table, source)
+        if errors:
+            raise PCDDanglingReference(errors)
+
+    def reload(self):
+        """Read the raw file of the instance again and replace all it's fields
+        at once. If the core validates raws, the new fields are validated
+        before replacing the old ones. Like :meth:`update`, fields set
+        directly by other threads meanwhile are lost.
+
+        :raise PCDInvalidRaw: If the instance wasn't loaded from a raw or the
+                              raw is invalid
+        :raise PCDValidationError: If the new fields are invalid
+        :raise PCDDanglingReference: If a reference field points to an
+                                     instance that doesn't exist"""
+        with self.wrapper.lock:
+            old_storage = self._storage
+            self._swap_field_table(self._read_raw())
+            old_storage.close()
+
+    def _read_raw(self) -> Dict[str, Any]:
+        """Read the raw file of the instance into a new field table, with a
+        new storage and the other attributes of the current field table
+
+        :return: the field table"""
+        raw_file = self.raw_file
+        if raw_file is None:
+            raise PCDInvalidRaw(f"'{self.data_name}' instance wasn't loaded "
+                                "from a raw")
+
+        old_storage = self._storage
+        storage = type(old_storage)(raw_file, **old_storage.kwargs)
+
+        loaded = object.__new__(type(self))
+        # pylint: disable=protected-access
+        try:
+            loaded._fast_init(merge_records(
+                storage.read().get(self._default_table)))
+        except PCDInvalidRaw as invalid_raw:
+            storage.close()
+            raise PCDInvalidRaw(
+                f"{invalid_raw} in the file {raw_file}") from invalid_raw
+
+        if getattr(self.data_core, "validate_raws", False):
+            from .validators import validate_instances
+            errors = validate_instances(type(self), [loaded])
+            if errors:
+                storage.close()
+                raise PCDValidationError(errors)
+
+        field_table = dict(self.__dict__)
+        field_table.pop("_removed_fields", None)
+        field_table.update(loaded.__dict__)
+        field_table["_storage"] = storage
+        try:
+            self._resolve_references(field_table)
+        except PCDDanglingReference:
+            storage.close()
+            raise
+        return field_table
+
+    def add_dependencies(self) -> Mapping[str, "DataType"]:
+        """Resolve the dependencies of the model, including the dependencies of
+        it's dependencies. They are resolved once per type by the dependency
+        graph of the core and are available in :attr:`parents`.
+
+        :return: the parents of the instance
+        :raise PCDCircularDependency: If the dependencies have a cycle"""
+        return self.parents
 
     # context methods ----------------------------------------------------------
     def save_to_file(self, *_):
         "Save fields instance into the raw"
-        to_write = {self.DEFAULT_TABLE: []}
-        for the_field in fields(self):
-            to_write[self.DEFAULT_TABLE].append(
-                {the_field.name: getattr(self, the_field.name)})
-
-        self._storage.write(to_write)
-        self.close()
+        self._check_writable()
+        with self.wrapper.lock:
+            to_write = {self.DEFAULT_TABLE: []}
+            for field_name, value in dereferenced_items(self):
+                to_write[self.DEFAULT_TABLE].append({field_name: value})
+
+            if not self._opened:
+                # it was saved before, which closed the storage
+                storage = self._storage
+                self._attach_storage(type(storage)(self.raw_file,
+                                                   **storage.kwargs),
+                                     self._default_table)
+            self._storage.write(to_write)
+            self.close()
+
+            if self._residency is not None:
+                self._residency.saved(self)
 
     __exit__ = save_to_file
 
@@ -343,6 +572,10 @@ class DataType(TinyDB):
     #===========================================================================
 
 
+def _read_only_setattr(self, *_):
+    raise PCDReadOnly(f"The instances of {self.data_name} are read only")
+
+
 def generate_dataclass_args(data_type: DataType, **kwargs):
     """Extract dataclass arguments from the :class:`DataType`
 
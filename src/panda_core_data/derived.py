@@ -0,0 +1,232 @@
+'''Derived fields, values computed from the fields of an instance which are
+cached until one of the fields they read changes.
+
+.. code:: python
+
+    from panda_core_data.derived import derived
+
+    class Weapons(Model):
+        name: str
+        damage: float
+        speed: float
+
+        @derived
+        def dps(self) -> float:
+            return self.damage * self.speed
+
+        @derived(precompute=True)
+        def label(self) -> str:
+            return f"{self.name} ({self.dps:.1f} dps)"
+
+The fields read while computing the value are recorded, so changing `speed`
+discards `dps` and `label` but changing `name` only discards `label`.
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from functools import update_wrapper
+from typing import (Any, Callable, Dict, FrozenSet, Iterable, Optional, Set,
+                    Union)
+
+from .custom_exceptions import PCDKeyError, PCDTypeError
+from .utils import paused_gc
+
+CACHE_KEY = "_derived_dependencies"
+"""Key of the fields each cached value depends on in the field table of an
+instance, the values are cached in the field table with their own name"""
+
+Dependencies = Optional[FrozenSet[str]]
+"The fields a value depends on, None if it can depend on any of them"
+
+
+class _ReadRecorder():
+    """Stands in for the instance while a derived value is computed and
+    records the name of each attribute and key read through it"""
+    __slots__ = ("_instance", "_reads")
+
+    def __init__(self, instance: Any, reads: Set[str]):
+        object.__setattr__(self, "_instance", instance)
+        object.__setattr__(self, "_reads", reads)
+
+    @property
+    def __class__(self) -> type:
+        return type(self._instance)
+
+    def __getattr__(self, name: str) -> Any:
+        self._reads.add(name)
+        return getattr(self._instance, name)
+
+    def __getitem__(self, key: str) -> Any:
+        self._reads.add(key)
+        return self._instance[key]
+
+    def __setattr__(self, name: str, value: Any):
+        raise PCDTypeError(f"Derived fields can't change the field {name}")
+
+    def __repr__(self) -> str:
+        return repr(self._instance)
+
+
+def _dependencies(instance: Any, reads: Iterable[str]) -> Dependencies:
+    """The fields behind the names read while computing a value, methods and
+    properties can read any field"""
+    # pylint: disable=protected-access
+    field_index = instance._field_index
+    derived_fields = instance._derived_fields
+    owner = type(instance)
+
+    dependencies: Set[str] = set()
+    for name in reads:
+        if name in field_index:
+            dependencies.add(name)
+        elif name in derived_fields:
+            # the value might not be cached if a field changed meanwhile
+            derived_dependencies = instance.__dict__.get(CACHE_KEY, {})
+            if derived_dependencies.get(name) is None:
+                return None
+            dependencies |= derived_dependencies[name]
+        else:
+            attribute = getattr(owner, name, None)
+            if callable(attribute) or hasattr(attribute, "__get__"):
+                return None
+    return frozenset(dependencies)
+
+
+class DerivedField():
+    """Descriptor of a derived field, use :func:`derived` to create it. It's
+    only called when the value isn't cached, cached values are read from the
+    field table of the instance like any other attribute.
+
+    :param function: computes the value from the instance
+    :param precompute: if the value is computed for all instances after the
+                       raws are loaded"""
+    def __init__(self, function: Callable[[Any], Any],
+                 precompute: bool = False):
+        self.function = function
+        self.precompute = precompute
+        self.name = function.__name__
+        update_wrapper(self, function)
+
+    def __set_name__(self, owner: type, name: str):
+        # pylint: disable=protected-access
+        self.name = name
+        derived_fields = dict(getattr(owner, "_derived_fields", {}))
+        derived_fields[name] = self
+        owner._derived_fields = derived_fields
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        return self.compute(instance)
+
+    def compute(self, instance: Any) -> Any:
+        """Compute the value for the instance and cache it
+
+        :param instance: the instance
+        :return: the value"""
+        wrapper = instance.wrapper
+        version = wrapper.version
+        reads: Set[str] = set()
+        value = self.function(_ReadRecorder(instance, reads))
+        dependencies = _dependencies(instance, reads)
+
+        field_table = instance.__dict__
+        field_table.setdefault(CACHE_KEY, {})[self.name] = dependencies
+        field_table[self.name] = value
+        # a field changed while the value was computed, so it might be stale
+        if wrapper.version != version:
+            _discard(field_table, self.name)
+        return value
+
+
+def derived(function: Optional[Callable[[Any], Any]] = None, *,
+            precompute: bool = False
+            ) -> Union[DerivedField, Callable[[Callable], DerivedField]]:
+    """Decorator of a method of a model that turns it into a derived field,
+    which is read like an attribute. The value is cached in each instance
+    and discarded when a field it read changes, through attributes, keys,
+    :meth:`~panda_core_data.data_type.DataType.update` or
+    :meth:`~panda_core_data.data_type.DataType.reload`.
+
+    Values that call methods or properties of the instance are discarded
+    when any field changes, since the fields those read aren't recorded.
+
+    :param function: the decorated method
+    :param precompute: if the value is computed for all instances after the
+                       raws are loaded, see :func:`precompute_derived`
+    :return: the derived field"""
+    if function is None:
+        return lambda function: DerivedField(function, precompute)
+    return DerivedField(function, precompute)
+
+
+def _discard(field_table: Dict[str, Any], name: str):
+    field_table.pop(name, None)
+    field_table.get(CACHE_KEY, {}).pop(name, None)
+
+
+def invalidate_derived(instance: Any, field_name: Optional[str] = None):
+    """Discard the cached values of an instance that read a field
+
+    :param instance: the instance
+    :param field_name: the changed field, all values are discarded if it's
+                       None"""
+    field_table = instance.__dict__
+    derived_dependencies = field_table.get(CACHE_KEY)
+    if not derived_dependencies:
+        return
+    for name, dependencies in tuple(derived_dependencies.items()):
+        if (field_name is None or dependencies is None or
+                field_name in dependencies):
+            _discard(field_table, name)
+
+
+def discard_derived(field_table: Dict[str, Any]):
+    """Remove all cached values from a field table, like the copy that
+    replaces the field table of an instance
+
+    :param field_table: the field table"""
+    for name in field_table.pop(CACHE_KEY, ()):
+        field_table.pop(name, None)
+
+
+def precompute_derived(data_type: type,
+                       names: Optional[Iterable[str]] = None) -> int:
+    """Compute the derived fields of all instances of the type at once
+
+    :param data_type: the type of the instances
+    :param names: the derived fields to compute, all of them by default
+    :return: how many values were computed
+    :raise PCDKeyError: If any of the names isn't a derived field"""
+    # pylint: disable=protected-access
+    derived_fields: Dict[str, DerivedField] = data_type._derived_fields
+    names = tuple(derived_fields) if names is None else tuple(names)
+    for name in names:
+        if name not in derived_fields:
+            raise PCDKeyError(name)
+    fields = [derived_fields[name] for name in names]
+
+    computed = 0
+    with paused_gc():
+        for instance in data_type.wrapper.snapshot():
+            for field in fields:
+                # values read by other derived fields are already cached
+                if field.name not in instance.__dict__:
+                    field.compute(instance)
+                    computed += 1
+    return computed
+
+
+def precompute_core(data_core: "panda_core_data.DataCore") -> int:
+    """Compute the derived fields declared with `precompute=True` of all
+    models of the core, it's called after the raws are loaded
+
+    :param data_core: the core of the models
+    :return: how many values were computed"""
+    computed = 0
+    for model in data_core.all_models:
+        names = [name for name, field
+                 in getattr(model, "_derived_fields", {}).items()
+                 if field.precompute]
+        if names:
+            computed += precompute_derived(model, names)
+    return computed
@@ -0,0 +1,362 @@
+'''Differences between the instances of two cores, like two versions of a
+mod, as a stream of patch entries.
+
+.. code:: python
+
+    old_core = DataCore(name="old")
+    new_core = DataCore(name="new")
+    ...
+    for entry in old_core.diff(new_core):
+        print(entry.operation, entry.model, entry.key, entry.fields)
+
+    write_patch(old_core.diff(new_core), "patch.ndjson")
+    write_patch(old_core.diff(new_core), sys.stdout)
+
+The instances of each model are paired by their `key_field`. Once
+:func:`content_hashes` was called for both versions of a model, a hash of the
+content of each instance is kept until the model changes and only the pairs
+whose hashes differ have their fields compared, which is faster when the same
+core is compared many times. Otherwise the fields of each pair are compared
+directly, hashing them would be slower than comparing them once. The hashes
+are encoded by the json module, so they are the same whether orjson is
+installed or not.
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from dataclasses import dataclass
+from hashlib import blake2b
+from itertools import chain, count
+import json
+from operator import itemgetter
+from typing import (Any, Dict, Iterable, Iterator, List, NamedTuple,
+                    Optional, TextIO, Tuple, Union)
+
+from .custom_typings import PathType
+from .exporters import encode_json, iter_row_chunks
+from .references import SCALARS, reference_fields, to_key
+from .utils import paused_gc
+
+ADDED = "add"
+REMOVED = "remove"
+CHANGED = "change"
+
+
+class PatchEntry(NamedTuple):
+    """An instance that was added, removed or changed
+
+    `fields` has all fields of added and removed instances and the old and
+    new value of each changed field of changed instances. References are
+    the keys of the referenced instances."""
+    operation: str
+    model: str
+    key: Any
+    fields: Dict[str, Any]
+
+
+class ContentHashes(NamedTuple):
+    """The hash of the fields of each instance of a type, the key field is
+    one of them, so the same hash means the same key and content"""
+    version: int
+    instances: Tuple[Any, ...]
+    keys: List[Any]
+    hashes: List[bytes]
+    # the position of each hash and of each pairing key
+    positions: Dict[bytes, int]
+    key_index: Dict[Any, int]
+
+
+@dataclass(frozen=True)
+class _Occurrence():
+    "Pairs the instances after the first one with the same key"
+    key: Any
+    occurrence: int
+
+
+# the hashes are always encoded by the json module, so they are the same
+# whether orjson is installed or not
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"),
+                            sort_keys=True, default=str)
+
+
+def _string_keys(value: Any) -> Any:
+    "The value with the keys of the dictionaries inside it as strings"
+    if isinstance(value, dict):
+        return {_ENCODER.encode(key) if key.__class__ is not str else key:
+                _string_keys(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_string_keys(item) for item in value]
+    return value
+
+
+def _encode(row: Any) -> bytes:
+    try:
+        return _ENCODER.encode(row).encode()
+    except TypeError:
+        # keys of different types can't be sorted
+        return _ENCODER.encode(_string_keys(row)).encode()
+
+
+def _hash(encoded: bytes) -> bytes:
+    return blake2b(encoded, digest_size=16).digest()
+
+
+def _hashable(key: Any) -> Any:
+    return tuple(map(_hashable, key)) if key.__class__ is list else key
+
+
+def _pairing(keys: List[Any]) -> List[Any]:
+    """The key each position is paired by, the instances after the first one
+    with the same key are paired by their occurrence"""
+    pairing = list(keys)
+    if len(set(keys)) != len(keys):
+        occurrences: Dict[Any, int] = {}
+        for position, key in enumerate(keys):
+            occurrence = occurrences.get(key, 0)
+            occurrences[key] = occurrence + 1
+            if occurrence:
+                pairing[position] = _Occurrence(key, occurrence)
+    return pairing
+
+
+def _cached_hashes(data_type: type) -> Optional[ContentHashes]:
+    "The hashes of the type, if they were computed since it last changed"
+    cached = data_type.__dict__.get("_content_hashes")
+    if cached is not None and cached.version == data_type.wrapper.version:
+        return cached
+    return None
+
+
+def content_hashes(data_type: type) -> ContentHashes:
+    """Hash the fields of all instances of the type, they are cached until
+    the :attr:`~panda_core_data.data_core_bases.base_data.GroupWrapper.version`
+    of the type changes. Instances without a `key_field` are keyed by their
+    position.
+
+    :param data_type: the type of the instances
+    :return: the hashes"""
+    # pylint: disable=protected-access
+    cached = _cached_hashes(data_type)
+    if cached is not None:
+        return cached
+    version = data_type.wrapper.version
+
+    instances = data_type.wrapper.snapshot()
+    key_position = data_type._field_index.get(data_type.key_field)
+    keys: List[Any] = []
+    encoded: List[bytes] = []
+    # the field names are hashed too, so the versions of a type with other
+    # fields don't have any hash in common
+    header = _encode(data_type._field_names)
+    for chunk in iter_row_chunks(data_type, instances):
+        if key_position is not None:
+            keys.extend(map(_hashable, map(itemgetter(key_position), chunk)))
+        encoded.extend(map(header.__add__, map(_encode, chunk)))
+    if key_position is None:
+        # the same fields in another position are another instance
+        keys = list(range(len(instances)))
+        encoded = list(map(bytes.__add__, encoded, map(_encode, keys)))
+
+    key_index = dict(zip(keys, count()))
+    if len(key_index) != len(keys):
+        pairing = _pairing(keys)
+        key_index = dict(zip(pairing, count()))
+        for position, pairing_key in enumerate(pairing):
+            if pairing_key.__class__ is _Occurrence:
+                encoded[position] += _encode(pairing_key.occurrence)
+    hashes = list(map(_hash, encoded))
+
+    cached = ContentHashes(version, instances, keys, hashes,
+                           dict(zip(hashes, count())), key_index)
+    data_type._content_hashes = cached
+    return cached
+
+
+def _fields(data_type: type, instance: Any) -> Dict[str, Any]:
+    "The fields of the instance with builtin values only"
+    # pylint: disable=protected-access
+    row = next(iter_row_chunks(data_type, (instance,)))[0]
+    return dict(zip(data_type._field_names, row))
+
+
+def _changed_fields(old: Dict[str, Any], new: Dict[str, Any]
+                    ) -> Dict[str, Tuple[Any, Any]]:
+    "The old and new value of each field that changed, was added or removed"
+    return {field_name: (old.get(field_name), new.get(field_name))
+            for field_name in dict.fromkeys(chain(old, new))
+            if field_name not in old or field_name not in new or
+            old[field_name] != new[field_name]}
+
+
+def _pairing_keys(hashes: ContentHashes) -> List[Any]:
+    "The key each position was paired by"
+    pairing_keys = list(hashes.keys)
+    for pairing_key, position in hashes.key_index.items():
+        if pairing_key.__class__ is _Occurrence:
+            pairing_keys[position] = pairing_key
+    return pairing_keys
+
+
+def _rows(data_type: Optional[type]
+          ) -> Tuple[Tuple[Any, ...], List[Any], List[Tuple[Any, ...]]]:
+    """The instances of the type, their keys and the values of their fields,
+    with references replaced by their keys so the rows of two cores can be
+    compared"""
+    # pylint: disable=protected-access
+    if data_type is None:
+        return (), [], []
+    instances = data_type.wrapper.snapshot()
+    field_names = data_type._field_names
+    references = [data_type._field_index[field_name] for field_name, _, _
+                  in reference_fields(data_type)]
+    getter = itemgetter(*field_names)
+
+    def read_row(instance: Any) -> Tuple[Any, ...]:
+        field_table = instance.__dict__
+        try:
+            row = getter(field_table)
+        except KeyError:
+            row = tuple(map(field_table.get, field_names))
+        if row.__class__ is not tuple:
+            row = (row,)
+        if references:
+            row = list(row)
+            for position in references:
+                if row[position].__class__ not in SCALARS:
+                    row[position] = to_key(row[position])
+            row = tuple(row)
+        return row
+
+    with paused_gc():
+        rows = list(map(read_row, instances))
+    key_position = data_type._field_index.get(data_type.key_field)
+    if key_position is None:
+        return instances, list(range(len(rows))), rows
+    return instances, [_hashable(row[key_position]) for row in rows], rows
+
+
+def _diff_rows(old_type: Optional[type], new_type: Optional[type]
+               ) -> Iterator[PatchEntry]:
+    """Compare the fields of each pair of instances, without hashing them.
+    Only the pairs whose fields differ are read into builtin values."""
+    # pylint: disable=protected-access
+    model = (old_type or new_type).data_name
+    same_fields = (old_type is not None and new_type is not None and
+                   old_type._field_names == new_type._field_names)
+    old_instances, old_keys, old_rows = _rows(old_type)
+    new_instances, new_keys, new_rows = _rows(new_type)
+
+    # the positions of the new instances that weren't paired yet
+    unpaired = dict(zip(_pairing(new_keys), count()))
+    for position, pairing_key in enumerate(_pairing(old_keys)):
+        new_position = unpaired.pop(pairing_key, None)
+        if new_position is None:
+            yield PatchEntry(REMOVED, model, old_keys[position],
+                             _fields(old_type, old_instances[position]))
+        elif not same_fields or old_rows[position] != new_rows[new_position]:
+            changed = _changed_fields(
+                _fields(old_type, old_instances[position]),
+                _fields(new_type, new_instances[new_position]))
+            if changed:
+                yield PatchEntry(CHANGED, model, old_keys[position], changed)
+
+    for new_position in unpaired.values():
+        yield PatchEntry(ADDED, model, new_keys[new_position],
+                         _fields(new_type, new_instances[new_position]))
+
+
+def diff_types(old_type: Optional[type], new_type: Optional[type]
+               ) -> Iterator[PatchEntry]:
+    """Compare the instances of two versions of a type, the removed and
+    changed instances come first, in the order of the old type, and then
+    the added ones, in the order of the new type.
+
+    If the :func:`content_hashes` of both versions are up to date, only the
+    instances whose hash isn't in the other version are compared, otherwise
+    the fields of all pairs are compared.
+
+    :param old_type: the old version, None if the type was added
+    :param new_type: the new version, None if the type was removed
+    :return: generator of the entries"""
+    if ((old_type is not None and _cached_hashes(old_type) is None) or
+            (new_type is not None and _cached_hashes(new_type) is None)):
+        yield from _diff_rows(old_type, new_type)
+        return
+
+    model = (old_type or new_type).data_name
+    empty = ContentHashes(0, (), [], [], {}, {})
+    old = content_hashes(old_type) if old_type is not None else empty
+    new = content_hashes(new_type) if new_type is not None else empty
+
+    old_positions = sorted(map(old.positions.__getitem__,
+                               old.positions.keys() - new.positions.keys()))
+    new_positions = sorted(map(new.positions.__getitem__,
+                               new.positions.keys() - old.positions.keys()))
+    if not old_positions and not new_positions:
+        return
+
+    old_pairing = _pairing_keys(old)
+    new_pairing = _pairing_keys(new)
+    for position in old_positions:
+        key = old.keys[position]
+        new_position = new.key_index.get(old_pairing[position])
+        old_fields = _fields(old_type, old.instances[position])
+        if new_position is None:
+            yield PatchEntry(REMOVED, model, key, old_fields)
+        else:
+            changed = _changed_fields(old_fields, _fields(
+                new_type, new.instances[new_position]))
+            if changed:
+                yield PatchEntry(CHANGED, model, key, changed)
+
+    for position in new_positions:
+        if new_pairing[position] not in old.key_index:
+            yield PatchEntry(ADDED, model, new.keys[position],
+                             _fields(new_type, new.instances[position]))
+
+
+def diff_cores(old_core: "panda_core_data.DataCore",
+               new_core: "panda_core_data.DataCore"
+               ) -> Iterator[PatchEntry]:
+    """Compare the instances of the models and templates of two cores, the
+    types are paired by their `data_name`. The entries are created while
+    the generator is consumed, one type at a time.
+
+    :param old_core: the old version
+    :param new_core: the new version
+    :return: generator of the entries"""
+    for old_types, new_types in (
+            (old_core.all_key_value_templates,
+             new_core.all_key_value_templates),
+            (old_core.all_model_types, new_core.all_model_types)):
+        for data_name, old_type in old_types.items():
+            yield from diff_types(old_type, new_types.get(data_name))
+        for data_name, new_type in new_types.items():
+            if data_name not in old_types:
+                yield from diff_types(None, new_type)
+
+
+def write_patch(entries: Iterable[PatchEntry],
+                output: Union[PathType, TextIO]) -> int:
+    """Write the entries as NDJSON as they are created, each line is an
+    object with the fields of an entry, see
+    :func:`~panda_core_data.exporters.encode_json`
+
+    :param entries: the entries, like the ones of :func:`diff_cores`
+    :param output: the file to be written or a text stream, like
+                   :data:`sys.stdout`, which isn't closed
+    :return: how many entries were written"""
+    if hasattr(output, "write"):
+        written = 0
+        for entry in entries:
+            output.write(encode_json(entry._asdict()).decode())
+            output.write("\n")
+            written += 1
+        return written
+
+    written = 0
+    with open(output, "wb") as patch_file:
+        for entry in entries:
+            patch_file.write(encode_json(entry._asdict()))
+            patch_file.write(b"\n")
+            written += 1
+    return written
@@ -0,0 +1,317 @@
+'''Bulk export of instances into NDJSON, CSV or Arrow files.
+
+The instances are read in chunks, so only one chunk of rows is in memory at a
+time. References are written as the key of the referenced instance and other
+instances inside the fields as dictionaries.
+
+.. code:: python
+
+    Items.export("items.csv", format="csv", fields=["name", "value"])
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import csv
+from dataclasses import fields as dataclass_fields
+from itertools import islice
+import json
+from math import isfinite
+from operator import itemgetter
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Tuple, Union)
+
+from .custom_exceptions import PCDKeyError, PCDTypeError
+from .custom_typings import PathType
+from .references import SCALARS, plain_value, reference_fields, to_key
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:
+    pyarrow = None
+
+Row = Union[Tuple[Any, ...], List[Any]]
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def _finite(value: Any) -> Any:
+    "The value with the floats that aren't finite, inside it too, as None"
+    if isinstance(value, float):
+        return value if isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+if orjson is not None:
+    def encode_json(value: Any) -> bytes:
+        """Encode a value into compact JSON, dictionary keys that aren't
+        strings are written as strings, values that can't be encoded as
+        their :class:`str` and floats that aren't finite as null, like
+        orjson does
+
+        :param value: the value
+        :return: the UTF-8 JSON"""
+        # pylint: disable=no-member
+        return orjson.dumps(value, default=str,
+                            option=orjson.OPT_NON_STR_KEYS)
+else:
+    _ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"),
+                                allow_nan=False, default=str)
+
+    def encode_json(value: Any) -> bytes:
+        """Encode a value into compact JSON, dictionary keys that aren't
+        strings are written as strings, values that can't be encoded as
+        their :class:`str` and floats that aren't finite as null, like
+        orjson does
+
+        :param value: the value
+        :return: the UTF-8 JSON"""
+        try:
+            return _ENCODER.encode(value).encode()
+        except ValueError:
+            # NaN isn't valid JSON
+            return _ENCODER.encode(_finite(value)).encode()
+
+
+def _field_converters(data_type: type, field_names: Tuple[str, ...]
+                      ) -> List[Tuple[int, Callable[[Any], Any]]]:
+    """Converters of the columns that might need one, fields annotated with a
+    builtin scalar type are written as they are"""
+    references = {field_name for field_name, _, _
+                  in reference_fields(data_type)}
+    annotations = {current_field.name: current_field.type
+                   for current_field in dataclass_fields(data_type)}
+
+    converters = []
+    for position, field_name in enumerate(field_names):
+        if field_name in references:
+            converters.append((position, to_key))
+        elif annotations.get(field_name) not in SCALARS:
+            converters.append((position, plain_value))
+    return converters
+
+
+def iter_row_chunks(data_type: type, instances: Iterable[Any],
+                    field_names: Optional[Iterable[str]] = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE
+                    ) -> Iterator[List[Row]]:
+    """Read the instances into chunks of rows with builtin values only
+
+    :param data_type: the type of the instances
+    :param instances: the instances to be read, it's consumed a chunk at a
+                      time
+    :param field_names: the fields to be read, all of them by default
+    :param chunk_size: how many rows each chunk has
+    :return: generator of lists of rows, the values are in the order of
+             `field_names`
+    :raise PCDKeyError: If any of the fields doesn't exist"""
+    # pylint: disable=protected-access
+    field_names = tuple(field_names or data_type._field_names)
+    for field_name in field_names:
+        if field_name not in data_type._field_index:
+            raise PCDKeyError(field_name)
+
+    converters = _field_converters(data_type, field_names)
+    if len(field_names) == 1:
+        single_getter = itemgetter(field_names[0])
+
+        def getter(field_table: Dict[str, Any]) -> Row:
+            return (single_getter(field_table),)
+    else:
+        getter = itemgetter(*field_names)
+
+    def read_row(instance: Any) -> Row:
+        # a single field table, so concurrent updates are seen entirely
+        field_table = instance.__dict__
+        try:
+            row = getter(field_table)
+        except KeyError:
+            row = tuple(field_table.get(field_name)
+                        for field_name in field_names)
+
+        if converters:
+            row = list(row)
+            for position, converter in converters:
+                value = row[position]
+                if value.__class__ not in SCALARS:
+                    row[position] = converter(value)
+        return row
+
+    instances = iter(instances)
+    while True:
+        chunk = list(map(read_row, islice(instances, chunk_size)))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _write_ndjson(path: PathType, data_type: type,
+                  field_names: Tuple[str, ...], chunks: Iterator[List[Row]]):
+    # pylint: disable=unused-argument
+    with open(path, "wb") as output:
+        for chunk in chunks:
+            lines = [encode_json(dict(zip(field_names, row)))
+                     for row in chunk]
+            lines.append(b"")
+            output.write(b"\n".join(lines))
+
+
+def _write_csv(path: PathType, data_type: type,
+               field_names: Tuple[str, ...], chunks: Iterator[List[Row]]):
+    # pylint: disable=unused-argument
+    def cell(value: Any) -> Any:
+        return value if value.__class__ in SCALARS else \
+            encode_json(value).decode()
+
+    with open(path, "w", newline="", encoding="utf-8") as output:
+        writer = csv.writer(output)
+        writer.writerow(field_names)
+        for chunk in chunks:
+            writer.writerows([[cell(value) for value in row] for row in chunk])
+
+
+def _arrow_type(annotation: Any) -> "pyarrow.DataType":
+    """Arrow type of the values of an annotation, all types are nullable.
+    Annotations without an Arrow type are written as JSON strings."""
+    origin = getattr(annotation, "__origin__", None)
+    args = getattr(annotation, "__args__", None) or ()
+    if origin is Union:
+        args = [arg for arg in args if arg is not type(None)]
+        return _arrow_type(args[0]) if len(args) == 1 else None
+    if origin in (list, List) and args:
+        item_type = _arrow_type(args[0])
+        return pyarrow.list_(item_type) if item_type is not None else None
+    if origin in (dict, Dict) and len(args) == 2:
+        key_type = _arrow_type(args[0])
+        item_type = _arrow_type(args[1])
+        if key_type is not None and item_type is not None:
+            return pyarrow.map_(key_type, item_type)
+        return None
+    return {str: pyarrow.string(), int: pyarrow.int64(),
+            float: pyarrow.float64(), bool: pyarrow.bool_(),
+            bytes: pyarrow.binary()}.get(annotation)
+
+
+def _reference_key_type(data_type: type, model_name: str
+                        ) -> "pyarrow.DataType":
+    "Arrow type of the key of the referenced model, strings by default"
+    try:
+        model_type = data_type.data_core.get_model_type(model_name)
+        annotation = {current_field.name: current_field.type for current_field
+                      in dataclass_fields(model_type)}[model_type.key_field]
+    except (AttributeError, KeyError, PCDTypeError):
+        return pyarrow.string()
+    return _arrow_type(annotation) or pyarrow.string()
+
+
+def _arrow_schema(data_type: type, field_names: Tuple[str, ...]
+                  ) -> Tuple["pyarrow.Schema", List[int]]:
+    """The schema of the fields, built from their annotations, and the
+    positions of the fields that are written as JSON strings"""
+    references = {field_name: (model_name, many) for field_name, model_name,
+                  many in reference_fields(data_type)}
+    annotations = {current_field.name: current_field.type
+                   for current_field in dataclass_fields(data_type)}
+
+    arrow_fields = []
+    encoded = []
+    for position, field_name in enumerate(field_names):
+        if field_name in references:
+            model_name, many = references[field_name]
+            arrow_type = _reference_key_type(data_type, model_name)
+            if many:
+                arrow_type = pyarrow.list_(arrow_type)
+        else:
+            arrow_type = _arrow_type(annotations.get(field_name))
+        if arrow_type is None:
+            arrow_type = pyarrow.string()
+            encoded.append(position)
+        arrow_fields.append(pyarrow.field(field_name, arrow_type,
+                                          nullable=True))
+    return pyarrow.schema(arrow_fields), encoded
+
+
+def _write_arrow(path: PathType, data_type: type,
+                 field_names: Tuple[str, ...], chunks: Iterator[List[Row]]):
+    if pyarrow is None:
+        raise PCDTypeError("Exporting into arrow needs the package pyarrow")
+
+    # the schema comes from the annotations instead of the first chunk, so
+    # the chunks after it can't have other types
+    schema, encoded = _arrow_schema(data_type, field_names)
+
+    with pyarrow.ipc.new_file(str(path), schema) as writer:
+        for chunk in chunks:
+            columns = [list(column) for column in zip(*chunk)]
+            for position in encoded:
+                columns[position] = [value if value is None
+                                     else encode_json(value).decode()
+                                     for value in columns[position]]
+            arrays = []
+            for column, arrow_field in zip(columns, schema):
+                try:
+                    arrays.append(pyarrow.array(column, type=arrow_field.type))
+                except (pyarrow.ArrowException, TypeError, ValueError
+                        ) as error:
+                    raise PCDTypeError(
+                        f"The field {arrow_field.name} of {data_type.data_name}"
+                        f" has values that aren't {arrow_field.type}: {error}"
+                    ) from error
+            writer.write_batch(pyarrow.RecordBatch.from_arrays(
+                arrays, schema=schema))
+
+
+WRITERS: Dict[str, Callable[[PathType, type, Tuple[str, ...],
+                             Iterator[List[Row]]], None]] = {
+    "ndjson": _write_ndjson,
+    "csv": _write_csv,
+    "arrow": _write_arrow,
+}
+"Functions that write the chunks of rows, by format name"
+
+
+def export_instances(data_type: type, instances: Iterable[Any],
+                     path: PathType, format: str = "ndjson",
+                     fields: Optional[Iterable[str]] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Write the instances into a file, a chunk at a time
+
+    :param data_type: the type of the instances
+    :param instances: the instances to be written
+    :param path: the file to be written, it's replaced if it exists
+    :param format: `ndjson`, `csv` or `arrow`, arrow writes an Arrow IPC file
+                   and needs pyarrow
+    :param fields: the fields to be written, all of them by default
+    :param chunk_size: how many instances are kept in memory at once
+    :return: how many instances were written
+    :raise PCDTypeError: If the format isn't supported
+    :raise PCDKeyError: If any of the fields doesn't exist"""
+    # pylint: disable=redefined-builtin
+    try:
+        writer = WRITERS[format]
+    except KeyError as missing:
+        raise PCDTypeError(f"The format {format} is not supported, the "
+                           f"available formats are {list(WRITERS)}"
+                           ) from missing
+
+    # pylint: disable=protected-access
+    field_names = tuple(fields or data_type._field_names)
+    count = 0
+
+    def counted(chunks: Iterator[List[Row]]) -> Iterator[List[Row]]:
+        nonlocal count
+        for chunk in chunks:
+            count += len(chunk)
+            yield chunk
+
+    writer(path, data_type, field_names, counted(iter_row_chunks(
+        data_type, instances, field_names, chunk_size)))
+    return count
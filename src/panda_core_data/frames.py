@@ -0,0 +1,212 @@
+'''Conversion between the instances of a model and pandas data frames or
+Arrow tables.
+
+.. code:: python
+
+    frame = Items.to_frame()
+    frame["value"] *= 2
+    Items.from_frame(frame)
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .custom_exceptions import PCDKeyError, PCDTypeError
+from .exporters import _field_converters
+from .references import SCALARS
+from .utils import paused_gc
+from .validators import check_rows
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+Columns = Dict[str, List[Any]]
+
+
+def field_columns(data_type: type, field_names: Optional[Iterable[str]] = None
+                  ) -> Columns:
+    """Get the values of the fields of all instances of the type as columns,
+    with references as keys. The columns are cached until the
+    :attr:`~panda_core_data.data_core_bases.base_data.GroupWrapper.version` of
+    the type changes, so they must not be changed.
+
+    :param data_type: the type of the instances
+    :param field_names: the fields to be read, all of them by default
+    :return: dictionary of field names and a list of it's values
+    :raise PCDKeyError: If any of the fields doesn't exist"""
+    # pylint: disable=protected-access
+    field_names = tuple(field_names or data_type._field_names)
+    cache = data_type.__dict__.get("_columns_cache")
+    if cache is None:
+        cache = {}
+        data_type._columns_cache = cache
+
+    version = data_type.wrapper.version
+    cached = cache.get(field_names)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    for field_name in field_names:
+        if field_name not in data_type._field_index:
+            raise PCDKeyError(field_name)
+
+    # the field table of each instance is taken once, so concurrent updates
+    # are seen entirely even though the columns are read one at a time
+    tables = list(map(attrgetter("__dict__"), data_type.wrapper.snapshot()))
+    converters = {field_names[position]: converter for position, converter
+                  in _field_converters(data_type, field_names)}
+    columns = {}
+    for field_name in field_names:
+        try:
+            column = list(map(itemgetter(field_name), tables))
+        except KeyError:
+            column = [table.get(field_name) for table in tables]
+        converter = converters.get(field_name)
+        if converter is not None:
+            column = [value if value.__class__ in SCALARS
+                      else converter(value) for value in column]
+        columns[field_name] = column
+
+    cache[field_names] = (version, columns)
+    return columns
+
+
+def _pandas_column(column: List[Any]) -> Any:
+    """The column itself, or an array with a nullable dtype if it has None,
+    pandas would turn integers and booleans with None into floats"""
+    if not any(value is None for value in column):
+        return column
+    classes = {value.__class__ for value in column}
+    classes.discard(type(None))
+    dtype = {frozenset((int,)): "Int64",
+             frozenset((float,)): "Float64",
+             frozenset((bool,)): "boolean"}.get(frozenset(classes), object)
+    try:
+        return pandas.array(column, dtype=dtype)
+    except (TypeError, ValueError, OverflowError):
+        # integers over 64 bits
+        return pandas.array(column, dtype=object)
+
+
+def to_frame(data_type: type, field_names: Optional[Iterable[str]] = None,
+             backend: str = "pandas") -> Any:
+    """Create a data frame with a column for each field and a row for each
+    instance of the type
+
+    :param data_type: the type of the instances
+    :param field_names: the fields to be read, all of them by default
+    :param backend: `pandas` for a :class:`pandas.DataFrame` or `arrow` for a
+                    :class:`pyarrow.Table`, columns with None have a nullable
+                    dtype with pandas
+    :return: the frame
+    :raise PCDTypeError: If the backend isn't supported or installed"""
+    columns = field_columns(data_type, field_names)
+    if backend == "pandas":
+        if pandas is None:
+            raise PCDTypeError("to_frame needs the package pandas")
+        return pandas.DataFrame({field_name: _pandas_column(column)
+                                 for field_name, column in columns.items()},
+                                copy=False)
+    if backend == "arrow":
+        if pyarrow is None:
+            raise PCDTypeError("to_frame with the arrow backend needs the "
+                               "package pyarrow")
+        return pyarrow.table(columns)
+    raise PCDTypeError(f"The backend {backend} is not supported, use pandas "
+                       "or arrow")
+
+
+def _series_values(series: Any) -> List[Any]:
+    "The values of a pandas series, with NaN and pandas.NA as None"
+    values = series.tolist()
+    if series.hasnans:
+        values = [None if missing else value
+                  for value, missing in zip(values, series.isna().tolist())]
+    return values
+
+
+def _frame_columns(frame: Any) -> Columns:
+    if pandas is not None and isinstance(frame, pandas.DataFrame):
+        # tolist transforms numpy values into python values in one pass
+        return {str(name): _series_values(frame[name])
+                for name in frame.columns}
+    if pyarrow is not None and isinstance(frame, pyarrow.Table):
+        return {name: frame.column(name).to_pylist()
+                for name in frame.column_names}
+    if isinstance(frame, dict):
+        return {name: list(values) for name, values in frame.items()}
+    raise PCDTypeError(f"Expected a pandas.DataFrame, a pyarrow.Table or a "
+                       f"dict of columns, got {type(frame).__name__}")
+
+
+def from_frame(data_type: type, frame: Any, update: bool = True
+               ) -> List[Any]:
+    """Create or update instances of the type from the rows of the frame,
+    each column is a field. All instances are checked first and then added
+    or changed at once.
+
+    :param data_type: the type of the instances
+    :param frame: a :class:`pandas.DataFrame`, a :class:`pyarrow.Table` or a
+                  dictionary of columns
+    :param update: if rows whose `key_field` matches an existing instance
+                   should update that instance instead of creating a new one
+    :return: the instances of each row, in order
+    :raise PCDKeyError: If any of the columns isn't a field
+    :raise PCDInvalidRaw: If a new instance lacks a required field
+    :raise PCDValidationError: If the core validates raws and any row is
+                               invalid
+    :raise PCDDanglingReference: If a reference field points to an instance
+                                 that doesn't exist"""
+    # pylint: disable=protected-access
+    columns = _frame_columns(frame)
+    for field_name in columns:
+        if field_name not in data_type._field_index:
+            raise PCDKeyError(field_name)
+
+    field_names = tuple(columns)
+    existing = {}
+    if update and data_type.key_field in columns:
+        existing = data_type.data_core.references.key_index(
+            data_type.data_name)
+
+    results: List[Any] = []
+    # the row, the instance and it's new field table
+    pending: List[Tuple[int, Any, Dict[str, Any]]] = []
+    with paused_gc():
+        for row, values in enumerate(zip(*columns.values())):
+            record = dict(zip(field_names, values))
+            instance = existing.get(record.get(data_type.key_field))
+            if instance is None:
+                instance = object.__new__(data_type)
+                instance._fast_init(record)
+                pending.append((row, instance, instance.__dict__))
+            else:
+                field_table = dict(instance.__dict__)
+                field_table.update(record)
+                pending.append((row, instance, field_table))
+            results.append(instance)
+
+    check_rows(data_type, pending)
+
+    created = []
+    with data_type.wrapper.lock:
+        for _, instance, field_table in pending:
+            if instance.__dict__ is field_table:
+                created.append(instance)
+            else:
+                instance._swap_field_table(field_table)
+        if created:
+            data_type.wrapper.instances.extend(created)
+
+    if hasattr(data_type, "__post_init__"):
+        for instance in created:
+            instance.__post_init__()
+    return results
@@ -1,9 +1,18 @@
 '''
 :created: 2019-04-30
 :author: Leandro (Cerberus1746) Benedet Garcia'''
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
+from .aggregations import Aggregation, aggregate
+from .bulk import Query, Record, bulk_create, delete_where, update_where
+from .custom_typings import PathType
 from .data_type import DataType
+from .derived import precompute_derived
+from .exporters import DEFAULT_CHUNK_SIZE, export_instances
+from .frames import from_frame, to_frame
+from .residency import ResidencyManager, limit_residency
+from .search import search_index
+from .sorted_views import SortedView, order_by
 
 
 
@@ -21,6 +30,24 @@ class Template(DataType):
 
         cls._add_into(cls, current_core.all_key_value_templates, **kwargs)
 
+    def _register_instance(self):
+        "Templates have a single instance, which replaces the previous one"
+        self._check_writable()
+        with self.wrapper.lock:
+            self.wrapper.instances = self
+            self.wrapper.changed()
+
+        graph = getattr(self.data_core, "dependency_graph", None)
+        if graph is not None:
+            graph.invalidate_parents()
+
+    @classmethod
+    def _register_instances(cls, instances: List["Template"]):
+        "Only the last one is kept, since templates have a single instance"
+        # pylint: disable=protected-access
+        for instance in instances:
+            instance._register_instance()
+
     @classmethod
     def instanced(cls):
         return cls.wrapper.instances
@@ -45,6 +72,141 @@ class Model(DataType, metaclass=ModelIter):
         cls.data_core = current_core
         cls._add_into(cls, current_core.all_model_types, **kwargs)
 
+    @classmethod
+    def export(cls, path: PathType, format: str = "ndjson",
+               fields: Optional[Iterable[str]] = None,
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Write all instances of the model into a file, see
+        :func:`~panda_core_data.exporters.export_instances`
+
+        :param path: the file to be written
+        :param format: `ndjson`, `csv` or `arrow`
+        :param fields: the fields to be written, all of them by default
+        :param chunk_size: how many instances are kept in memory at once
+        :return: how many instances were written"""
+        # pylint: disable=redefined-builtin
+        return export_instances(cls, cls.wrapper.instances, path, format,
+                                fields, chunk_size)
+
+    @classmethod
+    def to_frame(cls, fields: Optional[Iterable[str]] = None,
+                 backend: str = "pandas") -> Any:
+        """Create a data frame with all instances of the model, see
+        :func:`~panda_core_data.frames.to_frame`
+
+        :param fields: the fields to be read, all of them by default
+        :param backend: `pandas` or `arrow`
+        :return: the frame"""
+        return to_frame(cls, fields, backend)
+
+    @classmethod
+    def from_frame(cls, frame: Any, update: bool = True) -> List["Model"]:
+        """Create or update instances of the model from the rows of a data
+        frame, see :func:`~panda_core_data.frames.from_frame`
+
+        :param frame: a pandas or Arrow frame, or a dict of columns
+        :param update: if rows with the key of an existing instance should
+                       update it
+        :return: the instances of each row"""
+        return from_frame(cls, frame, update)
+
+    @classmethod
+    def bulk_create(cls, records: Iterable[Record],
+                    path: Optional[PathType] = None, extension: str = "json",
+                    overwrite: bool = False) -> List["Model"]:
+        """Create many instances of the model at once, optionally writing
+        their raws, see :func:`~panda_core_data.bulk.bulk_create`
+
+        :param records: dictionaries of fields or tuples of values
+        :param path: packed storage or folder the raws are written into
+        :param extension: extension of the raws written into a folder
+        :param overwrite: if raws that already exist are replaced
+        :return: the instances of each record"""
+        return bulk_create(cls, records, path, extension, overwrite)
+
+    @classmethod
+    def update_where(cls, query: Query, save: bool = False,
+                     **changes: Any) -> List["Model"]:
+        """Change the fields of all instances that match the query at once,
+        see :func:`~panda_core_data.bulk.update_where`
+
+        :param query: a TinyDB query or a function that receives an instance
+        :param save: if the raws of the changed instances are written
+        :param changes: the new value of each changed field
+        :return: the changed instances"""
+        return update_where(cls, query, save, **changes)
+
+    @classmethod
+    def delete_where(cls, query: Query, delete_raws: bool = False
+                     ) -> List["Model"]:
+        """Remove all instances that match the query at once, see
+        :func:`~panda_core_data.bulk.delete_where`
+
+        :param query: a TinyDB query or a function that receives an instance
+        :param delete_raws: if the raws of the removed instances are deleted
+        :return: the removed instances"""
+        return delete_where(cls, query, delete_raws)
+
+    @classmethod
+    def order_by(cls, field_name: str, descending: bool = False
+                 ) -> SortedView:
+        """Get the instances of the model sorted by a field, the view is
+        cached and kept sorted while instances are added, removed or changed,
+        see :class:`~panda_core_data.sorted_views.SortedView`
+
+        :param field_name: the field the instances are sorted by
+        :param descending: if the greatest values come first
+        :return: the view"""
+        return order_by(cls, field_name, descending)
+
+    @classmethod
+    def aggregate(cls, group_by: Union[str, Sequence[str], None] = None,
+                  **aggregations: Aggregation) -> Dict[Any, Any]:
+        """Aggregate the fields of all instances of the model, the result is
+        cached until an instance changes, see
+        :func:`~panda_core_data.aggregations.aggregate`
+
+        :param group_by: field, or fields, the instances are grouped by
+        :param aggregations: the name of each result and a tuple of the field
+                             name and `sum`, `mean`, `min`, `max` or `count`
+        :return: the results, for each group if `group_by` is used"""
+        return aggregate(cls, group_by, **aggregations)
+
+    @classmethod
+    def search(cls, query: str, limit: Optional[int] = None
+               ) -> List["Model"]:
+        """Search the `search_fields` of the instances of the model for the
+        tokens of the query, or tokens starting with them, see
+        :class:`~panda_core_data.search.SearchIndex`
+
+        :param query: the searched text
+        :param limit: how many instances are returned at most
+        :return: the instances, the most relevant first
+        :raise PCDTypeError: If the model has no `search_fields`"""
+        return search_index(cls).search(query, limit)
+
+    @classmethod
+    def precompute_derived(cls, *names: str) -> int:
+        """Compute the derived fields of all instances at once, see
+        :func:`~panda_core_data.derived.derived`
+
+        :param names: the derived fields to compute, all of them by default
+        :return: how many values were computed"""
+        return precompute_derived(cls, names or None)
+
+    @classmethod
+    def limit_residency(cls, max_instances: Optional[int] = None,
+                        max_bytes: Optional[int] = None) -> ResidencyManager:
+        """Keep at most `max_instances` instances loaded from raws, or
+        `max_bytes` of them, in memory. The least recently used ones are
+        evicted and read from their raws again when they are accessed, see
+        :class:`~panda_core_data.residency.ResidencyManager`
+
+        :param max_instances: how many instances are kept at most
+        :param max_bytes: how many bytes the kept instances use at most
+        :return: the manager, with the hit, miss and eviction counters"""
+        return limit_residency(cls, max_instances, max_bytes)
+
     # def setup_values(self, value, default_value, default_min, default_max):
     #    try:
     #        current_value = value.get("default_value", None)
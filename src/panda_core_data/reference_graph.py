@@ -0,0 +1,275 @@
+'''Graph of the :class:`~panda_core_data.references.Ref` fields between the
+instances of a core, used to answer queries like "what is needed to craft X"
+or "what uses X".
+
+.. code:: python
+
+    graph = data_core.reference_graph
+
+    # everything needed to craft a sword, directly or not
+    graph.closure(sword)
+
+    # every recipe that uses iron, directly or not
+    graph.closure(iron, reverse=True)
+
+The adjacency lists are built once and kept up to date, only the instances
+that are added, removed or have a reference field changed have their edges
+changed. The results of :meth:`ReferenceGraph.closure` and
+:meth:`ReferenceGraph.shortest_path` are kept until any edge changes.
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from collections import deque
+from functools import partial
+from threading import RLock
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Set, Tuple)
+
+from .data_type import DataType
+from .references import reference_fields
+
+Adjacency = Dict[int, List[Any]]
+
+
+class ReferenceGraph():
+    """Forward and reverse adjacency of the references of all instances of a
+    core. Instances are compared by identity.
+
+    :param data_core: the core which the graph belongs to"""
+
+    def __init__(self, data_core: "panda_core_data.DataCore"):
+        self.data_core = data_core
+        self.lock = RLock()
+        # the types with reference fields and the listener added to each one
+        self._listeners: Dict[type, Callable] = {}
+        # the types whose edges are read again before the next query
+        self._stale: Set[type] = set()
+        # the linked instances of each type, the instances each instance
+        # references and the instances that reference each instance
+        self._sources: Dict[type, Dict[int, Any]] = {}
+        self._forward: Adjacency = {}
+        self._reverse: Dict[int, Dict[int, Any]] = {}
+        self._cache: Dict[Tuple[Any, ...], Any] = {}
+
+    def _data_types(self) -> List[type]:
+        return self.data_core.all_templates + self.data_core.all_models
+
+    def _watch(self):
+        "Listen to the types of the core with reference fields"
+        data_types = [data_type for data_type in self._data_types()
+                      if reference_fields(data_type)]
+        if data_types == list(self._listeners):
+            return
+
+        for data_type in set(self._listeners).difference(data_types):
+            self._unlink_type(data_type)
+            self._stale.discard(data_type)
+            listener = self._listeners.pop(data_type)
+            if listener in data_type.wrapper.listeners:
+                data_type.wrapper.listeners.remove(listener)
+        for data_type in data_types:
+            if data_type not in self._listeners:
+                listener = partial(self._changed, data_type)
+                self._listeners[data_type] = listener
+                data_type.wrapper.listeners.append(listener)
+                self._stale.add(data_type)
+        # the order of the types is the order of the rebuilt edges
+        self._listeners = {data_type: self._listeners[data_type]
+                           for data_type in data_types}
+
+    # edges --------------------------------------------------------------------
+    def _link(self, data_type: type, instance: Any):
+        if not isinstance(instance, DataType):
+            return
+        field_table = instance.__dict__
+        targets = []
+        for field_name, _, many in reference_fields(data_type):
+            value = field_table.get(field_name)
+            if many and isinstance(value, list):
+                targets.extend(value)
+            else:
+                targets.append(value)
+
+        targets = [target for target in targets
+                   if isinstance(target, DataType)]
+        self._sources.setdefault(data_type, {})[id(instance)] = instance
+        if targets:
+            self._forward[id(instance)] = targets
+        for target in targets:
+            self._reverse.setdefault(id(target), {})[id(instance)] = instance
+
+    def _unlink(self, data_type: type, instance: Any):
+        sources = self._sources.get(data_type)
+        if sources is None or sources.pop(id(instance), None) is None:
+            return
+        for target in self._forward.pop(id(instance), ()):
+            referencing = self._reverse.get(id(target))
+            if referencing is not None:
+                referencing.pop(id(instance), None)
+                if not referencing:
+                    del self._reverse[id(target)]
+
+    def _unlink_type(self, data_type: type):
+        for instance in tuple(self._sources.get(data_type, {}).values()):
+            self._unlink(data_type, instance)
+
+    def _changed(self, data_type: type, added: Optional[Iterable[Any]],
+                 removed: Optional[Iterable[Any]],
+                 updated: Optional[Iterable[Any]],
+                 fields: Optional[Tuple[str, ...]]):
+        "Listener of :meth:`GroupWrapper.changed` of each type"
+        with self.lock:
+            if data_type in self._stale:
+                return
+            if added is None and removed is None and updated is None:
+                self._stale.add(data_type)
+                self._cache = {}
+                return
+
+            if fields is None or any(
+                    field_name in fields for field_name, _, _
+                    in reference_fields(data_type)):
+                relinked = tuple(updated)
+            else:
+                relinked = ()
+            changed = False
+            for instance in (*removed, *relinked):
+                self._unlink(data_type, instance)
+                changed = True
+            for instance in (*added, *relinked):
+                self._link(data_type, instance)
+                changed = True
+            if changed:
+                self._cache = {}
+
+    def _refresh(self):
+        "Read the edges of the new types and of the types marked as stale"
+        with self.lock:
+            self._watch()
+            if not self._stale:
+                return
+            for data_type in self._listeners:
+                if data_type in self._stale:
+                    self._unlink_type(data_type)
+                    for instance in data_type.wrapper.snapshot():
+                        self._link(data_type, instance)
+            self._stale = set()
+            self._cache = {}
+
+    def _neighbours(self, instance: Any, reverse: bool) -> Tuple[Any, ...]:
+        "Copy of the adjacency of the instance, it's safe to iterate"
+        if reverse:
+            return tuple(self._reverse.get(id(instance), {}).values())
+        return tuple(self._forward.get(id(instance), ()))
+
+    def references(self, instance: Any) -> Tuple[Any, ...]:
+        """Get the instances referenced by the instance
+
+        :param instance: the instance that holds the references
+        :return: the referenced instances, in the order of the fields"""
+        self._refresh()
+        return self._neighbours(instance, False)
+
+    def referenced_by(self, instance: Any) -> Tuple[Any, ...]:
+        """Get the instances that reference the instance
+
+        :param instance: the referenced instance
+        :return: the instances that have a reference to it"""
+        self._refresh()
+        return self._neighbours(instance, True)
+
+    def bfs(self, start: Any, reverse: bool = False,
+            max_depth: Optional[int] = None) -> Iterator[Tuple[Any, int]]:
+        """Visit the instances reachable from `start` breadth first, each one
+        only once.
+
+        :param start: the first instance
+        :param reverse: if the references should be followed backwards
+        :param max_depth: how many references to follow, all by default
+        :return: generator of the instances and their distance from `start`,
+                 `start` isn't included"""
+        self._refresh()
+        visited = {id(start)}
+        queue = deque([(start, 0)])
+        while queue:
+            instance, depth = queue.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for neighbour in self._neighbours(instance, reverse):
+                if id(neighbour) not in visited:
+                    visited.add(id(neighbour))
+                    yield neighbour, depth + 1
+                    queue.append((neighbour, depth + 1))
+
+    def dfs(self, start: Any, reverse: bool = False) -> Iterator[Any]:
+        """Visit the instances reachable from `start` depth first, in
+        preorder, each one only once.
+
+        :param start: the first instance
+        :param reverse: if the references should be followed backwards
+        :return: generator of the instances, `start` isn't included"""
+        self._refresh()
+        visited = {id(start)}
+        stack = [iter(self._neighbours(start, reverse))]
+        while stack:
+            neighbour = next(stack[-1], None)
+            if neighbour is None:
+                stack.pop()
+            elif id(neighbour) not in visited:
+                visited.add(id(neighbour))
+                yield neighbour
+                stack.append(iter(self._neighbours(neighbour, reverse)))
+
+    def closure(self, start: Any, reverse: bool = False) -> Tuple[Any, ...]:
+        """Get all instances reachable from `start`, the result is cached
+        until a reference changes.
+
+        :param start: the first instance
+        :param reverse: if the references should be followed backwards
+        :return: the instances in breadth first order"""
+        self._refresh()
+        key = ("closure", id(start), reverse)
+        cached = self._cache.get(key)
+        if cached is None:
+            # the instances are kept with the result so their ids can't be
+            # reused while it's cached
+            cached = (start, tuple(instance for instance, _
+                                   in self.bfs(start, reverse)))
+            self._cache[key] = cached
+        return cached[1]
+
+    def shortest_path(self, source: Any, target: Any, reverse: bool = False
+                      ) -> Optional[Tuple[Any, ...]]:
+        """Get the path with the least references between two instances, the
+        result is cached until a reference changes.
+
+        :param source: the first instance
+        :param target: the last instance
+        :param reverse: if the references should be followed backwards
+        :return: the instances of the path, including `source` and `target`,
+                 or None if `target` can't be reached"""
+        self._refresh()
+        key = ("path", id(source), id(target), reverse)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached[2]
+
+        previous = {id(source): None}
+        queue = deque([source])
+        path = None
+        while queue:
+            instance = queue.popleft()
+            if instance is target:
+                path = []
+                while instance is not None:
+                    path.append(instance)
+                    instance = previous[id(instance)]
+                path = tuple(reversed(path))
+                break
+            for neighbour in self._neighbours(instance, reverse):
+                if id(neighbour) not in previous:
+                    previous[id(neighbour)] = instance
+                    queue.append(neighbour)
+
+        self._cache[key] = (source, target, path)
+        return path
@@ -0,0 +1,285 @@
+'''Reference fields, which point from an instance to instances of other models.
+
+In the raws a reference is written as the key of the referenced instance, by
+default the value of it's `name` field. After the raws are loaded, all
+references of a model are replaced by the instances they point to in a single
+pass, using an index of the keys of each referenced model.
+
+.. code:: python
+
+    from typing import List
+
+    from panda_core_data.model import Model
+    from panda_core_data.references import Ref
+
+    class Recipe(Model):
+        name: str
+        result: Ref["Item"]
+        ingredients: List[Ref["Item"]]
+
+    for recipe in Recipe:
+        print(recipe.result.name)
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from dataclasses import fields
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from weakref import WeakValueDictionary
+
+from .custom_exceptions import PCDDanglingReference
+
+ReferenceField = Tuple[str, str, bool]
+
+SCALARS = frozenset((str, int, float, bool, type(None)))
+"Types that :func:`plain_value` never needs to transform"
+
+
+class Ref():
+    """Annotation of a field that references instances of another model,
+    ``Ref["Item"]`` references the model with the `data_name` "Item". It can
+    be used inside :data:`~typing.Optional` and :class:`~typing.List`."""
+    model_name: str = ""
+    _annotations: Dict[str, type] = {}
+
+    def __class_getitem__(cls, model_name: str) -> type:
+        annotation = cls._annotations.get(model_name)
+        if annotation is None:
+            annotation = type(f"Ref[{model_name!r}]", (cls,),
+                              {"model_name": model_name})
+            cls._annotations[model_name] = annotation
+        return annotation
+
+
+def _parse_annotation(annotation: Any) -> Optional[Tuple[str, bool]]:
+    if isinstance(annotation, type) and issubclass(annotation, Ref):
+        return annotation.model_name, False
+
+    origin = getattr(annotation, "__origin__", None)
+    args = getattr(annotation, "__args__", None) or ()
+    if origin is Union:
+        parsed = [_parse_annotation(arg) for arg in args
+                  if arg is not type(None)]
+        if len(parsed) == 1:
+            return parsed[0]
+    elif origin in (list, List) and args:
+        parsed = _parse_annotation(args[0])
+        if parsed and not parsed[1]:
+            return parsed[0], True
+    return None
+
+
+def reference_fields(data_type: type) -> Tuple[ReferenceField, ...]:
+    """Get the reference fields of the type, they are found only the first
+    time.
+
+    :param data_type: a :class:`~panda_core_data.data_type.DataType` class
+    :return: tuples of the field name, the name of the referenced model and
+             if the field is a list of references"""
+    found = data_type.__dict__.get("_reference_fields")
+    if found is None:
+        found = []
+        for current_field in fields(data_type):
+            parsed = _parse_annotation(current_field.type)
+            if parsed:
+                found.append((current_field.name, *parsed))
+        found = tuple(found)
+        data_type._reference_fields = found  # pylint: disable=protected-access
+    return found
+
+
+def to_key(value: Any) -> Any:
+    """Transform resolved references back into the keys of the instances
+
+    :param value: value of a reference field
+    :return: the key, or list of keys, of the referenced instances"""
+    from .data_type import DataType
+
+    if isinstance(value, DataType):
+        return getattr(value, value.key_field)
+    if isinstance(value, list):
+        return [to_key(item) for item in value]
+    return value
+
+
+def dereferenced_items(instance: Any) -> Iterator[Tuple[str, Any]]:
+    """Same as :meth:`~panda_core_data.data_type.DataType.items`, but the
+    reference fields contain the keys of the referenced instances, so it can
+    be written into a raw.
+
+    :param instance: the instance to be read"""
+    references = {field_name for field_name, _, _
+                  in reference_fields(type(instance))}
+    for field_name, value in instance.items():
+        yield field_name, to_key(value) if field_name in references else value
+
+
+def plain_value(value: Any) -> Any:
+    """Transform :class:`~panda_core_data.data_type.DataType` instances inside
+    the value into dictionaries, with their references as keys, so the value
+    only contains builtin types. Values that don't contain any instance are
+    returned as they are.
+
+    :param value: value of a field
+    :return: the transformed value"""
+    if value.__class__ in SCALARS:
+        return value
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            if item.__class__ not in SCALARS:
+                return [plain_value(item) for item in value]
+        return value
+    if isinstance(value, dict):
+        for item in value.values():
+            if item.__class__ not in SCALARS:
+                return {key: plain_value(item) for key, item in value.items()}
+        return value
+
+    from .data_type import DataType
+
+    if isinstance(value, DataType):
+        return {key: plain_value(item) for key, item
+                in dereferenced_items(value)}
+    return value
+
+
+class ReferenceResolver():
+    """Resolves the reference fields of all instances of a core. The key
+    index of each referenced model is built once and kept until an instance
+    of that model is added or removed or it's `key_field` changes.
+
+    :param data_core: the core which the resolver belongs to"""
+
+    def __init__(self, data_core: "panda_core_data.DataCore"):
+        self.data_core = data_core
+        self._indexes: Dict[str, Tuple[type, Dict[Any, Any]]] = {}
+        self._watched: Dict[str, type] = {}
+
+    def invalidate(self, model_name: Optional[str] = None):
+        """Discard the key index of the model, or of all models
+
+        :param model_name: the `data_name` of the model"""
+        if model_name is None:
+            self._indexes = {}
+        else:
+            self._indexes.pop(model_name, None)
+
+    def _changed(self, model_type: type, added: Optional[Iterable[Any]],
+                 removed: Optional[Iterable[Any]],
+                 updated: Optional[Iterable[Any]],
+                 changed_fields: Optional[Tuple[str, ...]]):
+        "Listener of :meth:`GroupWrapper.changed` of the indexed models"
+        if (updated is not None and not added and not removed and
+                changed_fields is not None and
+                model_type.key_field not in changed_fields):
+            return
+        self.invalidate(model_type.data_name)
+
+    def key_index(self, model_name: str) -> Dict[Any, Any]:
+        """Get the index of the model, which maps the key of each instance to
+        the instance
+
+        :param model_name: the `data_name` of the model
+        :raise PCDTypeError: If the model doesn't exist"""
+        model_type = self.data_core.get_model_type(model_name)
+        cached = self._indexes.get(model_name)
+        if cached is not None and cached[0] is model_type:
+            return cached[1]
+
+        if self._watched.get(model_name) is not model_type:
+            self._watched[model_name] = model_type
+            model_type.wrapper.listeners.append(
+                partial(self._changed, model_type))
+
+        key_field = model_type.key_field
+        # the index doesn't keep weak instances alive
+        index = WeakValueDictionary() if model_type.wrapper.weak else {}
+        for instance in model_type.wrapper.snapshot():
+            key = instance.__dict__.get(key_field)
+            if key is not None:
+                index[key] = instance
+        self._indexes[model_name] = (model_type, index)
+        return index
+
+    def resolve_fields(self, data_type: type, field_table: Dict[str, Any],
+                       source: str) -> List[str]:
+        """Replace the keys in the reference fields of the field table by the
+        instances they point to.
+
+        :param data_type: the type of the instance of the field table
+        :param field_table: the `__dict__` of the instance
+        :param source: the raw file or the name of the instance, used in the
+                       errors
+        :return: a message for each reference that couldn't be found"""
+        errors = []
+        for field_name, model_name, many in reference_fields(data_type):
+            if field_name not in field_table:
+                continue
+            value = field_table[field_name]
+            index = self.key_index(model_name)
+
+            if many and isinstance(value, list):
+                resolved = []
+                for key in value:
+                    resolved.append(self._resolve(index, key, model_name,
+                                                  field_name, source, errors))
+                field_table[field_name] = resolved
+            else:
+                field_table[field_name] = self._resolve(
+                    index, value, model_name, field_name, source, errors)
+        return errors
+
+    @staticmethod
+    def _resolve(index: Dict[Any, Any], key: Any, model_name: str,
+                 field_name: str, source: str, errors: List[str]) -> Any:
+        if key is None or not isinstance(key, (str, int)):
+            return key
+        try:
+            return index[key]
+        except KeyError:
+            errors.append(f"{source}: field '{field_name}': dangling "
+                          f"reference to {model_name} {key!r}")
+            return key
+
+    def resolve_instances(self, data_type: type, instances: Iterable[Any]
+                          ) -> List[str]:
+        """Resolve the reference fields of the instances of a type in a
+        single pass
+
+        :param data_type: the type of the instances
+        :param instances: the instances to be resolved
+        :return: a message for each reference that couldn't be found"""
+        if not reference_fields(data_type):
+            return []
+
+        errors = []
+        for instance in instances:
+            source = instance.raw_file or f"instance of {data_type.data_name}"
+            errors.extend(self.resolve_fields(data_type, instance.__dict__,
+                                              source))
+        data_type.wrapper.changed()
+        return errors
+
+    def resolve(self, raise_errors: bool = True) -> List[str]:
+        """Resolve the reference fields of all instances of the core, one
+        type at a time.
+
+        :param raise_errors: if an exception should be raised when a
+                             reference couldn't be found
+        :return: a message for each reference that couldn't be found
+        :raise PCDDanglingReference: If `raise_errors` is True and any
+                                     reference couldn't be found"""
+        errors = []
+        for template_type in self.data_core.all_templates:
+            instanced = template_type.instanced()
+            if instanced:
+                errors.extend(self.resolve_instances(template_type,
+                                                     [instanced]))
+
+        for model_type in self.data_core.all_models:
+            errors.extend(self.resolve_instances(
+                model_type, model_type.wrapper.snapshot()))
+
+        if errors and raise_errors:
+            raise PCDDanglingReference(errors)
+        return errors
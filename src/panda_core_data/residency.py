@@ -0,0 +1,306 @@
+'''Bounded residency of the instances of a model, for mods with more
+instances than should be kept in memory. The instances loaded from raws that
+weren't used recently are evicted, only a stub with the storage of their raw
+is kept, and they are read from the raw again when they are accessed.
+
+.. code:: python
+
+    residency = Items.limit_residency(max_instances=10000)
+    Items.wrapper.instances[0].name  # read from the raw if it was evicted
+    print(residency.hits, residency.misses, residency.evictions)
+
+While a limit is set, every attribute read of an instance of the model goes
+through :func:`resident_getattribute`, which is slower than a plain attribute
+read, models without a limit aren't affected.
+
+Assigning a field marks the instance as changed, but changing a list, dict or
+set field in place doesn't. A shallow copy of those fields is kept when the
+instance is loaded and compared before evicting it, instances with a field
+changed in place are kept in memory until they are saved. Changes deeper than
+that, like appending into a list inside a list, aren't seen and must be
+followed by assigning the field again.
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from collections import OrderedDict
+from copy import copy
+import sys
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from .custom_exceptions import PCDTypeError
+from .derived import discard_derived
+
+STUB_KEY = "_evicted"
+"Key that marks the field table of an evicted instance"
+
+MUTABLE_TYPES = (list, dict, set, bytearray)
+"Types of the field values that are compared before evicting an instance"
+
+_object_getattribute = object.__getattribute__
+
+
+def resident_getattribute(instance: Any, name: str) -> Any:
+    """`__getattribute__` of the models with a residency limit, it reads an
+    evicted instance from it's raw before any attribute is read and marks
+    the instance as recently used"""
+    field_table = _object_getattribute(instance, "__dict__")
+    residency = _object_getattribute(instance, "_residency")
+    if STUB_KEY in field_table:
+        residency.materialize(instance)
+    else:
+        residency.touch(instance)
+    return _object_getattribute(instance, name)
+
+
+def field_table_size(field_table: Dict[str, Any]) -> int:
+    """Estimate how many bytes a field table keeps in memory, the table and
+    it's values are counted but not what the values reference
+
+    :param field_table: the `__dict__` of the instance
+    :return: the size in bytes"""
+    getsizeof = sys.getsizeof
+    return getsizeof(field_table) + sum(map(getsizeof, field_table.values()))
+
+
+class ResidencyManager():
+    """Keeps at most `max_instances` instances of a type, or instances with a
+    total of `max_bytes`, loaded from raws in memory and evicts the least
+    recently used ones. Instances that weren't loaded from a raw, or were
+    changed and not saved yet, are never evicted and aren't counted.
+
+    Use :meth:`~panda_core_data.model.Model.limit_residency` to set the
+    limits of a model instead of creating a new one.
+
+    :param data_type: the type of the instances
+    :param max_instances: how many instances are kept at most
+    :param max_bytes: how many bytes the kept instances use at most, see
+                      :func:`field_table_size`
+    :raise PCDTypeError: If no limit was supplied"""
+    def __init__(self, data_type: type, max_instances: Optional[int] = None,
+                 max_bytes: Optional[int] = None):
+        # pylint: disable=protected-access
+        self.data_type = data_type
+        self.lock = data_type.wrapper.lock
+        self.max_instances: Optional[int] = None
+        self.max_bytes: Optional[int] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # the resident instances by their id, the least recently used first
+        self._resident: "OrderedDict[int, Any]" = OrderedDict()
+        self._sizes: Dict[int, int] = {}
+        # shallow copies of the mutable fields, to see changes done in place
+        self._copies: Dict[int, Dict[str, Any]] = {}
+        self.resident_bytes = 0
+        self._loading: Set[int] = set()
+
+        with self.lock:
+            self.set_limits(max_instances, max_bytes)
+            data_type._residency = self
+            data_type.__getattribute__ = resident_getattribute
+            data_type.wrapper.listeners.append(self._changed)
+            self._add_all(data_type.wrapper.snapshot())
+
+    @property
+    def resident(self) -> int:
+        "How many evictable instances are in memory"
+        return len(self._resident)
+
+    def set_limits(self, max_instances: Optional[int] = None,
+                   max_bytes: Optional[int] = None):
+        """Change the limits and evict the instances over them
+
+        :param max_instances: how many instances are kept at most
+        :param max_bytes: how many bytes the kept instances use at most
+        :raise PCDTypeError: If no limit was supplied"""
+        if max_instances is None and max_bytes is None:
+            raise PCDTypeError("Either max_instances or max_bytes must be "
+                               "supplied")
+        with self.lock:
+            self.max_instances = max_instances
+            self.max_bytes = max_bytes
+            self._evict_over_limits()
+
+    # bookkeeping --------------------------------------------------------------
+    def touch(self, instance: Any):
+        """Mark the instance as the most recently used one
+
+        :param instance: the instance"""
+        try:
+            self._resident.move_to_end(id(instance))
+        except KeyError:
+            return
+        self.hits += 1
+
+    def _add(self, instance: Any):
+        field_table = _object_getattribute(instance, "__dict__")
+        if STUB_KEY in field_table or field_table.get("_storage") is None:
+            return
+        key = id(instance)
+        if key in self._resident:
+            self._resident.move_to_end(key)
+            return
+        size = field_table_size(field_table)
+        self._resident[key] = instance
+        self._sizes[key] = size
+        self.resident_bytes += size
+        copies = self._copy_mutable(field_table)
+        if copies:
+            self._copies[key] = copies
+
+    def _copy_mutable(self, field_table: Dict[str, Any]) -> Dict[str, Any]:
+        # pylint: disable=protected-access
+        field_index = self.data_type._field_index
+        return {name: copy(value) for name, value in field_table.items()
+                if name in field_index and isinstance(value, MUTABLE_TYPES)}
+
+    def _mutated(self, instance: Any) -> bool:
+        "If a mutable field of the instance was changed in place"
+        copies = self._copies.pop(id(instance), None)
+        if not copies:
+            return False
+        field_table = _object_getattribute(instance, "__dict__")
+        return any(field_table.get(name) != value
+                   for name, value in copies.items())
+
+    def _add_all(self, instances: Iterable[Any]):
+        for instance in instances:
+            self._add(instance)
+        self._evict_over_limits()
+
+    def _forget(self, instance: Any):
+        "Stop tracking the instance, it stays in memory"
+        key = id(instance)
+        if self._resident.pop(key, None) is not None:
+            self.resident_bytes -= self._sizes.pop(key)
+            self._copies.pop(key, None)
+
+    def _over_limits(self) -> bool:
+        return ((self.max_instances is not None and
+                 len(self._resident) > self.max_instances) or
+                (self.max_bytes is not None and
+                 self.resident_bytes > self.max_bytes))
+
+    def _evict_over_limits(self, keep: int = 0):
+        "Evict the least recently used instances, except the last `keep`"
+        while len(self._resident) > keep and self._over_limits():
+            _, instance = self._resident.popitem(last=False)
+            self.resident_bytes -= self._sizes.pop(id(instance))
+            # changed in place, it's kept like the assigned ones
+            if not self._mutated(instance):
+                self._evict(instance)
+
+    def _changed(self, added: Optional[Iterable[Any]],
+                 removed: Optional[Iterable[Any]],
+                 updated: Optional[Iterable[Any]],
+                 fields: Optional[Tuple[str, ...]]):
+        "Listener of :meth:`GroupWrapper.changed`"
+        # pylint: disable=unused-argument
+        if added is None and removed is None and updated is None:
+            return
+        with self.lock:
+            for instance in removed:
+                self._forget(instance)
+            # changed instances are kept until they are saved into their raw
+            for instance in updated:
+                self._forget(instance)
+            self._add_all(added)
+
+    def saved(self, instance: Any):
+        """The instance was saved into it's raw, so it can be evicted again
+
+        :param instance: the instance"""
+        with self.lock:
+            self._add(instance)
+            self._evict_over_limits()
+
+    # eviction -----------------------------------------------------------------
+    def _evict(self, instance: Any):
+        # pylint: disable=protected-access
+        field_table = _object_getattribute(instance, "__dict__")
+        field_index = self.data_type._field_index
+        stub = {key: value for key, value in field_table.items()
+                if key not in field_index}
+        discard_derived(stub)
+        stub["_table_cache"] = {}
+        stub[STUB_KEY] = True
+
+        # readers holding the previous field table keep seeing it
+        object.__setattr__(instance, "__dict__", stub)
+        storage = stub["_storage"]
+        storage.close()
+        # the storages keep what they read from the raw
+        storage.memory = None
+        self.evictions += 1
+
+    def materialize(self, instance: Any):
+        """Read an evicted instance from it's raw again
+
+        :param instance: the instance"""
+        # pylint: disable=protected-access
+        with self.lock:
+            field_table = _object_getattribute(instance, "__dict__")
+            key = id(instance)
+            # the raw is read through the instance, the attributes read while
+            # doing it are in the stub
+            if STUB_KEY not in field_table or key in self._loading:
+                return
+
+            self._loading.add(key)
+            try:
+                field_table = instance._read_raw()
+            finally:
+                self._loading.discard(key)
+            del field_table[STUB_KEY]
+            object.__setattr__(instance, "__dict__", field_table)
+
+            self.misses += 1
+            self._add(instance)
+            # it's kept even if it's over the limits, it's being read
+            self._evict_over_limits(1)
+
+    def is_resident(self, instance: Any) -> bool:
+        """If the fields of the instance are in memory
+
+        :param instance: the instance
+        :return: False if the instance was evicted"""
+        return STUB_KEY not in _object_getattribute(instance, "__dict__")
+
+    def close(self):
+        "Read all evicted instances again and remove the limits of the type"
+        # pylint: disable=protected-access
+        data_type = self.data_type
+        with self.lock:
+            if data_type.__dict__.get("_residency") is not self:
+                return
+            self.max_instances = self.max_bytes = None
+            for instance in data_type.wrapper.snapshot():
+                self.materialize(instance)
+            if self._changed in data_type.wrapper.listeners:
+                data_type.wrapper.listeners.remove(self._changed)
+            del data_type.__getattribute__
+            del data_type._residency
+            self._resident.clear()
+            self._sizes.clear()
+            self._copies.clear()
+            self.resident_bytes = 0
+
+
+def limit_residency(data_type: type, max_instances: Optional[int] = None,
+                    max_bytes: Optional[int] = None) -> ResidencyManager:
+    """Limit how many instances of the type loaded from raws are kept in
+    memory, the limits of a type that already has them are changed
+
+    :param data_type: the type of the instances
+    :param max_instances: how many instances are kept at most
+    :param max_bytes: how many bytes the kept instances use at most
+    :return: the manager of the type
+    :raise PCDTypeError: If no limit was supplied"""
+    with data_type.wrapper.lock:
+        residency = data_type.__dict__.get("_residency")
+        if residency is not None:
+            residency.set_limits(max_instances, max_bytes)
+            return residency
+        return ResidencyManager(data_type, max_instances, max_bytes)
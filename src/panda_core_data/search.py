@@ -0,0 +1,425 @@
+'''Inverted full-text index over string fields of a model, with token and
+prefix search ranked by relevance. The fields are chosen with the parameter
+`search_fields` of the model, the index is built after the raws are loaded
+and kept updated while instances are added, removed or changed.
+
+.. code:: python
+
+    class Items(Model, search_fields=("name", "description")):
+        name: str
+        description: str = ""
+
+    Items.search("copp")  # [Items("copper sword"), Items("copper ore")]
+
+With `DataCore(cache_folder=...)` the indexes are saved after loading and
+restored in the next load if the raws of the model didn't change.
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from bisect import bisect_left
+from collections import Counter
+from itertools import count
+from math import log
+import os
+from pathlib import Path
+import pickle
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .custom_exceptions import PCDKeyError, PCDTypeError
+from .custom_typings import PathType
+
+TOKEN_PATTERN = re.compile(r"\w+")
+"Pattern of the tokens of the fields and queries, which are case folded"
+
+PREFIX_WEIGHT = 0.5
+"How much a token that only starts with the searched token is worth"
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+CACHE_VERSION = 1
+
+
+def tokenize(text: str) -> List[str]:
+    """Split a text into case folded tokens
+
+    :param text: the text
+    :return: the tokens in the order of the text"""
+    return TOKEN_PATTERN.findall(text.casefold())
+
+
+class SearchIndex():
+    """Inverted index of the tokens of some string fields of all instances of
+    a type. Fields that aren't strings are ignored.
+
+    Use :meth:`~panda_core_data.model.Model.search` to search the index of a
+    model declared with `search_fields` instead of creating a new one.
+
+    :param data_type: the type of the instances
+    :param field_names: the fields that are indexed
+    :raise PCDKeyError: If any of the fields doesn't exist
+    :raise PCDTypeError: If the type has `weak_instances`, the index would
+                         keep them alive"""
+    def __init__(self, data_type: type, field_names: Iterable[str]):
+        # pylint: disable=protected-access
+        if data_type.wrapper.weak:
+            raise PCDTypeError(f"{data_type.data_name} has weak_instances, "
+                               "which can't be indexed for searches")
+        self.field_names = tuple(field_names)
+        self._field_set = frozenset(self.field_names)
+        for field_name in self.field_names:
+            if field_name not in data_type._field_index:
+                raise PCDKeyError(field_name)
+
+        self.data_type = data_type
+        self.lock = data_type.wrapper.lock
+
+        # each instance is a document with a number, which is also it's order
+        # when instances have the same relevance
+        self._next_document = count()
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._terms: Dict[int, Dict[str, int]] = {}
+        self._lengths: Dict[int, int] = {}
+        self._total_length = 0
+        self._instances: Dict[int, Any] = {}
+        self._document_of: Dict[int, int] = {}
+        self._vocabulary: Optional[List[str]] = None
+        self._stale = True
+
+        data_type.wrapper.listeners.append(self._changed)
+
+    # maintenance --------------------------------------------------------------
+    def _instance_terms(self, instance: Any) -> Dict[str, int]:
+        field_table = instance.__dict__
+        texts = [value for value in map(field_table.get, self.field_names)
+                 if value.__class__ is str]
+        # plain dictionaries are pickled and restored faster than counters
+        return dict(Counter(tokenize(" ".join(texts))))
+
+    def _add(self, instance: Any, terms: Dict[str, int],
+             document: Optional[int] = None):
+        if document is None:
+            document = next(self._next_document)
+        postings = self._postings
+        for term, frequency in terms.items():
+            posting = postings.get(term)
+            if posting is None:
+                posting = postings[term] = {}
+                self._vocabulary = None
+            posting[document] = frequency
+
+        length = sum(terms.values())
+        self._terms[document] = terms
+        self._lengths[document] = length
+        self._total_length += length
+        self._instances[document] = instance
+        self._document_of[id(instance)] = document
+
+    def _remove(self, instance: Any) -> Optional[int]:
+        document = self._document_of.pop(id(instance), None)
+        if document is None:
+            return None
+
+        postings = self._postings
+        for term in self._terms.pop(document):
+            posting = postings[term]
+            del posting[document]
+            if not posting:
+                del postings[term]
+                self._vocabulary = None
+        self._total_length -= self._lengths.pop(document)
+        del self._instances[document]
+        return document
+
+    def _reset(self):
+        self._next_document = count()
+        self._postings = {}
+        self._terms = {}
+        self._lengths = {}
+        self._total_length = 0
+        self._instances = {}
+        self._document_of = {}
+        self._vocabulary = None
+
+    def build(self):
+        "Index all instances of the type again"
+        with self.lock:
+            self._reset()
+            for instance in self.data_type.wrapper.snapshot():
+                self._add(instance, self._instance_terms(instance))
+            self._stale = False
+
+    def _changed(self, added: Optional[Iterable[Any]],
+                 removed: Optional[Iterable[Any]],
+                 updated: Optional[Iterable[Any]],
+                 fields: Optional[Tuple[str, ...]]):
+        "Listener of :meth:`GroupWrapper.changed`"
+        with self.lock:
+            if self._stale:
+                return
+            if added is None and removed is None and updated is None:
+                self._stale = True
+                return
+
+            for instance in removed:
+                self._remove(instance)
+            for instance in added:
+                self._add(instance, self._instance_terms(instance))
+            if fields is not None and \
+                    self._field_set.isdisjoint(fields):
+                return
+            for instance in updated:
+                document = self._document_of.get(id(instance))
+                if document is None:
+                    continue
+                terms = self._instance_terms(instance)
+                if terms != self._terms[document]:
+                    self._remove(instance)
+                    self._add(instance, terms, document)
+
+    def _current(self):
+        if self._stale:
+            with self.lock:
+                if self._stale:
+                    self.build()
+
+    def close(self):
+        "Stop updating the index and remove it from the cache"
+        with self.lock:
+            wrapper = self.data_type.wrapper
+            if self._changed in wrapper.listeners:
+                wrapper.listeners.remove(self._changed)
+            if wrapper.views.get("search") is self:
+                del wrapper.views["search"]
+
+    # search -------------------------------------------------------------------
+    def _matching_terms(self, token: str) -> Iterator[Tuple[str, float]]:
+        "The indexed terms equal to the token or starting with it"
+        if token in self._postings:
+            yield token, 1.0
+
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        for position in range(bisect_left(vocabulary, token),
+                              len(vocabulary)):
+            term = vocabulary[position]
+            if not term.startswith(token):
+                break
+            if term != token:
+                yield term, PREFIX_WEIGHT
+
+    def _token_scores(self, token: str) -> Dict[int, float]:
+        "BM25 score of the best term matching the token in each document"
+        document_count = len(self._terms)
+        average_length = self._total_length / document_count or 1
+        lengths = self._lengths
+
+        scores: Dict[int, float] = {}
+        for term, weight in self._matching_terms(token):
+            posting = self._postings[term]
+            idf = log(1 + (document_count - len(posting) + 0.5) /
+                      (len(posting) + 0.5))
+            for document, frequency in posting.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[document] /
+                                  average_length)
+                score = (weight * idf * frequency * (BM25_K1 + 1) /
+                         (frequency + norm))
+                if score > scores.get(document, 0.0):
+                    scores[document] = score
+        return scores
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Any]:
+        """Find the instances with all tokens of the query, either as a whole
+        token or as the start of one. The most relevant instances come first
+        and instances with the same relevance are in the order they were
+        added in.
+
+        :param query: the searched text
+        :param limit: how many instances are returned at most, all of them by
+                      default
+        :return: the instances"""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+
+        with self.lock:
+            self._current()
+            if not self._terms:
+                return []
+
+            scores: Optional[Dict[int, float]] = None
+            for token in tokens:
+                token_scores = self._token_scores(token)
+                if scores is None:
+                    scores = token_scores
+                else:
+                    scores = {document: score + token_scores[document]
+                              for document, score in scores.items()
+                              if document in token_scores}
+                if not scores:
+                    return []
+
+            ranked = sorted(scores, key=lambda document: (-scores[document],
+                                                          document))
+            if limit is not None:
+                ranked = ranked[:limit]
+            return [self._instances[document] for document in ranked]
+
+    # persistence --------------------------------------------------------------
+    def save(self, path: PathType, fingerprint: str):
+        """Save the index into a file, the instances are stored by their key
+
+        :param path: the file
+        :param fingerprint: fingerprint of the raws of the instances, see
+                            :func:`~panda_core_data.storages.fingerprint_raws`
+        """
+        with self.lock:
+            self._current()
+            key_field = self.data_type.key_field
+            state = {
+                "version": CACHE_VERSION,
+                "fingerprint": fingerprint,
+                "fields": self.field_names,
+                "key_field": key_field,
+                "keys": {document: instance.__dict__.get(key_field)
+                         for document, instance in self._instances.items()},
+                "postings": self._postings,
+                "terms": self._terms,
+                "lengths": self._lengths,
+            }
+
+        path = Path(path)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temporary, "wb") as cache_file:
+            pickle.dump(state, cache_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+    def restore(self, path: PathType, fingerprint: str) -> bool:
+        """Restore an index saved with :meth:`save` if it was saved with the
+        same fingerprint and fields, and the keys of the instances are the
+        same ones. Files that can't be read or aren't a saved index aren't
+        restored.
+
+        :param path: the file
+        :param fingerprint: fingerprint of the raws of the instances
+        :return: if the index was restored"""
+        try:
+            with open(path, "rb") as cache_file:
+                state = pickle.load(cache_file)
+        # a truncated or foreign pickle can raise almost anything
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+        key_field = self.data_type.key_field
+        if (not isinstance(state, dict) or
+                state.get("version") != CACHE_VERSION or
+                state.get("fingerprint") != fingerprint or
+                state.get("fields") != self.field_names or
+                state.get("key_field") != key_field or
+                not all(isinstance(state.get(name), dict) for name in
+                        ("keys", "postings", "terms", "lengths"))):
+            return False
+
+        with self.lock:
+            instances = self.data_type.wrapper.snapshot()
+            by_key = {instance.__dict__.get(key_field): instance
+                      for instance in instances}
+            keys = state["keys"]
+            if len(by_key) != len(instances) or len(keys) != len(instances):
+                return False
+            try:
+                documents = {document: by_key[key]
+                             for document, key in keys.items()}
+                total_length = sum(state["lengths"].values())
+                next_document = max(documents, default=-1) + 1
+            except (KeyError, TypeError):
+                return False
+            if documents.keys() != state["terms"].keys() or \
+                    documents.keys() != state["lengths"].keys():
+                return False
+
+            self._reset()
+            self._postings = state["postings"]
+            self._terms = state["terms"]
+            self._lengths = state["lengths"]
+            self._total_length = total_length
+            self._instances = documents
+            self._document_of = {id(instance): document
+                                 for document, instance in documents.items()}
+            self._next_document = count(next_document)
+            self._stale = False
+        return True
+
+
+def search_index(data_type: type,
+                 field_names: Optional[Iterable[str]] = None) -> SearchIndex:
+    """Get the cached :class:`SearchIndex` of the type, it's created the
+    first time it's needed
+
+    :param data_type: the type of the instances
+    :param field_names: the fields that are indexed, the `search_fields` of
+                        the type by default
+    :return: the index
+    :raise PCDTypeError: If no fields were chosen or the type has
+                         `weak_instances`
+    :raise PCDKeyError: If any of the fields doesn't exist"""
+    views = data_type.wrapper.views
+    index = views.get("search")
+    if index is None:
+        with data_type.wrapper.lock:
+            index = views.get("search")
+            if index is None:
+                field_names = tuple(field_names or
+                                    getattr(data_type, "search_fields", ()))
+                if not field_names:
+                    raise PCDTypeError(
+                        f"{data_type.data_name} has no search index, choose "
+                        "the indexed fields with the parameter "
+                        "search_fields")
+                index = SearchIndex(data_type, field_names)
+                views["search"] = index
+    return index
+
+
+def _raws_fingerprint(data_type: type) -> Optional[str]:
+    "Fingerprint of the raws of the type, None if any instance has no raw"
+    from .storages import fingerprint_raws
+
+    raw_files = {}
+    for instance in data_type.wrapper.snapshot():
+        raw_file = instance.raw_file
+        if raw_file is None:
+            return None
+        raw_files[str(raw_file)] = raw_file
+    return fingerprint_raws(raw_files.values())
+
+
+def build_search_indexes(data_core: "panda_core_data.DataCore",
+                         cache_folder: Optional[PathType] = None):
+    """Build the indexes of all models with `search_fields`. With a cache
+    folder the indexes are restored from it if the raws of the model didn't
+    change, otherwise they are built and saved into it.
+
+    :param data_core: the core of the models
+    :param cache_folder: folder of the saved indexes"""
+    if cache_folder is not None:
+        cache_folder = Path(cache_folder)
+        cache_folder.mkdir(parents=True, exist_ok=True)
+
+    for model in data_core.all_models:
+        if not getattr(model, "search_fields", ()):
+            continue
+        index = search_index(model)
+        fingerprint = None
+        if cache_folder is not None:
+            fingerprint = _raws_fingerprint(model)
+        if fingerprint is None:
+            index.build()
+            continue
+
+        path = cache_folder / f"{model.data_name}.search.pickle"
+        if not index.restore(path, fingerprint):
+            index.build()
+            index.save(path, fingerprint)
@@ -0,0 +1,450 @@
+'''Export of a loaded :class:`~panda_core_data.DataCore` into shared memory,
+so :mod:`multiprocessing` workers can read the models and templates without
+loading the raws again.
+
+The whole core is written into a single
+:class:`~multiprocessing.shared_memory.SharedMemory` segment. It contains a
+small json header describing the types and their fields, followed by a column
+of each field. Columns of integers, floats and booleans are fixed width
+arrays and columns of strings are utf-8 text with an offset table, both are
+read straight from the shared memory without copying the column. Columns of
+other values keep the pickled value of each instance, which is unpickled on
+every access.
+
+Workers get :class:`SharedRecord` instances instead of the models, with the
+same fields and mapping methods, but read only.
+
+.. code:: python
+
+    exported = data_core.export_shared()
+
+    # inside the worker
+    shared_core = attach_shared_core(exported.name)
+    for item in shared_core.get_model_type("items"):
+        print(item.name)
+
+.. note::
+
+    Before python 3.13, processes that are not started by :mod:`multiprocessing`
+    from the process that exported the core will remove the segment when they
+    exit, so attach only from workers of the exporting process.
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from array import array
+import json
+import pickle
+import struct
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Tuple,
+                    Union)
+
+from .custom_exceptions import PCDKeyError, PCDReadOnly, PCDTypeError
+from .references import plain_value, reference_fields, to_key
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # pragma: no cover
+    SharedMemory = None
+
+MAGIC = b"PCDSHM02"
+_PREFIX = struct.Struct("<8sQ")
+
+INT64 = (-2 ** 63, 2 ** 63 - 1)
+"The integers a column of integers can hold"
+
+
+def _open_segment(name: str) -> "SharedMemory":
+    if SharedMemory is None:  # pragma: no cover
+        raise PCDTypeError("Shared memory needs python 3.8 or above")
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        return SharedMemory(name=name)
+
+
+class SharedCoreExport():
+    """Handle of an exported core, the segment exists until :meth:`unlink` is
+    called.
+
+    :param segment: the shared memory segment"""
+
+    def __init__(self, segment: "SharedMemory"):
+        self.segment = segment
+        self.name: str = segment.name
+
+    def close(self):
+        "Close the segment in this process"
+        self.segment.close()
+
+    def unlink(self):
+        "Close and destroy the segment, workers can't attach anymore"
+        self.segment.close()
+        self.segment.unlink()
+
+    def __enter__(self) -> "SharedCoreExport":
+        return self
+
+    def __exit__(self, *_):
+        self.unlink()
+
+
+def _column_kind(values: List[Any]) -> str:
+    "How a column is stored, from the types of it's values"
+    present = [value for value in values if value is not None]
+    types = set(map(type, present))
+    if types == {int}:
+        if INT64[0] <= min(present) and max(present) <= INT64[1]:
+            return "int"
+    elif types == {float}:
+        return "float"
+    elif types == {bool}:
+        return "bool"
+    elif types == {str}:
+        return "str"
+    return "pickle"
+
+
+class _PayloadWriter():
+    "Writes the arrays of the columns, each one aligned to 8 bytes"
+
+    def __init__(self):
+        self.payload = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self.payload += bytes(-len(self.payload) % 8)
+        start = len(self.payload)
+        self.payload += data
+        return start
+
+    def write_column(self, values: List[Any]) -> Dict[str, Any]:
+        "Write the values and return their entry of the header"
+        kind = _column_kind(values)
+        column: Dict[str, Any] = {"kind": kind, "nulls": None}
+        if kind != "pickle" and None in values:
+            column["nulls"] = self.write(bytes(value is None
+                                               for value in values))
+
+        if kind in ("int", "float", "bool"):
+            typecode, empty = {"int": ("q", 0), "float": ("d", 0.0),
+                               "bool": ("B", False)}[kind]
+            column["values"] = self.write(array(typecode, [
+                empty if value is None else value
+                for value in values]).tobytes())
+            return column
+
+        if kind == "str":
+            encoded = [b"" if value is None else value.encode()
+                       for value in values]
+        else:
+            encoded = [pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+                       for value in values]
+        offsets = array("Q", [0])
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        column["offsets"] = self.write(offsets.tobytes())
+        column["data"] = self.write(b"".join(encoded))
+        return column
+
+
+def _check_field_names(data_type: type):
+    """Fields are attributes of :class:`SharedRecord`, so they can't have
+    the name of one of it's attributes"""
+    # pylint: disable=protected-access
+    for field_name in data_type._field_names:
+        if hasattr(SharedRecord, field_name):
+            raise PCDTypeError(
+                f"The field {field_name} of {data_type.data_name} has the "
+                "name of an attribute of SharedRecord, so it can't be "
+                "exported")
+
+
+def export_shared_core(data_core: "panda_core_data.DataCore",
+                       name: Optional[str] = None) -> SharedCoreExport:
+    """Write all model and template instances of the core into a new shared
+    memory segment.
+
+    :param data_core: the loaded core
+    :param name: name of the segment, a random one is used by default
+    :return: the handle of the segment
+    :raise PCDTypeError: If a field has the name of an attribute of
+                         :class:`SharedRecord`, like `keys` or `items`"""
+    header: Dict[str, Dict[str, Dict[str, Any]]] = {"models": {},
+                                                    "templates": {}}
+    writer = _PayloadWriter()
+
+    sections = (("templates", data_core.all_templates),
+                ("models", data_core.all_models))
+    for section, data_types in sections:
+        for data_type in data_types:
+            # pylint: disable=protected-access
+            _check_field_names(data_type)
+            field_names = data_type._field_names
+            instances = data_type.wrapper.snapshot()
+            references = {field_name for field_name, _, _
+                          in reference_fields(data_type)}
+            columns = []
+            for field_name in field_names:
+                convert = to_key if field_name in references else plain_value
+                columns.append(writer.write_column([
+                    convert(getattr(instance, field_name, None))
+                    for instance in instances]))
+            header[section][data_type.data_name] = {
+                "fields": list(field_names),
+                "count": len(instances),
+                "columns": columns,
+            }
+
+    encoded_header = json.dumps(header).encode()
+    payload_start = _PREFIX.size + len(encoded_header)
+    payload_start += -payload_start % 8
+    payload = writer.payload
+
+    segment = SharedMemory(name=name, create=True,
+                           size=max(payload_start + len(payload), 1))
+    buffer = segment.buf
+    _PREFIX.pack_into(buffer, 0, MAGIC, len(encoded_header))
+    buffer[_PREFIX.size:_PREFIX.size + len(encoded_header)] = encoded_header
+    buffer[payload_start:payload_start + len(payload)] = payload
+
+    return SharedCoreExport(segment)
+
+
+class SharedRecord():
+    """Read only view of an instance stored in shared memory. It has the same
+    fields and mapping methods as a :class:`~panda_core_data.data_type.DataType`
+    but values are read from the shared memory when accessed."""
+    __slots__ = ("_table", "_index")
+    _table: "SharedTable"
+    _index: int
+    _field_names: Tuple[str, ...] = ()
+    _field_index: Dict[str, int] = {}
+    data_name: str = ""
+
+    def __init__(self, table: "SharedTable", index: int):
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_index", index)
+
+    def _value(self, position: int) -> Any:
+        return self._table.readers[position](self._index)
+
+    def __setattr__(self, *_):
+        raise PCDReadOnly(f"Shared instances of {self.data_name} are read "
+                          "only")
+
+    __delattr__ = __setattr__
+    __setitem__ = __setattr__
+    __delitem__ = __setattr__
+
+    def __getitem__(self, key: Union[str, int]) -> Any:
+        if isinstance(key, int):
+            try:
+                key = self._field_names[key]
+            except IndexError:
+                raise PCDKeyError(key) from None
+        if key not in self._field_index:
+            raise PCDKeyError(key)
+        return self._value(self._field_index[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._field_names)
+
+    def __len__(self) -> int:
+        return len(self._field_names)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._field_index
+
+    def keys(self) -> Iterator[str]:
+        return iter(self._field_names)
+
+    def values(self) -> Iterator[Any]:
+        for position in range(len(self._field_names)):
+            yield self._value(position)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return zip(self._field_names, self.values())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.items())
+        return f"Shared {self.data_name}({fields})"
+
+
+def _record_class(data_name: str, field_names: List[str]) -> type:
+    # pylint: disable=protected-access
+    namespace = {
+        "__slots__": (),
+        "data_name": data_name,
+        "_field_names": tuple(field_names),
+        "_field_index": {name: index for index, name in enumerate(field_names)},
+    }
+    for position, field_name in enumerate(field_names):
+        if hasattr(SharedRecord, field_name):
+            raise PCDTypeError(f"The field {field_name} of {data_name} has "
+                               "the name of an attribute of SharedRecord")
+        namespace[field_name] = property(
+            lambda self, position=position: self._value(position))
+
+    return type(f"Shared{data_name}", (SharedRecord,), namespace)
+
+
+Reader = Callable[[int], Any]
+
+
+def _column_reader(column: Dict[str, Any], count: int, payload: memoryview,
+                   views: List[memoryview]) -> Reader:
+    """Function that reads the value of an instance from a column, the views
+    it creates into the payload are added into `views`"""
+    def view(start: int, size: int, typecode: str) -> memoryview:
+        created = payload[start:start + size].cast(typecode)
+        views.append(created)
+        return created
+
+    kind = column["kind"]
+    if kind in ("int", "float", "bool"):
+        typecode = {"int": "q", "float": "d", "bool": "?"}[kind]
+        values = view(column["values"], count * 8 if kind != "bool"
+                      else count, typecode)
+        read = values.__getitem__
+    else:
+        offsets = view(column["offsets"], (count + 1) * 8, "Q")
+        data = view(column["data"], offsets[count] if count else 0, "B")
+
+        if kind == "str":
+            def read(index: int) -> str:
+                return str(data[offsets[index]:offsets[index + 1]], "utf-8")
+        else:
+            def read(index: int) -> Any:
+                return pickle.loads(data[offsets[index]:offsets[index + 1]])
+
+    if column["nulls"] is None:
+        return read
+    nulls = view(column["nulls"], count, "B")
+
+    def read_nullable(index: int) -> Any:
+        return None if nulls[index] else read(index)
+    return read_nullable
+
+
+class SharedTable():
+    """All instances of a type inside the shared memory, it can be iterated
+    and indexed like the instances of a model.
+
+    :param data_name: name of the type
+    :param info: the header of the type
+    :param payload: the columns of the segment
+    :param views: list that keeps the views created into the payload, so
+                  they can be released"""
+
+    def __init__(self, data_name: str, info: Dict[str, Any],
+                 payload: memoryview, views: List[memoryview]):
+        self.data_name = data_name
+        self.field_names: Tuple[str, ...] = tuple(info["fields"])
+        self.record_class = _record_class(data_name, info["fields"])
+        self._count: int = info["count"]
+        self.readers: List[Reader] = [
+            _column_reader(column, self._count, payload, views)
+            for column in info["columns"]]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> SharedRecord:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"{self.data_name} index out of range")
+        return self.record_class(self, index)
+
+    def __iter__(self) -> Iterator[SharedRecord]:
+        record_class = self.record_class
+        for index in range(self._count):
+            yield record_class(self, index)
+
+    @property
+    def all_instances(self) -> Iterator[SharedRecord]:
+        return iter(self)
+
+    def __repr__(self) -> str:
+        return f"Shared instances of {self.data_name}: {len(self)}"
+
+
+class SharedCore():
+    """A core attached from shared memory, it only gives read access to the
+    instances. Use :func:`attach_shared_core` to create it.
+
+    :param name: name of the segment"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._segment = _open_segment(name)
+        buffer = self._segment.buf
+
+        magic, header_size = _PREFIX.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            self._segment.close()
+            raise PCDTypeError(f"The shared memory {name} doesn't contain "
+                               "an exported data core")
+
+        header = json.loads(bytes(
+            buffer[_PREFIX.size:_PREFIX.size + header_size]))
+
+        payload_start = _PREFIX.size + header_size
+        payload_start += -payload_start % 8
+        self._payload = buffer[payload_start:]
+        self._views: List[memoryview] = []
+
+        self.models = {data_name: SharedTable(data_name, info, self._payload,
+                                              self._views)
+                       for data_name, info in header["models"].items()}
+        self.templates = {data_name: SharedTable(data_name, info,
+                                                 self._payload, self._views)
+                          for data_name, info in header["templates"].items()}
+
+    def get_model_type(self, model_name: str) -> SharedTable:
+        """Get all instances of a model
+
+        :param model_name: the name of the model
+        :raise PCDTypeError: If the model wasn't exported"""
+        try:
+            return self.models[model_name]
+        except KeyError as missing:
+            raise PCDTypeError(f"Model {model_name} could not be found. The "
+                               f"available models are {list(self.models)}"
+                               ) from missing
+
+    def get_template_type(self, template_name: str
+                          ) -> Optional[SharedRecord]:
+        """Get the instance of a template
+
+        :param template_name: the name of the template
+        :return: the instance or None if the template wasn't instanced
+        :raise PCDTypeError: If the template wasn't exported"""
+        try:
+            table = self.templates[template_name]
+        except KeyError as missing:
+            raise PCDTypeError(f"Template {template_name} could not be "
+                               "found. The available templates are "
+                               f"{list(self.templates)}") from missing
+        return table[0] if table else None
+
+    def close(self):
+        """Detach from the segment, records can't be read after that"""
+        for view in self._views:
+            view.release()
+        self._payload.release()
+        self._segment.close()
+
+    def __enter__(self) -> "SharedCore":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def attach_shared_core(name: str) -> SharedCore:
+    """Attach to a core exported with :func:`export_shared_core`
+
+    :param name: name of the segment, available in
+                 :attr:`SharedCoreExport.name`
+    :return: the attached core"""
+    return SharedCore(name)
@@ -0,0 +1,238 @@
+'''Views of the instances of a model sorted by a field, they are kept sorted
+while instances are added, removed or changed, instead of sorting all
+instances again.
+
+.. code:: python
+
+    leaderboard = Items.order_by("value", descending=True)
+    first_page = leaderboard.page(0, 20)
+
+    items, cursor = leaderboard.cursor_page(limit=20)
+    while cursor is not None:
+        items, cursor = leaderboard.cursor_page(cursor, limit=20)
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from bisect import bisect_left, bisect_right
+from itertools import count
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .custom_exceptions import PCDKeyError, PCDTypeError
+from .references import to_key
+
+Cursor = Tuple[Any, ...]
+
+REBUILD_RATIO = 8
+"""If more than 1/REBUILD_RATIO of the instances are added at once, the view
+is sorted again instead of inserting each of them"""
+
+
+class SortedView():
+    """Instances of a type sorted by a field. Instances with the same value
+    keep the order they were added in and instances without the field are
+    always the last ones.
+
+    Use :meth:`~panda_core_data.model.Model.order_by` to get the cached view
+    of a model instead of creating a new one.
+
+    :param data_type: the type of the instances
+    :param field_name: the field the instances are sorted by
+    :param descending: if the greatest values come first
+    :raise PCDKeyError: If the field doesn't exist
+    :raise PCDTypeError: If the type has `weak_instances`, the view would
+                         keep them alive"""
+    def __init__(self, data_type: type, field_name: str,
+                 descending: bool = False):
+        # pylint: disable=protected-access
+        if data_type.wrapper.weak:
+            raise PCDTypeError(f"{data_type.data_name} has weak_instances, "
+                               "which can't be kept sorted")
+        if field_name not in data_type._field_index:
+            raise PCDKeyError(field_name)
+
+        self.data_type = data_type
+        self.field_name = field_name
+        self.descending = descending
+        self.lock = data_type.wrapper.lock
+
+        self._order = count()
+        # the sort keys in ascending order, the instances in the order of the
+        # view and the key of each instance by it's id
+        self._keys: List[Cursor] = []
+        self._items: List[Any] = []
+        self._key_of: Dict[int, Cursor] = {}
+        self._stale = True
+
+        data_type.wrapper.listeners.append(self._changed)
+
+    # keys ---------------------------------------------------------------------
+    def _sort_key(self, instance: Any, order: Optional[int] = None) -> Cursor:
+        value = instance.__dict__.get(self.field_name)
+        if value.__class__ is list or hasattr(value, "key_field"):
+            value = to_key(value)
+        if order is None:
+            order = next(self._order)
+
+        # descending views are the ascending keys read backwards, so the
+        # missing values and the order they were added in are inverted
+        if self.descending:
+            return (value is not None, value, -order)
+        return (value is None, value, order)
+
+    def _position(self, key: Cursor) -> int:
+        "Position in the view of the ascending position of the key"
+        index = bisect_left(self._keys, key)
+        return len(self._keys) - 1 - index if self.descending else index
+
+    # maintenance --------------------------------------------------------------
+    def _rebuild(self):
+        self._order = count()
+        keyed = sorted((self._sort_key(instance), instance)
+                       for instance in self.data_type.wrapper.snapshot())
+        self._keys = [key for key, _ in keyed]
+        self._items = [instance for _, instance in keyed]
+        if self.descending:
+            self._items.reverse()
+        self._key_of = {id(instance): key for key, instance in keyed}
+        self._stale = False
+
+    def _insert(self, instance: Any, key: Cursor):
+        index = bisect_left(self._keys, key)
+        self._keys.insert(index, key)
+        if self.descending:
+            index = len(self._keys) - 1 - index
+        self._items.insert(index, instance)
+        self._key_of[id(instance)] = key
+
+    def _remove(self, instance: Any) -> bool:
+        key = self._key_of.pop(id(instance), None)
+        if key is None:
+            return False
+        position = self._position(key)
+        del self._keys[bisect_left(self._keys, key)]
+        del self._items[position]
+        return True
+
+    def _changed(self, added: Optional[Iterable[Any]],
+                 removed: Optional[Iterable[Any]],
+                 updated: Optional[Iterable[Any]],
+                 fields: Optional[Tuple[str, ...]]):
+        "Listener of :meth:`GroupWrapper.changed`"
+        with self.lock:
+            if self._stale:
+                return
+            if added is None and removed is None and updated is None:
+                self._stale = True
+                return
+
+            for instance in removed:
+                self._remove(instance)
+
+            added = tuple(added)
+            if len(added) * REBUILD_RATIO > len(self._keys) + len(added):
+                self._stale = True
+                return
+            for instance in added:
+                self._insert(instance, self._sort_key(instance))
+
+            if fields is not None and self.field_name not in fields:
+                return
+            for instance in updated:
+                key = self._key_of.get(id(instance))
+                if key is None:
+                    continue
+                # the order it was added in is kept when the value changes
+                new_key = self._sort_key(instance, abs(key[2]))
+                if new_key[1] != key[1] or new_key[0] != key[0]:
+                    self._remove(instance)
+                    self._insert(instance, new_key)
+
+    def _current(self) -> List[Any]:
+        if self._stale:
+            with self.lock:
+                if self._stale:
+                    self._rebuild()
+        return self._items
+
+    def close(self):
+        "Stop keeping the view sorted and remove it from the cache"
+        with self.lock:
+            wrapper = self.data_type.wrapper
+            if self._changed in wrapper.listeners:
+                wrapper.listeners.remove(self._changed)
+            cached = wrapper.views.get(("order_by", self.field_name,
+                                        self.descending))
+            if cached is self:
+                del wrapper.views[("order_by", self.field_name,
+                                   self.descending)]
+
+    # readers ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._current())
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.page())
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._current()[index]
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> List[Any]:
+        """Get the instances of a page
+
+        :param offset: how many instances are skipped
+        :param limit: how many instances the page has at most, all of them
+                      by default
+        :return: the instances"""
+        with self.lock:
+            items = self._current()
+            if limit is None:
+                return items[offset:]
+            return items[offset:offset + limit]
+
+    def cursor_page(self, cursor: Optional[Cursor] = None, limit: int = 20
+                    ) -> Tuple[List[Any], Optional[Cursor]]:
+        """Get the instances after the cursor, unlike :meth:`page` no
+        instance is skipped or repeated if instances are added or removed
+        before the cursor between pages.
+
+        :param cursor: the cursor returned with the previous page, None for
+                       the first page
+        :param limit: how many instances the page has at most
+        :return: the instances and the cursor of the next page, which is None
+                 if there are no more instances"""
+        with self.lock:
+            self._current()
+            if cursor is None:
+                start = 0
+            elif self.descending:
+                start = len(self._keys) - bisect_left(self._keys, cursor)
+            else:
+                start = bisect_right(self._keys, cursor)
+
+            items = self._items[start:start + limit]
+            if not items or start + limit >= len(self._items):
+                return items, None
+            return items, self._key_of[id(items[-1])]
+
+
+def order_by(data_type: type, field_name: str, descending: bool = False
+             ) -> SortedView:
+    """Get the cached :class:`SortedView` of the type, it's created the first
+    time it's needed
+
+    :param data_type: the type of the instances
+    :param field_name: the field the instances are sorted by
+    :param descending: if the greatest values come first
+    :return: the view
+    :raise PCDKeyError: If the field doesn't exist
+    :raise PCDTypeError: If the type has `weak_instances`"""
+    views = data_type.wrapper.views
+    cache_key = ("order_by", field_name, descending)
+    view = views.get(cache_key)
+    if view is None:
+        with data_type.wrapper.lock:
+            view = views.get(cache_key)
+            if view is None:
+                view = SortedView(data_type, field_name, descending)
+                views[cache_key] = view
+    return view
@@ -1,68 +1,272 @@
+import hashlib
+import os
 from pathlib import Path
-from typing import List, Iterator
+from typing import Dict, Iterable, List, Iterator, Optional, Tuple
 
 from ..custom_typings import PathType
 from ..custom_exceptions import PCDInvalidPath, PCDRawFileNotSupported
+from .compression import strip_compression
 
 
 try:
     from .base_db import available_storages
     from .json_db import JsonDB
     from .yaml_db import YamlDB
+    from .sqlite_db import SqliteDB
+    from .binary_db import CborDB, MsgpackDB
 # I did some testing and yaml doesn't work with python.net
 except TypeError:  # pragma: no cover
     print("Yaml might be not supported")
 
 
+# the storage of each extension and how many storages were available when it
+# was built
+_storage_table: Tuple[Dict[str, type], int] = ({}, 0)
+
+
+def get_storage_table() -> Dict[str, "tinydb.storages.Storage"]:
+    """Get the dispatch table of extensions and the storage that reads them,
+    it's built again when a new storage is registered
+
+    :return: dictionary of extensions and storages, in the order the storages
+             were registered"""
+    # pylint: disable=global-statement
+    global _storage_table
+    table, count = _storage_table
+    if count != len(available_storages):
+        table = {}
+        for storage_dict in available_storages:
+            for extension in storage_dict["extensions"] or ():
+                table.setdefault(extension, storage_dict["storage"])
+        _storage_table = (table, len(available_storages))
+    return table
+
+
 def get_raw_extensions() -> List[str]:
     """Get all available extensions the package supports
 
     :return: A list of available extensions"""
-    return [ext for ext_dict in available_storages
-            for ext in ext_dict['extensions']]
+    return list(get_storage_table())
 
 
 def get_extension(path: PathType) -> str:
     """Get file extension from the path
 
     :param path: path to a file or extension
-    :return: The file extension"""
+    :return: The file extension, compressed raws return the extension before
+             the compression one, like `json` for `item.json.gz`"""
     if isinstance(path, Path):
-        extension = path.suffix
+        extension = os.path.splitext(strip_compression(path.name))[1]
     else:
         path = str(path)
         if "\\" in path or "/" in path or "." in path:
-            extension = auto_convert_to_pathlib(path).suffix
+            extension = os.path.splitext(strip_compression(
+                auto_convert_to_pathlib(path).name))[1]
         else:
             extension = path
 
     return extension.replace(".", "")
 
 
+def get_raw_name(path: PathType) -> str:
+    """Get the name of the raw, which is the file name without the
+    extension, or extensions for compressed raws like `item.json.gz`
+
+    :param path: path to the raw
+    :return: the name"""
+    return Path(strip_compression(path)).stem
+
+
 def get_storage_from_extension(extension: str) -> "tinydb.storages.Storage":
     """Returns the storage based on the file extension
 
     :return: Returns a storage object that handles the raw file"""
-    for storage_dict in available_storages:
-        if extension in storage_dict["extensions"]:
-            return storage_dict["storage"]
+    storage = get_storage_table().get(extension)
+    if storage is not None:
+        return storage
 
     raise PCDRawFileNotSupported(f"The extension {extension} is not supported "
                                  "for raws, the  available extensions are " +
                                  str(get_raw_extensions()))
 
 
+def is_packed_raw(path: PathType) -> bool:
+    """Check if the raw file is a packed storage, which has the raws of many
+    instances, like :class:`~panda_core_data.storages.sqlite_db.SqliteDB`
+
+    :param path: path to the raw file
+    :return: True if the storage of the extension is packed, False if it's
+             not packed or the extension isn't supported"""
+    storage = get_storage_table().get(get_extension(path))
+    return getattr(storage, "packed", False)
+
+
+class RawPath(type(Path())):
+    """Path found while a folder was read with :func:`os.scandir`. It keeps
+    the :class:`os.DirEntry` of the file, so :meth:`is_file`, :meth:`is_dir`
+    and :meth:`stat` reuse what the folder read already returned instead of
+    asking the file system again. Paths derived from it behave like any
+    other path."""
+    entry: Optional[os.DirEntry] = None
+    "The entry the path was found with, None for derived paths"
+
+    @classmethod
+    def from_entry(cls, entry: os.DirEntry,
+                   folder: Optional["RawPath"] = None) -> "RawPath":
+        """Create the path of the entry
+
+        :param entry: the entry returned by :func:`os.scandir`
+        :param folder: the path of the folder that was read, joining the name
+                       to it is faster than parsing the whole path
+        :return: the path"""
+        path = folder / entry.name if folder is not None else cls(entry.path)
+        path.entry = entry
+        return path
+
+    def is_file(self) -> bool:
+        entry = self.entry
+        return entry.is_file() if entry is not None else super().is_file()
+
+    def is_dir(self) -> bool:
+        entry = self.entry
+        return entry.is_dir() if entry is not None else super().is_dir()
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        "The stat of the entry, it's cached after the first call"
+        entry = self.entry
+        if entry is None:
+            return super().stat(follow_symlinks=follow_symlinks)
+        return entry.stat(follow_symlinks=follow_symlinks)
+
+    @property
+    def fingerprint(self) -> Tuple[int, int]:
+        """The modification time, in nanoseconds, and the size of the file,
+        which change when the file is written"""
+        stat = self.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+
+def scan_folder(path: PathType) -> List[RawPath]:
+    """Read the folder once, getting everything inside of it
+
+    :param path: the folder
+    :return: the files and folders inside of it"""
+    folder = RawPath(auto_convert_to_pathlib(path))
+    with os.scandir(folder) as entries:
+        return [RawPath.from_entry(entry, folder) for entry in entries]
+
+
 def raw_glob_iterator(path: PathType, excluded_ext: bool = False
                       ) -> Iterator[Path]:
-    """Iterate along the path yielding the raw file.
+    """Iterate along the path yielding the raw file, the sub folders aren't
+    read.
 
     :yields: The file"""
-    path = auto_convert_to_pathlib(path)
+    return iter_raw_files(path, excluded_ext, recursive=False)
+
+
+def iter_raw_files(path: PathType, excluded_ext: List[str] = False,
+                   recursive: bool = True) -> Iterator[RawPath]:
+    """Iterate along the path yielding the raw files while the folders are
+    read, so huge trees don't need to be listed first. Each folder is read a
+    single time with :func:`os.scandir` and the extension of each file is
+    checked against the table of :func:`get_storage_table`.
+
+    :param path: source folder
+    :param excluded_ext: extensions to be ignored
+    :param recursive: if the sub folders should be read as well
+    :yields: The raw files, in the order the file system returns them"""
+    extensions = set(get_storage_table())
+    if excluded_ext:
+        extensions.difference_update(excluded_ext)
+
+    splitext = os.path.splitext
+    from_entry = RawPath.from_entry
+    pending = [RawPath(auto_convert_to_pathlib(path))]
+    while pending:
+        folder = pending.pop()
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if recursive:
+                        pending.append(from_entry(entry, folder))
+                elif splitext(strip_compression(entry.name)
+                              )[1][1:] in extensions:
+                    yield from_entry(entry, folder)
+
+
+def fingerprint_raws(raw_files: Iterable[Path],
+                     root: Optional[PathType] = None) -> str:
+    """Get a fingerprint that changes when any of the raws is added, removed
+    or written. The stat of the paths of :func:`iter_raw_files` is reused.
+
+    :param raw_files: the raws
+    :param root: the paths are relative to it, so moving the whole folder
+                 keeps the fingerprint
+    :return: hexadecimal digest"""
+    prefix = os.path.join(os.fspath(root), "") if root else ""
+    fingerprints = []
+    for raw_file in raw_files:
+        stat = raw_file.stat()
+        name = os.fspath(raw_file)
+        if prefix and name.startswith(prefix):
+            name = name[len(prefix):]
+        fingerprints.append(f"{name}\0{stat.st_mtime_ns}\0{stat.st_size}")
+
+    digest = hashlib.blake2b(digest_size=16)
+    for fingerprint in sorted(fingerprints):
+        digest.update(fingerprint.encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def convert_raws(source: PathType, destination: PathType, extension: str
+                 ) -> int:
+    """Write a copy of each raw inside the source folder into the destination
+    folder, keeping the same folders and names but with another format, like
+    compiling a tree of yaml raws into msgpack. Packed storages are ignored,
+    use :func:`~panda_core_data.storages.sqlite_db.pack_raws` to pack raws.
+
+    :param source: the folder of raws
+    :param destination: the folder the converted raws are written into, the
+                        raws are replaced if they exist
+    :param extension: the extension of the converted raws, with the
+                      compression one for compressed raws, like `json.gz`
+    :return: how many raws were converted
+    :raise PCDRawFileNotSupported: If the extension isn't supported or is of
+                                   a packed storage"""
+    storage_extension = get_extension(Path(f"raw.{extension}"))
+    if is_packed_raw(storage_extension):
+        raise PCDRawFileNotSupported(f"The extension {extension} is of a "
+                                     "packed storage, use pack_raws instead")
+    target_storage = get_storage_from_extension(storage_extension)
+
+    source = auto_convert_to_pathlib(source)
+    destination = Path(destination)
+    converted = 0
+    for raw_file in iter_raw_files(source):
+        if is_packed_raw(raw_file):
+            continue
+
+        storage = get_storage_from_extension(get_extension(raw_file))(raw_file)
+        try:
+            data = {table: list(documents.values())
+                    for table, documents in storage.read().items()}
+        finally:
+            storage.close()
+
+        target = (destination / raw_file.relative_to(source).parent /
+                  f"{get_raw_name(raw_file)}.{extension}")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(b"")
+        storage = target_storage(target)
+        try:
+            storage.write(data)
+        finally:
+            storage.close()
+        converted += 1
 
-    for ext in get_raw_extensions():
-        for file in path.glob(f'*.{ext}'):
-            if (not excluded_ext) or (ext not in excluded_ext):
-                yield file
+    return converted
 
 
 def is_excluded_extension(path: PathType, exclude_ext: List[str]) -> bool:
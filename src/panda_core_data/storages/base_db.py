@@ -4,6 +4,7 @@ from typing import Dict, List, Optional, Union, Callable
 from tinydb.storages import MemoryStorage, JSONStorage
 
 from ..custom_typings import DataDict, PathType
+from .compression import get_compression, open_raw
 
 class BaseDB(JSONStorage, MemoryStorage):
     """Base storage class that reads which extensions are available to feed the
@@ -22,6 +23,8 @@ class BaseDB(JSONStorage, MemoryStorage):
     :meth:`~panda_core_data.storages.base_db.BaseDB.base_write` all you need to
     do is follow the instructions contained in them"""
     extensions = False
+    packed = False
+    "If a single file has the raws of many instances"
 
     def __init_subclass__(cls):
         """Automatically generate an extension list containing the available
@@ -45,7 +48,11 @@ class BaseDB(JSONStorage, MemoryStorage):
         self.path = current_path
 
         MemoryStorage.__init__(self)
-        JSONStorage.__init__(self, current_path, **kwargs)
+        if get_compression(current_path):
+            self.kwargs = kwargs
+            self._handle = open_raw(current_path)
+        else:
+            JSONStorage.__init__(self, current_path, **kwargs)
 
     def base_read(self, load_method: Callable, use_handle: bool) -> DataDict:
         """Base method used by children classes to read the file and transforms
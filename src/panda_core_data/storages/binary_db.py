@@ -0,0 +1,78 @@
+'''Storages of raws written in binary formats, they are smaller and decoded
+much faster than json or yaml. The raws have the same structure as the json
+ones.
+
+The packages `msgpack` and `cbor2` are only needed to read or write the raws
+of their format.
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from typing import Any
+
+from tinydb.storages import MemoryStorage
+
+from ..custom_exceptions import PCDTypeError
+from ..custom_typings import DataDict, PathType
+from .base_db import BaseDB
+from .compression import open_raw
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+
+def _open_binary(storage: BaseDB, path: PathType, package: Any,
+                 package_name: str, **kwargs):
+    """Same as :meth:`BaseDB.__init__` but the file is opened in binary mode
+    """
+    from . import auto_convert_to_pathlib
+
+    if package is None:
+        raise PCDTypeError(f"The raws of {storage.extensions} need the "
+                           f"package {package_name}")
+
+    storage.path = auto_convert_to_pathlib(path)
+    MemoryStorage.__init__(storage)
+    storage.kwargs = kwargs
+    # pylint: disable=protected-access
+    storage._handle = open_raw(storage.path, binary=True)
+
+
+class MsgpackDB(BaseDB):
+    "Storage of raws written in MessagePack"
+    extensions = ["msgpack", "mpk"]
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, path: PathType, **kwargs):
+        _open_binary(self, path, msgpack, "msgpack", **kwargs)
+
+    @staticmethod
+    def _loads(data: bytes) -> DataDict:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+    def read(self) -> DataDict:
+        return self.base_read(self._loads, True)
+
+    def write(self, data: DataDict):
+        self.base_write(msgpack.packb, data, True)
+
+
+class CborDB(BaseDB):
+    "Storage of raws written in CBOR"
+    extensions = ["cbor"]
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, path: PathType, **kwargs):
+        _open_binary(self, path, cbor2, "cbor2", **kwargs)
+
+    def read(self) -> DataDict:
+        return self.base_read(cbor2.loads, True)
+
+    def write(self, data: DataDict):
+        self.base_write(cbor2.dumps, data, True)
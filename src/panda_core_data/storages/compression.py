@@ -0,0 +1,184 @@
+'''Compressed raws, like `item.json.gz` or `item.yaml.zst`. The storage of a
+compressed raw is the one of the extension before the compression one, the
+raw is decompressed when it's read and compressed again when it's written.
+The storages parse the whole raw at once, so it's decompressed in one call
+instead of being streamed.
+
+gzip is always available, zstd needs the package `zstandard` and lz4 needs
+the package `lz4`.
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+import gzip
+import io
+import os
+from pathlib import Path
+import threading
+from typing import IO, Any, Callable, Dict, Optional, Tuple, Union
+import zlib
+
+from ..custom_exceptions import PCDTypeError
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None  # pylint: disable=invalid-name
+
+_ZSTD_CONTEXTS = threading.local()
+
+
+def _gzip_decompressor() -> Any:
+    # 16 + MAX_WBITS reads the gzip header and trailer
+    return zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+
+def _gzip_compress(data: bytes) -> bytes:
+    # without the time the same raw is always compressed into the same bytes
+    return gzip.compress(data, mtime=0)
+
+
+def _zstd_decompressor() -> Any:
+    # creating the context is slower than decompressing a small raw, so each
+    # thread keeps one
+    context = getattr(_ZSTD_CONTEXTS, "decompressor", None)
+    if context is None:
+        context = _ZSTD_CONTEXTS.decompressor = zstandard.ZstdDecompressor()
+    return context.decompressobj()
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    context = getattr(_ZSTD_CONTEXTS, "compressor", None)
+    if context is None:
+        context = _ZSTD_CONTEXTS.compressor = zstandard.ZstdCompressor()
+    return context.compress(data)
+
+
+def _lz4_decompressor() -> Any:
+    return lz4.frame.LZ4FrameDecompressor()
+
+
+def _lz4_compress(data: bytes) -> bytes:
+    return lz4.frame.compress(data)
+
+
+Codec = Tuple[Callable[[], Any], Callable[[bytes], bytes], Optional[str]]
+
+CODECS: Dict[str, Codec] = {
+    "gz": (_gzip_decompressor, _gzip_compress, None),
+    "zst": (_zstd_decompressor, _zstd_compress,
+            None if zstandard else "zstandard"),
+    "lz4": (_lz4_decompressor, _lz4_compress, None if lz4 else "lz4"),
+}
+"""The function that creates a decompressor, the one that
+compresses the raw and the package they need if it isn't installed, by
+extension"""
+
+
+def get_compression(path: Union[str, Path]) -> Optional[str]:
+    """Get the compression extension of a raw with a double extension
+
+    :param path: path to the raw
+    :return: the compression extension, like `gz`, or None if the raw isn't
+             compressed"""
+    stem, _, extension = os.path.basename(path).rpartition(".")
+    if extension in CODECS and "." in stem.lstrip("."):
+        return extension
+    return None
+
+
+def strip_compression(path: Union[str, Path]) -> str:
+    """Remove the compression extension from the name of a raw
+
+    :param path: path to the raw
+    :return: the file name without the compression extension"""
+    name = os.path.basename(path)
+    if get_compression(name):
+        return os.path.splitext(name)[0]
+    return name
+
+
+class CompressedHandle():
+    """File like object used by the storages instead of the file handle of a
+    compressed raw. Reading decompresses the whole raw, writes are kept until
+    :meth:`flush`, which compresses them into the raw.
+
+    :param path: path to the compressed raw
+    :param encoding: encoding of the text, None for binary raws"""
+    def __init__(self, path: Union[str, Path], encoding: Optional[str] = None):
+        compression = get_compression(path)
+        self.decompressor, self.compress, missing_package = CODECS[
+            compression]
+        if missing_package:
+            raise PCDTypeError(f"The raws compressed with {compression} need "
+                               f"the package {missing_package}")
+
+        self.encoding = encoding
+        # pylint: disable=consider-using-with
+        self._raw = open(path, "r+b")
+        self._pending = None
+
+    def read(self) -> Union[str, bytes]:
+        self._raw.seek(0)
+        data = self.decompressor().decompress(self._raw.read())
+        return data.decode(self.encoding) if self.encoding else data
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        "Only rewinding is supported, it discards the writes not flushed"
+        if offset or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("compressed raws can only be "
+                                          "rewound")
+        self._pending = None
+        return 0
+
+    def write(self, data: Union[str, bytes]) -> int:
+        if self.encoding and isinstance(data, str):
+            data = data.encode(self.encoding)
+        if self._pending is None:
+            self._pending = []
+        self._pending.append(data)
+        return len(data)
+
+    def flush(self):
+        if self._pending is not None:
+            self._raw.seek(0)
+            self._raw.write(self.compress(b"".join(self._pending)))
+            self._raw.truncate()
+            self._pending = None
+        self._raw.flush()
+
+    def truncate(self):
+        "The raw is already truncated by :meth:`flush`"
+
+    def fileno(self) -> int:
+        return self._raw.fileno()
+
+    def close(self):
+        if not self._raw.closed:
+            self.flush()
+            self._raw.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._raw.closed
+
+
+def open_raw(path: Union[str, Path], binary: bool = False,
+             encoding: Optional[str] = None) -> IO:
+    """Open the raw for reading and writing, compressed raws are wrapped by
+    :class:`CompressedHandle`
+
+    :param path: path to the raw
+    :param binary: if the raw should be opened in binary mode
+    :param encoding: encoding of text raws
+    :return: the handle"""
+    if get_compression(path):
+        return CompressedHandle(path, None if binary else encoding or "utf-8")
+    # pylint: disable=consider-using-with
+    if binary:
+        return open(path, "r+b")
+    return open(path, "r+", encoding=encoding)
@@ -1,4 +1,4 @@
-from tinydb.storages import JSONStorage
+import json
 
 from ..custom_typings import DataDict
 from .base_db import BaseDB
@@ -8,7 +8,7 @@ class JsonDB(BaseDB):
     extensions = ["json", ]
 
     def read(self) -> DataDict:
-        return self.base_read(JSONStorage.read, False)
+        return self.base_read(json.loads, True)
 
     def write(self, data):
-        self.base_write(JSONStorage.write, data, False)
+        self.base_write(json.dumps, data, True)
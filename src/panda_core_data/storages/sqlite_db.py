@@ -0,0 +1,336 @@
+'''Storage that keeps the raws of many instances, of one model or of a whole
+mod, inside a single SQLite file.
+
+Each raw is a row with the name of it's model, the name of the raw and the
+fields encoded as json. When the data core finds a packed storage in the raw
+folders, all of it's raws are read with a single query.
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from contextlib import contextmanager
+import json
+from pathlib import Path
+import sqlite3
+from threading import Lock, RLock
+from typing import (Any, Dict, Iterable, Iterator, List, Optional, Set,
+                    Tuple)
+
+from tinydb.storages import MemoryStorage
+
+from ..constructors import merge_records
+from ..custom_exceptions import PCDInvalidPath, PCDInvalidRaw
+from ..custom_typings import PathType
+from .base_db import BaseDB
+
+Record = Dict[str, Any]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS raws (
+    model TEXT NOT NULL,
+    name TEXT NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (model, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS raws_name ON raws (name);
+"""
+
+DEFAULT_TABLE = "data"
+"The table the raws are read from and written into, same as the other raws"
+
+UPSERT = "INSERT OR REPLACE INTO raws (model, name, record) VALUES (?, ?, ?)"
+
+# the connection, it's lock, how many storages use it and the writes of the
+# current batch
+_CONNECTIONS: Dict[str, List[Any]] = {}
+_CONNECTIONS_LOCK = Lock()
+
+
+def _acquire_connection(path: str) -> List[Any]:
+    """All storages of the same file share a connection, it's closed when the
+    last one is closed"""
+    with _CONNECTIONS_LOCK:
+        shared = _CONNECTIONS.get(path)
+        if shared is None:
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.executescript(SCHEMA)
+            shared = [connection, RLock(), 0, None]
+            _CONNECTIONS[path] = shared
+        shared[2] += 1
+        return shared
+
+
+def _release_connection(path: str):
+    with _CONNECTIONS_LOCK:
+        shared = _CONNECTIONS.get(path)
+        if shared is None:
+            return
+        shared[2] -= 1
+        if shared[2] <= 0:
+            del _CONNECTIONS[path]
+            shared[0].close()
+
+
+class SqliteDB(BaseDB):
+    """Packed storage backed by SQLite. Opened with a `model` and a `name`,
+    it behaves like any other storage, reading and writing the raw of a
+    single instance, which is what
+    :meth:`~panda_core_data.data_type.DataType.reload` and
+    :meth:`~panda_core_data.data_type.DataType.save_to_file` use.
+
+    :param path: path to the SQLite file, it's created if it doesn't exist
+    :param model: name of the model of the raw
+    :param name: name of the raw"""
+    extensions = ["sqlite", "sqlite3"]
+    packed = True
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, path: PathType, model: Optional[str] = None,
+                 name: Optional[str] = None):
+        MemoryStorage.__init__(self)
+        # the storages of the raws of a file share it's path
+        self.path = path if isinstance(path, Path) else Path(path)
+        self.model = model
+        self.name = name
+        self.kwargs = {"model": model, "name": name}
+
+        self._key = str(self.path)
+        self._shared = _acquire_connection(self._key)
+        self._closed = False
+
+    def _open(self) -> Tuple[sqlite3.Connection, RLock]:
+        "The shared connection, acquired again if the storage was closed"
+        if self._closed:
+            self._shared = _acquire_connection(self._key)
+            self._closed = False
+        return self._shared[0], self._shared[1]
+
+    @contextmanager
+    def batch(self) -> Iterator["SqliteDB"]:
+        """Gather the writes of all storages of the file, like the ones of
+        :meth:`~panda_core_data.data_type.DataType.save_to_file`, and write
+        them in a single transaction when the block ends. Other threads can't
+        write into the file until then.
+
+        .. code:: python
+
+            with storage.batch():
+                for item in Items.all_instances:
+                    item.save_to_file()
+
+        :return: the storage"""
+        connection, lock = self._open()
+        with lock:
+            if self._shared[3] is not None:
+                yield self
+                return
+
+            self._shared[3] = pending = []
+            try:
+                yield self
+            finally:
+                self._shared[3] = None
+            with connection:
+                connection.executemany(UPSERT, pending)
+
+    def record_storage(self, model: str, name: str) -> "SqliteDB":
+        """Get a storage of the raw `name` of the model in the same file
+
+        :param model: name of the model
+        :param name: name of the raw
+        :return: the storage"""
+        return type(self)(self.path, model, name)
+
+    # reading ------------------------------------------------------------------
+    def read_records(self, model: Optional[str] = None
+                     ) -> List[Tuple[str, str, Record]]:
+        """Read all raws of the file, or of a model, with a single query
+
+        :param model: only read the raws of this model
+        :return: list of the model name, raw name and fields of each raw"""
+        query = "SELECT model, name, record FROM raws"
+        params: Tuple[str, ...] = ()
+        if model is not None:
+            query += " WHERE model = ?"
+            params = (model,)
+        query += " ORDER BY model, name"
+
+        connection, lock = self._open()
+        loads = json.loads
+        with lock:
+            rows = connection.execute(query, params).fetchall()
+        return [(row_model, row_name, loads(record))
+                for row_model, row_name, record in rows]
+
+    def get_record(self, model: str, name: str) -> Optional[Record]:
+        """Read a single raw through the index
+
+        :param model: name of the model
+        :param name: name of the raw
+        :return: the fields of the raw or None if it doesn't exist"""
+        connection, lock = self._open()
+        with lock:
+            row = connection.execute(
+                "SELECT record FROM raws WHERE model = ? AND name = ?",
+                (model, name)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def record_names(self, model: str) -> Set[str]:
+        """The names of the raws of a model, without reading their fields
+
+        :param model: name of the model
+        :return: the names"""
+        connection, lock = self._open()
+        with lock:
+            rows = connection.execute("SELECT name FROM raws WHERE model = ?",
+                                      (model,)).fetchall()
+        return {name for name, in rows}
+
+    def find_records(self, name: str) -> List[Tuple[str, Record]]:
+        """Find the raws of any model with the name, through the index
+
+        :param name: name of the raw
+        :return: list of the model name and fields of each raw"""
+        connection, lock = self._open()
+        with lock:
+            rows = connection.execute(
+                "SELECT model, record FROM raws WHERE name = ?",
+                (name,)).fetchall()
+        return [(model, json.loads(record)) for model, record in rows]
+
+    def read(self) -> Dict[str, Dict[int, Record]]:
+        "Read the raw of `model` and `name` in the format TinyDB uses"
+        if self.memory is None:
+            if self.name is not None:
+                record = self.get_record(self.model, self.name)
+                if record is None:
+                    raise PCDInvalidRaw(f"The raw {self.name} of {self.model} "
+                                        f"doesn't exist in {self.path}")
+            else:
+                records = self.read_records(self.model)
+                if len(records) != 1:
+                    raise PCDInvalidRaw(
+                        f"{self.path} has {len(records)} raws, a name is "
+                        "needed to read only one of them")
+                self.model, self.name, record = records[0]
+                self.kwargs = {"model": self.model, "name": self.name}
+            self.memory = {DEFAULT_TABLE: {0: record}}
+        return self.memory
+
+    # writing ------------------------------------------------------------------
+    def write_records(self, model: str, records: Iterable[Tuple[str, Record]]):
+        """Write many raws of a model in a single transaction, raws with the
+        same name are replaced. Inside :meth:`batch` they are written when the
+        batch ends.
+
+        :param model: name of the model
+        :param records: pairs of the name and the fields of each raw"""
+        connection, lock = self._open()
+        dumps = json.dumps
+        rows = ((model, str(name), dumps(record)) for name, record in records)
+        with lock:
+            pending = self._shared[3]
+            if pending is not None:
+                pending.extend(rows)
+                return
+            with connection:
+                connection.executemany(UPSERT, rows)
+
+    def delete_records(self, model: str, names: Iterable[str]) -> int:
+        """Delete many raws of a model in a single transaction. It isn't
+        deferred by :meth:`batch`, the pending writes of the raws are dropped
+        instead.
+
+        :param model: name of the model
+        :param names: names of the raws
+        :return: how many raws were deleted"""
+        connection, lock = self._open()
+        names = [str(name) for name in names]
+        with lock:
+            pending = self._shared[3]
+            if pending is not None:
+                deleted = set(names)
+                pending[:] = [row for row in pending
+                              if row[0] != model or row[1] not in deleted]
+            with connection:
+                cursor = connection.executemany(
+                    "DELETE FROM raws WHERE model = ? AND name = ?",
+                    ((model, name) for name in names))
+            return cursor.rowcount
+
+    def write(self, data: Dict[str, Any]):
+        """Write the raw of `model` and `name`, the data is in the format
+        TinyDB uses or the one used by
+        :meth:`~panda_core_data.data_type.DataType.save_to_file`"""
+        if self.model is None or self.name is None:
+            raise PCDInvalidRaw(f"A model and a name are needed to write "
+                                f"into {self.path}")
+        table = data.get(DEFAULT_TABLE) or {}
+        if isinstance(table, list):
+            table = dict(enumerate(table))
+        record = merge_records(table)
+        self.write_records(self.model, [(self.name, record)])
+        self.memory = {DEFAULT_TABLE: {0: record}}
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            _release_connection(self._key)
+
+
+def pack_raws(source: PathType, output: PathType) -> int:
+    """Convert a folder of raws into a SQLite packed storage. Raws directly
+    inside the folder, like the raws of templates, use their file name as
+    the model name, the raws inside sub folders, like the raws of models, use
+    the name of the sub folder. Packed storages inside the folder are
+    ignored.
+
+    The raws of models and templates are loaded from different folders, so
+    the folder of the raws of the models and the one of the templates must be
+    packed into different files, placed inside the folders they were packed
+    from.
+
+    :param source: the folder of raws
+    :param output: the SQLite file, the raws are added if it exists
+    :return: how many raws were written
+    :raise PCDInvalidPath: If the folder has the `models` or `templates`
+                           folders, or raws inside more than one sub folder
+    """
+    from . import (auto_convert_to_pathlib, get_extension, get_raw_name,
+                   get_storage_from_extension, iter_raw_files)
+
+    source = auto_convert_to_pathlib(source)
+    for folder_name in ("models", "templates"):
+        if (source / folder_name).is_dir():
+            raise PCDInvalidPath(
+                f"{source} has the folder {folder_name}, pack the raws of the "
+                "models and of the templates separately")
+
+    records: Dict[str, List[Tuple[str, Record]]] = {}
+    for raw_file in iter_raw_files(source):
+        storage_class = get_storage_from_extension(get_extension(raw_file))
+        if getattr(storage_class, "packed", False):
+            continue
+
+        relative = raw_file.relative_to(source)
+        if len(relative.parts) > 2:
+            raise PCDInvalidPath(
+                f"The raw {raw_file} isn't directly inside the folder of a "
+                f"model, {source} must be the folder of the raws of the "
+                "models or of the templates")
+        raw_name = get_raw_name(raw_file)
+        model = relative.parts[0] if len(relative.parts) > 1 else raw_name
+
+        storage = storage_class(raw_file)
+        try:
+            record = merge_records(storage.read().get(DEFAULT_TABLE))
+        finally:
+            storage.close()
+        records.setdefault(model, []).append((raw_name, record))
+
+    packed = SqliteDB(output)
+    try:
+        for model, model_records in records.items():
+            packed.write_records(model, model_records)
+    finally:
+        packed.close()
+    return sum(len(model_records) for model_records in records.values())
@@ -0,0 +1,155 @@
+'''Read raws as a stream of instances which aren't registered into the core,
+so a tree of any size can be processed with constant memory.
+
+.. code:: python
+
+    for item in data_core.iter_models(raws_path, model="Item", workers=4,
+                                      where=lambda item: item.value > 10):
+        print(item.name)
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from .constructors import merge_records
+from .custom_exceptions import PCDInvalidRaw, PCDValidationError
+from .custom_typings import PathType
+from .storages import (auto_convert_to_pathlib, get_extension,
+                       get_storage_from_extension, is_packed_raw)
+
+Predicate = Callable[[Any], bool]
+
+
+def read_detached(data_type: type, raw_file: PathType,
+                  validate: bool = False,
+                  default_table: Optional[str] = None) -> Any:
+    """Create an instance from the raw without registering it into the core.
+    The raw file is closed before returning, so the instance doesn't have a
+    :attr:`~panda_core_data.data_type.DataType.raw_file`.
+
+    :param data_type: the type of the instance
+    :param raw_file: path to the raw
+    :param validate: if the fields should be validated and coerced
+    :param default_table: main field in the raw file
+    :return: the instance
+    :raise PCDInvalidRaw: If the raw is invalid
+    :raise PCDValidationError: If `validate` is True and any field is
+                               invalid"""
+    raw_file = auto_convert_to_pathlib(raw_file)
+    storage = get_storage_from_extension(get_extension(raw_file))(raw_file)
+    try:
+        records = storage.read().get(default_table or data_type.DEFAULT_TABLE)
+    finally:
+        storage.close()
+
+    instance = object.__new__(data_type)
+    try:
+        # pylint: disable=protected-access
+        instance._fast_init(merge_records(records))
+    except PCDInvalidRaw as invalid_raw:
+        raise PCDInvalidRaw(f"{invalid_raw} in the file {raw_file}"
+                            ) from invalid_raw
+
+    if validate:
+        from .validators import get_validator
+
+        errors = get_validator(data_type)(instance)
+        if errors:
+            raise PCDValidationError([f"{raw_file}: {error}"
+                                      for error in errors])
+    return instance
+
+
+def read_detached_packed(data_type: type, raw_file: PathType,
+                         validate: bool = False) -> List[Any]:
+    """Create instances from the raws of the type inside a packed storage,
+    without registering them into the core
+
+    :param data_type: the type of the instances
+    :param raw_file: path to the packed raw file
+    :param validate: if the fields should be validated and coerced
+    :return: the instances
+    :raise PCDInvalidRaw: If any raw is invalid
+    :raise PCDValidationError: If `validate` is True and any field is
+                               invalid"""
+    raw_file = auto_convert_to_pathlib(raw_file)
+    storage = get_storage_from_extension(get_extension(raw_file))(raw_file)
+    try:
+        records = storage.read_records(data_type.data_name)
+    finally:
+        storage.close()
+
+    if validate:
+        from .validators import get_validator
+        validator = get_validator(data_type)
+
+    instances = []
+    for _, raw_name, record in records:
+        instance = object.__new__(data_type)
+        source = f"the raw {raw_name} of the file {raw_file}"
+        try:
+            # pylint: disable=protected-access
+            instance._fast_init(record)
+        except PCDInvalidRaw as invalid_raw:
+            raise PCDInvalidRaw(f"{invalid_raw} in {source}") from invalid_raw
+
+        if validate:
+            errors = validator(instance)
+            if errors:
+                raise PCDValidationError([f"{source}: {error}"
+                                          for error in errors])
+        instances.append(instance)
+    return instances
+
+
+def iter_detached(data_type: type, raw_files: Iterable[PathType],
+                  workers: int = 0, where: Optional[Predicate] = None,
+                  validate: bool = False) -> Iterator[Any]:
+    """Read the raws one at a time, yielding instances that aren't
+    registered into the core.
+
+    :param data_type: the type of the instances
+    :param raw_files: paths to the raws, it's only consumed as needed
+    :param workers: how many threads read the raws, with 0 they are read in
+                    the calling thread. At most twice that many raws are read
+                    ahead, the instances are yielded in the order of
+                    `raw_files`. Packed storages yield the instances of all
+                    raws of the type inside them.
+    :param where: only instances for which it returns True are yielded
+    :param validate: if the fields should be validated and coerced
+    :return: generator of the instances"""
+    def read(raw_file: PathType) -> List[Any]:
+        if is_packed_raw(raw_file):
+            return read_detached_packed(data_type, raw_file, validate)
+        return [read_detached(data_type, raw_file, validate)]
+
+    if workers:
+        instances = chain.from_iterable(_read_ahead(read, raw_files, workers))
+    else:
+        instances = chain.from_iterable(map(read, raw_files))
+
+    if where is None:
+        yield from instances
+    else:
+        yield from filter(where, instances)
+
+
+def _read_ahead(read: Callable[[PathType], Any],
+                raw_files: Iterable[PathType], workers: int) -> Iterator[Any]:
+    raw_files = iter(raw_files)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for raw_file in raw_files:
+            pending.append(executor.submit(read, raw_file))
+            if len(pending) >= workers * 2:
+                break
+
+        while pending:
+            instance = pending.popleft().result()
+            raw_file = next(raw_files, None)
+            if raw_file is not None:
+                pending.append(executor.submit(read, raw_file))
+            yield instance
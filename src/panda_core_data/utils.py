@@ -2,7 +2,9 @@
 :created: 2019-07-29
 :author: Leandro (Cerberus1746) Benedet Garcia
 '''
-from typing import Any
+from contextlib import contextmanager
+import gc
+from typing import Any, Iterator
 
 from .custom_exceptions import PCDTypeError
 
@@ -16,3 +18,17 @@ def check_if_valid_instance(an_object: Any, the_type: Any):
     if not isinstance(an_object, the_type):
         raise PCDTypeError(f"'{an_object}' is not a instance of '{the_type}' "
                            "or it's not  instanced at all")
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """Disable the garbage collector while creating many objects at once,
+    otherwise it runs over and over while they are created, without finding
+    anything to collect. It's enabled again afterwards, if it was enabled."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
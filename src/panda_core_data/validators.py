@@ -0,0 +1,299 @@
+'''Validation and coercion of the fields of
+:class:`~panda_core_data.data_type.DataType` instances against their dataclass
+annotations.
+
+A converter is compiled once per annotation and a validator once per class,
+both are plain closures, so validating an instance is just a call per field.
+The validators run in batch over all instances of a type and collect every
+error found instead of stopping at the first one.
+
+:created: 2026-10-19
+:author: Leandro (Cerberus1746) Benedet Garcia'''
+from dataclasses import fields
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+from .constructors import COERCERS
+from .custom_exceptions import PCDDanglingReference, PCDValidationError
+from .references import reference_fields
+
+Converter = Callable[[Any], Any]
+
+
+class ConversionError(ValueError):
+    "Raised by the converters when a value doesn't match the annotation"
+
+
+def _describe(annotation: Any) -> str:
+    # generic aliases, like Optional[int], are named after their origin only
+    if getattr(annotation, "__origin__", None) is not None:
+        return repr(annotation).replace("typing.", "")
+    return getattr(annotation, "__name__", None) or repr(annotation)
+
+
+def _scalar_converter(annotation: type) -> Converter:
+    coercer = COERCERS.get(annotation)
+
+    def convert(value: Any) -> Any:
+        if value.__class__ is annotation:
+            return value
+        if coercer is not None:
+            value = coercer(value)
+            if value.__class__ is annotation:
+                return value
+        elif isinstance(value, annotation):
+            return value
+        raise ConversionError(f"expected {annotation.__name__}, got "
+                              f"{value!r}")
+
+    return convert
+
+
+def _union_converter(annotation: Any) -> Converter:
+    accepts_none = type(None) in annotation.__args__
+    converters = [compile_converter(arg) for arg in annotation.__args__
+                  if arg is not type(None)]
+
+    def convert(value: Any) -> Any:
+        if value is None and accepts_none:
+            return value
+        for converter in converters:
+            try:
+                return converter(value)
+            except ConversionError:
+                continue
+        raise ConversionError(f"expected {_describe(annotation)}, got "
+                              f"{value!r}")
+
+    return convert
+
+
+def _list_converter(annotation: Any) -> Converter:
+    args = getattr(annotation, "__args__", None)
+    item_converter = compile_converter(args[0]) if args else None
+
+    def convert(value: Any) -> Any:
+        if not isinstance(value, (list, tuple)):
+            raise ConversionError(f"expected a list, got {value!r}")
+        if item_converter is None:
+            return value
+
+        converted = []
+        changed = not isinstance(value, list)
+        for index, item in enumerate(value):
+            try:
+                converted_item = item_converter(item)
+            except ConversionError as error:
+                raise ConversionError(f"[{index}]: {error}") from None
+            changed = changed or converted_item is not item
+            converted.append(converted_item)
+        return converted if changed else value
+
+    return convert
+
+
+def _dict_converter(annotation: Any) -> Converter:
+    args = getattr(annotation, "__args__", None)
+    key_converter = compile_converter(args[0]) if args else None
+    value_converter = compile_converter(args[1]) if args else None
+
+    def convert(value: Any) -> Any:
+        if not isinstance(value, dict):
+            raise ConversionError(f"expected a dict, got {value!r}")
+        if key_converter is None:
+            return value
+
+        converted = {}
+        changed = False
+        for key, item in value.items():
+            try:
+                converted_key = key_converter(key)
+                converted_item = value_converter(item)
+            except ConversionError as error:
+                raise ConversionError(f"[{key!r}]: {error}") from None
+            changed = (changed or converted_key is not key or
+                       converted_item is not item)
+            converted[converted_key] = converted_item
+        return converted if changed else value
+
+    return convert
+
+
+def _data_type_converter(annotation: type) -> Converter:
+    def convert(value: Any) -> Any:
+        if isinstance(value, annotation):
+            return value
+        if not isinstance(value, dict):
+            raise ConversionError(f"expected {annotation.__name__} or a "
+                                  f"dict with it's fields, got {value!r}")
+
+        nested = object.__new__(annotation)
+        try:
+            # pylint: disable=protected-access
+            nested._fast_init(value)
+        except Exception as error:  # pylint: disable=broad-except
+            raise ConversionError(str(error)) from None
+
+        errors = get_validator(annotation)(nested)
+        if errors:
+            raise ConversionError("; ".join(errors))
+        return nested
+
+    return convert
+
+
+def _reference_converter(annotation: type) -> Converter:
+    from .data_type import DataType
+
+    model_name = annotation.model_name
+
+    def convert(value: Any) -> Any:
+        if isinstance(value, (str, int)) and not isinstance(value, bool):
+            return value
+        if isinstance(value, DataType) and value.data_name == model_name:
+            return value
+        raise ConversionError(f"expected the key or an instance of "
+                              f"{model_name}, got {value!r}")
+
+    return convert
+
+
+def _any_converter(value: Any) -> Any:
+    return value
+
+
+def compile_converter(annotation: Any) -> Converter:
+    """Compile a function that validates and coerces values of the supplied
+    type annotation.
+
+    Supported annotations are :class:`int`, :class:`float`, :class:`str`,
+    :class:`bool`, :data:`~typing.Optional` and :data:`~typing.Union`,
+    :class:`~typing.List`, :class:`~typing.Dict`, other
+    :class:`~panda_core_data.data_type.DataType` classes, which can be
+    written in the raw as a dictionary,
+    :class:`~panda_core_data.references.Ref`, which accepts a key or an
+    instance of the referenced model, and any other class, which is checked
+    with :func:`isinstance`. Anything else is accepted as is.
+
+    :param annotation: the type annotation of the field
+    :return: function that receives a value and returns it coerced
+    :raise ConversionError: when called with an invalid value"""
+    from .data_type import DataType
+    from .references import Ref
+
+    origin = getattr(annotation, "__origin__", None)
+    if origin is Union:
+        return _union_converter(annotation)
+    if origin in (list, List):
+        return _list_converter(annotation)
+    if origin in (dict, Dict):
+        return _dict_converter(annotation)
+    if isinstance(annotation, type):
+        if issubclass(annotation, Ref):
+            return _reference_converter(annotation)
+        if issubclass(annotation, DataType):
+            return _data_type_converter(annotation)
+        return _scalar_converter(annotation)
+    return _any_converter
+
+
+def compile_validator(data_type: type
+                      ) -> Callable[[Any], List[str]]:
+    """Compile the validator of a :class:`~panda_core_data.data_type.DataType`
+    class from it's dataclass fields.
+
+    The validator coerces the fields of the instance in place and returns a
+    list with a message for each invalid field.
+
+    :param data_type: the class to be validated
+    :return: the validator"""
+    converters = [(field.name, compile_converter(field.type))
+                  for field in fields(data_type)]
+
+    def validate(instance: Any) -> List[str]:
+        errors = []
+        instance_dict = instance.__dict__
+        for field_name, converter in converters:
+            if field_name not in instance_dict:
+                continue
+            value = instance_dict[field_name]
+            try:
+                converted = converter(value)
+            except ConversionError as error:
+                errors.append(f"field '{field_name}': {error}")
+                continue
+            if converted is not value:
+                instance_dict[field_name] = converted
+        return errors
+
+    return validate
+
+
+def get_validator(data_type: type) -> Callable[[Any], List[str]]:
+    """Get the validator of the class, it's compiled only the first time.
+
+    :param data_type: the class to be validated
+    :return: the validator"""
+    validator = data_type.__dict__.get("_validator")
+    if validator is None:
+        validator = compile_validator(data_type)
+        data_type._validator = validator  # pylint: disable=protected-access
+    return validator
+
+
+def validate_instances(data_type: type, instances: Iterable[Any]
+                       ) -> List[str]:
+    """Validate all instances of the type in a single pass.
+
+    :param data_type: the class of the instances
+    :param instances: the instances to be validated
+    :return: list of all errors found, each prefixed by the raw file or the
+             type of the instance that has the error"""
+    validator = get_validator(data_type)
+    errors = []
+    for instance in instances:
+        instance_errors = validator(instance)
+        if instance_errors:
+            source = instance.raw_file or f"instance of {data_type.data_name}"
+            errors.extend(f"{source}: {error}" for error in instance_errors)
+    return errors
+
+
+def check_rows(data_type: type,
+               rows: Iterable[Tuple[int, Any, Dict[str, Any]]],
+               origin: str = "the frame"):
+    """Validate, if the core validates raws, and resolve the references of
+    new field tables before any instance is changed, like the rows of a frame
+    or the records of a bulk creation. The field tables of the instances that
+    aren't new are checked without being assigned.
+
+    :param data_type: the type of the instances
+    :param rows: the number of each row, it's instance and it's new field
+                 table, which is the field table of new instances
+    :param origin: where the rows came from, for the errors
+    :raise PCDValidationError: If any row is invalid, each error names the row
+    :raise PCDDanglingReference: If a reference field points to an instance
+                                 that doesn't exist"""
+    data_core = data_type.data_core
+    validate = getattr(data_core, "validate_raws", False)
+    if not validate and not reference_fields(data_type):
+        return
+    validator = get_validator(data_type)
+    resolver = data_core.references
+
+    errors = []
+    dangling = []
+    for row, instance, field_table in rows:
+        source = f"row {row} of {origin}"
+        if validate:
+            if instance.__dict__ is not field_table:
+                instance = object.__new__(data_type)
+                object.__setattr__(instance, "__dict__", field_table)
+            errors.extend(f"{source}: {error}"
+                          for error in validator(instance))
+        dangling.extend(resolver.resolve_fields(data_type, field_table,
+                                                source))
+
+    if errors:
+        raise PCDValidationError(errors)
+    if dangling:
+        raise PCDDanglingReference(dangling)
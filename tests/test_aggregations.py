@@ -0,0 +1,124 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+from typing import Optional
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data import aggregations
+from panda_core_data.custom_exceptions import PCDKeyError, PCDTypeError
+from panda_core_data.model import Model
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_aggregations(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(aggregations, "numpy", None)
+    DataCore(name=f"test_aggregations_{use_numpy}")
+
+    class Loot(Model, core_name=f"test_aggregations_{use_numpy}"):
+        name: str
+        kind: str
+        value: Optional[int] = None
+        weight: float = 1.0
+
+    for index, (kind, value) in enumerate([("weapon", 10), ("armor", 4),
+                                           ("weapon", 2), ("armor", None),
+                                           ("potion", 1)]):
+        Loot(f"loot_{index}", kind, value, index / 2)
+
+    assert Loot.aggregate(total=("value", "sum"), n=("value", "count"),
+                          rows=("name", "count")) == \
+        {"total": 17, "n": 4, "rows": 5}
+
+    grouped = Loot.aggregate(group_by="kind", total=("value", "sum"),
+                             average=("value", "mean"),
+                             lightest=("weight", "min"),
+                             first=("name", "min"), n=("name", "count"))
+    assert list(grouped) == ["weapon", "armor", "potion"]
+    assert grouped["weapon"] == {"total": 12, "average": 6.0, "lightest": 0.0,
+                                 "first": "loot_0", "n": 2}
+    assert grouped["armor"] == {"total": 4, "average": 4.0, "lightest": 0.5,
+                                "first": "loot_1", "n": 2}
+    assert Loot.aggregate(group_by="kind", total=("value", "sum"),
+                          average=("value", "mean"),
+                          lightest=("weight", "min"),
+                          first=("name", "min"),
+                          n=("name", "count")) is grouped
+
+    Loot.wrapper.instances[3].value = 6
+    changed = Loot.aggregate(group_by="kind", total=("value", "sum"),
+                             average=("value", "mean"),
+                             lightest=("weight", "min"),
+                             first=("name", "min"), n=("name", "count"))
+    assert changed is not grouped
+    assert changed["armor"]["total"] == 10
+
+    by_both = Loot.aggregate(group_by=("kind", "value"),
+                             heaviest=("weight", "max"))
+    assert by_both[("weapon", 10)] == {"heaviest": 0.0}
+    assert len(by_both) == 5
+
+    Loot.wrapper.instances.clear()
+    assert Loot.aggregate(total=("value", "sum"), top=("value", "max"),
+                          n=("name", "count")) == \
+        {"total": 0, "top": None, "n": 0}
+    assert Loot.aggregate(group_by="kind", n=("name", "count")) == {}
+
+    with pytest.raises(PCDKeyError):
+        Loot.aggregate(total=("missing", "sum"))
+    with pytest.raises(PCDKeyError):
+        Loot.aggregate(group_by="missing", n=("name", "count"))
+    with pytest.raises(PCDTypeError):
+        Loot.aggregate(total=("value", "median"))
+    with pytest.raises(PCDTypeError):
+        Loot.aggregate(total="value")
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_aggregations_integers(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(aggregations, "numpy", None)
+    core_name = f"test_aggregations_integers_{use_numpy}"
+    DataCore(name=core_name)
+
+    class Big(Model, core_name=core_name):
+        name: str
+        value: Optional[int] = None
+        huge: Optional[int] = None
+        rare: Optional[bool] = None
+
+    Big("first", 2 ** 60 + 1, 2 ** 70, True)
+    Big("second")
+    Big("third", 1, 1, False)
+
+    result = Big.aggregate(total=("value", "sum"), top=("value", "max"),
+                           average=("value", "mean"), huge=("huge", "sum"),
+                           rares=("rare", "sum"))
+    assert result == {"total": 2 ** 60 + 2, "top": 2 ** 60 + 1,
+                      "average": (2 ** 60 + 2) / 2, "huge": 2 ** 70 + 1,
+                      "rares": 1}
+    assert type(result["total"]) is int
+    assert type(result["top"]) is int
+    assert type(result["huge"]) is int
+    assert type(result["rares"]) is int
+    assert type(result["average"]) is float
+
+
+def test_aggregations_unhashable_group():
+    DataCore(name="test_aggregations_unhashable_group")
+
+    class Recipe(Model, core_name="test_aggregations_unhashable_group"):
+        name: str
+        tags: list
+
+    Recipe("bread", ["baked"])
+    Recipe("soup", ["boiled"])
+
+    with pytest.raises(PCDTypeError, match="grouped by tags"):
+        Recipe.aggregate(group_by="tags", n=("name", "count"))
+    with pytest.raises(PCDTypeError, match="grouped by tags"):
+        Recipe.aggregate(group_by=("name", "tags"), n=("name", "count"))
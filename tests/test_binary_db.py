@@ -0,0 +1,71 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import PCDRawFileNotSupported
+from panda_core_data.model import Model
+from panda_core_data.storages import convert_raws, get_storage_from_extension
+from panda_core_data.storages.binary_db import CborDB, MsgpackDB
+
+
+@pytest.mark.parametrize("extension, package", [("msgpack", "msgpack"),
+                                                ("cbor", "cbor2")])
+def test_binary_db(tmpdir, extension, package):
+    pytest.importorskip(package)
+    core_name = f"test_binary_db_{extension}"
+    data_core = DataCore(name=core_name)
+
+    class BinaryItem(Model, core_name=core_name):
+        name: str
+        value: int
+
+    source = tmpdir.mkdir("raws")
+    items_dir = source.mkdir("BinaryItem")
+    for index in range(5):
+        items_dir.join(f"item_{index}.yaml").write(
+            f"data:\n    - name: item_{index}\n    - value: {index}\n")
+    items_dir.join("item_5.json").write(
+        '{"data": [{"name": "item_5"}, {"value": 5}]}')
+
+    converted = tmpdir.join("converted")
+    assert convert_raws(str(source), str(converted), extension) == 6
+    assert len(converted.join("BinaryItem").listdir()) == 6
+
+    data_core.recursively_instance_model(str(converted))
+    items = sorted(BinaryItem.all_instances, key=lambda item: item.value)
+    assert [item.value for item in items] == list(range(6))
+    assert items[0].raw_file.suffix == f".{extension}"
+
+    items[0].value = 10
+    items[0].save_to_file()
+    items[0].reload()
+    assert items[0].value == 10
+
+
+def test_binary_storages():
+    assert get_storage_from_extension("msgpack") is MsgpackDB
+    assert get_storage_from_extension("cbor") is CborDB
+
+    with pytest.raises(PCDRawFileNotSupported):
+        convert_raws(".", ".", "sqlite")
+
+
+def test_convert_command_format(tmpdir):
+    pytest.importorskip("msgpack")
+    from scripts.panda_core_data_commands import main
+
+    source = tmpdir.mkdir("raws")
+    source.mkdir("Item").join("sword.json").write(
+        '{"data": [{"name": "sword"}]}')
+    main(["--convert", str(source), "--into", str(tmpdir.join("binary")),
+          "--format", "msgpack"])
+
+    storage = MsgpackDB(str(tmpdir.join("binary", "Item", "sword.msgpack")))
+    try:
+        assert storage.read() == {"data": {0: {"name": "sword"}}}
+    finally:
+        storage.close()
@@ -0,0 +1,417 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+import json
+from typing import Optional
+
+import pytest
+from tinydb import Query
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import (PCDDanglingReference,
+                                               PCDInvalidRaw, PCDKeyError,
+                                               PCDReadOnly, PCDTypeError)
+from panda_core_data.derived import derived
+from panda_core_data.model import Model
+from panda_core_data.references import Ref
+from panda_core_data.storages.sqlite_db import SqliteDB
+
+
+def _bulk_models(core_name: str):
+    data_core = DataCore(name=core_name)
+
+    class BulkMaterial(Model, core_name=core_name):
+        name: str
+
+    class BulkItem(Model, core_name=core_name):
+        name: str
+        value: int = 0
+        material: Optional[Ref["BulkMaterial"]] = None
+
+    iron = BulkMaterial("iron")
+    data_core.resolve_references()
+    return iron, BulkItem
+
+
+def _packed_record(packed: str, model: str, key: str):
+    storage = SqliteDB(packed)
+    try:
+        return storage.get_record(model, key)
+    finally:
+        storage.close()
+
+
+def test_bulk_create():
+    iron, bulk_item = _bulk_models("test_bulk_create")
+
+    instances = bulk_item.bulk_create([{"name": "sword", "value": "10",
+                                        "material": "iron"},
+                                       ("axe", 12), ("dagger",)])
+    assert [item.name for item in bulk_item.all_instances] == [
+        "sword", "axe", "dagger"]
+    assert instances[0].value == 10
+    assert instances[0].material is iron
+    assert instances[2].value == 0
+
+
+def test_bulk_create_positional():
+    iron, bulk_item = _bulk_models("test_bulk_create_positional")
+
+    positional = bulk_item.bulk_create([("mace", "7", "iron"), ["club"]])
+    assert positional[0].value == 7
+    assert positional[0].material is iron
+    assert (positional[1].value, positional[1].material) == (0, None)
+
+
+def test_bulk_create_notifies_once():
+    _, bulk_item = _bulk_models("test_bulk_create_notifies_once")
+    changes = []
+    bulk_item.wrapper.listeners.append(
+        lambda added, removed, updated, fields: changes.append(added))
+
+    bulk_item.bulk_create([("sword", 10), ("axe", 12)])
+    assert len(changes) == 1
+
+
+def test_bulk_create_sorted_view():
+    _, bulk_item = _bulk_models("test_bulk_create_sorted_view")
+    view = bulk_item.order_by("value")
+
+    bulk_item.bulk_create([("sword", 10), ("axe", 12), ("dagger",)])
+    assert [item.name for item in view.page(0, 3)] == ["dagger", "sword",
+                                                        "axe"]
+
+
+@pytest.mark.parametrize("case, rows, exception", [
+    ("split", [{"name": "bow"}, {"value": 1}], PCDInvalidRaw),
+    ("empty", [("bow", 1), ()], PCDInvalidRaw),
+    ("extra", [("bow", 1, None, "extra")], PCDTypeError),
+    ("dangling", [("bow", 1), ("spear", 2, "gold")], PCDDanglingReference),
+])
+def test_bulk_create_invalid_rows(case, rows, exception):
+    _, bulk_item = _bulk_models(f"test_bulk_create_invalid_{case}")
+
+    with pytest.raises(exception):
+        bulk_item.bulk_create(rows)
+    assert not bulk_item.wrapper.instances
+
+
+def test_bulk_create_read_only():
+    _, bulk_item = _bulk_models("test_bulk_create_read_only")
+    bulk_item._make_read_only() #pylint: disable=protected-access
+
+    with pytest.raises(PCDReadOnly):
+        bulk_item.bulk_create([("bow", 1)])
+
+
+def _raw_model(core_name: str):
+    DataCore(name=core_name)
+
+    class BulkRaw(Model, core_name=core_name):
+        name: str
+        value: int
+
+    return BulkRaw
+
+
+def test_bulk_create_raw_files(tmpdir):
+    bulk_raw = _raw_model("test_bulk_create_raw_files")
+    folder = tmpdir.join("models").join("BulkRaw")
+
+    created = bulk_raw.bulk_create([(f"item_{index}", index)
+                                    for index in range(5)], str(folder))
+    assert json.loads(folder.join("item_3.json").read()) == {
+        "data": [{"name": "item_3"}, {"value": 3}]}
+    assert created[3].raw_file == folder.join("item_3.json")
+
+
+def test_bulk_create_raw_files_saved(tmpdir):
+    bulk_raw = _raw_model("test_bulk_create_raw_files_saved")
+    folder = tmpdir.join("models").join("BulkRaw")
+    created = bulk_raw.bulk_create([("item", 3)], str(folder))
+
+    created[0].value = 30
+    created[0].save_to_file()
+    created[0].value = 0
+    created[0].reload()
+    assert created[0].value == 30
+
+
+def test_bulk_create_raw_files_loaded(tmpdir):
+    bulk_raw = _raw_model("test_bulk_create_raw_files_loaded")
+    models = tmpdir.join("models")
+    bulk_raw.bulk_create([(f"item_{index}", index)
+                          for index in range(3)], str(models.join("BulkRaw")))
+
+    reloaded = DataCore(name="test_bulk_create_raw_files_reloaded")
+
+    class ReloadedRaw(Model, core_name="test_bulk_create_raw_files_reloaded",
+                      data_name="BulkRaw"):
+        name: str
+        value: int
+
+    reloaded.recursively_instance_model(str(models))
+    assert sorted(item.value for item in ReloadedRaw.all_instances) == [
+        0, 1, 2]
+
+
+def test_bulk_create_packed(tmpdir):
+    bulk_raw = _raw_model("test_bulk_create_packed")
+    packed = str(tmpdir.join("mod.sqlite"))
+
+    bulk_raw.bulk_create([(f"packed_{index}", index)
+                          for index in range(5)], packed)
+    assert _packed_record(packed, "BulkRaw", "packed_2") == {
+        "name": "packed_2", "value": 2}
+
+
+def test_bulk_create_packed_saved(tmpdir):
+    bulk_raw = _raw_model("test_bulk_create_packed_saved")
+    packed = str(tmpdir.join("mod.sqlite"))
+    created = bulk_raw.bulk_create([("packed", 2)], packed)
+
+    created[0].value = 20
+    created[0].save_to_file()
+    created[0].reload()
+    assert created[0].value == 20
+    assert _packed_record(packed, "BulkRaw", "packed")["value"] == 20
+
+
+def test_bulk_create_packed_duplicated_keys(tmpdir):
+    bulk_raw = _raw_model("test_bulk_create_packed_duplicated_keys")
+
+    with pytest.raises(PCDInvalidRaw):
+        bulk_raw.bulk_create([("same", 1), ("same", 2)],
+                             str(tmpdir.join("mod.sqlite")))
+    assert not bulk_raw.wrapper.instances
+
+
+def test_bulk_create_storage_of_folder(tmpdir):
+    bulk_raw = _raw_model("test_bulk_create_storage_of_folder")
+
+    with pytest.raises(PCDTypeError):
+        bulk_raw.bulk_create([("other", 1)], str(tmpdir.join("BulkRaw")),
+                             "sqlite")
+
+
+def test_bulk_create_existing_raw_files(tmpdir):
+    bulk_raw = _raw_model("test_bulk_create_existing_raw_files")
+    folder = tmpdir.join("BulkRaw")
+    bulk_raw.bulk_create([("item_1", 1)], str(folder))
+
+    with pytest.raises(PCDInvalidRaw):
+        bulk_raw.bulk_create([("item_5", 5), ("item_1", 10)], str(folder))
+    assert not folder.join("item_5.json").check()
+    assert json.loads(folder.join("item_1.json").read())["data"][1] == {
+        "value": 1}
+    assert len(bulk_raw.wrapper.instances) == 1
+
+
+def test_bulk_create_existing_packed(tmpdir):
+    bulk_raw = _raw_model("test_bulk_create_existing_packed")
+    packed = str(tmpdir.join("mod.sqlite"))
+    bulk_raw.bulk_create([("packed_1", 1)], packed)
+
+    with pytest.raises(PCDInvalidRaw):
+        bulk_raw.bulk_create([("packed_1", 10)], packed)
+    assert _packed_record(packed, "BulkRaw", "packed_1")["value"] == 1
+    assert len(bulk_raw.wrapper.instances) == 1
+
+
+def test_bulk_create_overwrite_raw_files(tmpdir):
+    bulk_raw = _raw_model("test_bulk_create_overwrite_raw_files")
+    folder = tmpdir.join("BulkRaw")
+    bulk_raw.bulk_create([("item_4", 4)], str(folder))
+
+    bulk_raw.bulk_create([("item_4", 40)], str(folder), overwrite=True)
+    assert json.loads(folder.join("item_4.json").read())["data"][1] == {
+        "value": 40}
+
+
+def test_bulk_create_overwrite_packed(tmpdir):
+    bulk_raw = _raw_model("test_bulk_create_overwrite_packed")
+    packed = str(tmpdir.join("mod.sqlite"))
+    bulk_raw.bulk_create([("packed_4", 4)], packed)
+
+    bulk_raw.bulk_create([("packed_4", 41)], packed, overwrite=True)
+    assert _packed_record(packed, "BulkRaw", "packed_4")["value"] == 41
+
+
+def _where_models(core_name: str, folder):
+    data_core = DataCore(name=core_name)
+
+    class WhereMaterial(Model, core_name=core_name):
+        name: str
+
+    class WhereItem(Model, core_name=core_name):
+        name: str
+        value: int
+        material: Optional[Ref["WhereMaterial"]] = None
+
+        @derived
+        def double(self) -> int:
+            return self.value * 2
+
+    gold = WhereMaterial("gold")
+    data_core.resolve_references()
+    WhereItem.bulk_create([(f"item_{index}", index)
+                           for index in range(10)], str(folder))
+    return gold, WhereItem
+
+
+def _listen(data_type: type):
+    changes = []
+    data_type.wrapper.listeners.append(
+        lambda added, removed, updated, fields: changes.append(
+            (removed, updated)))
+    return changes
+
+
+def test_update_where(tmpdir):
+    gold, where_item = _where_models("test_update_where",
+                                     tmpdir.join("items"))
+
+    changed = where_item.update_where(Query().value >= 7, value=0,
+                                      material="gold")
+    assert [item.name for item in changed] == ["item_7", "item_8", "item_9"]
+    assert changed[0].material is gold
+    assert changed[0].double == 0
+
+
+def test_update_where_notifies_once(tmpdir):
+    _, where_item = _where_models("test_update_where_notifies_once",
+                                  tmpdir.join("items"))
+    changes = _listen(where_item)
+
+    where_item.update_where(Query().value >= 7, value=0)
+    assert len(changes) == 1
+
+
+def test_update_where_sorted_view(tmpdir):
+    _, where_item = _where_models("test_update_where_sorted_view",
+                                  tmpdir.join("items"))
+    view = where_item.order_by("value", descending=True)
+    assert view.page(0, 1)[0].double == 18
+
+    where_item.update_where(Query().value >= 7, value=0)
+    assert view.page(0, 1)[0].name == "item_6"
+
+
+def test_update_where_unsaved(tmpdir):
+    folder = tmpdir.join("items")
+    _, where_item = _where_models("test_update_where_unsaved", folder)
+
+    where_item.update_where(Query().value == 7, value=0)
+    assert json.loads(folder.join("item_7.json").read())["data"][1] == {
+        "value": 7}
+
+
+def test_update_where_saved(tmpdir):
+    folder = tmpdir.join("items")
+    _, where_item = _where_models("test_update_where_saved", folder)
+
+    for value in (7000, 70):
+        where_item.update_where(lambda item: item.name == "item_7",
+                                save=True, value=value)
+    assert json.loads(folder.join("item_7.json").read())["data"][1] == {
+        "value": 70}
+
+
+def test_update_where_no_match(tmpdir):
+    _, where_item = _where_models("test_update_where_no_match",
+                                  tmpdir.join("items"))
+    changes = _listen(where_item)
+
+    assert where_item.update_where(Query().value > 1000, value=1) == []
+    assert not changes
+
+
+def test_update_where_missing_field(tmpdir):
+    _, where_item = _where_models("test_update_where_missing_field",
+                                  tmpdir.join("items"))
+
+    with pytest.raises(PCDKeyError):
+        where_item.update_where(Query().value > 0, missing=1)
+
+
+def test_update_where_dangling_reference(tmpdir):
+    gold, where_item = _where_models("test_update_where_dangling_reference",
+                                     tmpdir.join("items"))
+    changed = where_item.update_where(Query().value == 1, material="gold")
+
+    with pytest.raises(PCDDanglingReference):
+        where_item.update_where(Query().value > 0, material="iron")
+    assert changed[0].material is gold
+
+
+def test_delete_where(tmpdir):
+    folder = tmpdir.join("items")
+    _, where_item = _where_models("test_delete_where", folder)
+    view = where_item.order_by("value", descending=True)
+    where_item.update_where(Query().value >= 8, material="gold")
+
+    removed = where_item.delete_where(
+        Query().material.test(lambda material: material is not None) &
+        (Query().value < 9))
+    assert [item.name for item in removed] == ["item_8"]
+    assert len(where_item.wrapper.instances) == 9
+    assert removed[0] not in view.page(0, 10)
+    assert folder.join("item_8.json").check()
+
+
+def test_delete_where_raws(tmpdir):
+    folder = tmpdir.join("items")
+    _, where_item = _where_models("test_delete_where_raws", folder)
+
+    removed = where_item.delete_where(lambda item: item.value < 2,
+                                      delete_raws=True)
+    assert [item.name for item in removed] == ["item_0", "item_1"]
+    assert not folder.join("item_0.json").check()
+    assert folder.join("item_2.json").check()
+    assert where_item.wrapper.instances.remove_many(removed) == 0
+
+
+def _packed_where(core_name: str, packed: str):
+    DataCore(name=core_name)
+
+    class PackedWhere(Model, core_name=core_name):
+        name: str
+        value: int
+
+    PackedWhere.bulk_create([(f"item_{index}", index)
+                             for index in range(10)], packed)
+    return PackedWhere
+
+
+def test_update_where_packed(tmpdir):
+    packed = str(tmpdir.join("mod.sqlite"))
+    packed_where = _packed_where("test_update_where_packed", packed)
+
+    packed_where.update_where(lambda item: item.value % 2 == 0, save=True,
+                              value=-1)
+    storage = SqliteDB(packed)
+    try:
+        assert [record["value"] for _, _, record
+                in storage.read_records("PackedWhere")] == [
+                    -1, 1, -1, 3, -1, 5, -1, 7, -1, 9]
+    finally:
+        storage.close()
+
+
+def test_delete_where_packed(tmpdir):
+    packed = str(tmpdir.join("mod.sqlite"))
+    packed_where = _packed_where("test_delete_where_packed", packed)
+
+    packed_where.delete_where(lambda item: item.value % 2 == 0,
+                              delete_raws=True)
+    storage = SqliteDB(packed)
+    try:
+        assert [name for _, name, _
+                in storage.read_records("PackedWhere")] == [
+                    "item_1", "item_3", "item_5", "item_7", "item_9"]
+        assert storage.delete_records("PackedWhere", ["item_1",
+                                                      "missing"]) == 1
+    finally:
+        storage.close()
@@ -0,0 +1,67 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+import gzip
+from pathlib import Path
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.model import Model, Template
+from panda_core_data.storages import (convert_raws, get_extension,
+                                      get_raw_name, iter_raw_files)
+
+
+def test_compression(tmpdir):
+    zstandard = pytest.importorskip("zstandard")
+    data_core = DataCore(name="test_compression")
+
+    class CompressedItem(Model, core_name="test_compression"):
+        name: str
+        value: int
+
+    class CompressedSettings(Template, core_name="test_compression"):
+        difficulty: str
+
+    models_dir = tmpdir.mkdir("models")
+    items_dir = models_dir.mkdir("CompressedItem")
+    items_dir.join("sword.json.gz").write_binary(gzip.compress(
+        b'{"data": [{"name": "sword"}, {"value": 1}]}'))
+    items_dir.join("axe.yaml.zst").write_binary(
+        zstandard.ZstdCompressor().compress(
+            b"data:\n    - name: axe\n    - value: 2\n"))
+    items_dir.join("bow.json").write('{"data": [{"name": "bow"}, '
+                                     '{"value": 3}]}')
+
+    templates_dir = tmpdir.mkdir("templates")
+    templates_dir.join("CompressedSettings.json.gz").write_binary(
+        gzip.compress(b'{"data": [{"difficulty": "hard"}]}'))
+
+    sword_path = Path(str(items_dir.join("sword.json.gz")))
+    assert get_extension(sword_path) == "json"
+    assert get_raw_name(sword_path) == "sword"
+    assert len(list(iter_raw_files(str(models_dir)))) == 3
+
+    data_core.recursively_instance_model(str(models_dir))
+    data_core.recursively_instance_template(str(templates_dir))
+    items = {item.name: item for item in CompressedItem.all_instances}
+    assert {name: item.value for name, item in items.items()} == {
+        "sword": 1, "axe": 2, "bow": 3}
+    assert CompressedSettings.instanced().difficulty == "hard"
+
+    items["axe"].value = 20
+    items["axe"].save_to_file()
+    items["axe"].reload()
+    assert items["axe"].value == 20
+    assert b"20" in zstandard.ZstdDecompressor().stream_reader(
+        open(str(items_dir.join("axe.yaml.zst")), "rb")).read()
+
+    converted = tmpdir.join("converted")
+    assert convert_raws(str(models_dir), str(converted), "json.gz") == 3
+    assert sorted(path.basename for path in converted.join(
+        "CompressedItem").listdir()) == ["axe.json.gz", "bow.json.gz",
+                                         "sword.json.gz"]
+    assert b'"axe"' in gzip.decompress(converted.join(
+        "CompressedItem", "axe.json.gz").read_binary())
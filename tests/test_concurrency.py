@@ -0,0 +1,198 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+from collections.abc import Sequence
+import gc
+import json
+import sys
+from threading import Event, Thread
+import time
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import PCDReadOnly
+from panda_core_data.model import Model
+
+
+def test_readers_never_see_torn_state(tmpdir):
+    DataCore(name="test_readers_never_see_torn_state")
+
+    class Pair(Model, core_name="test_readers_never_see_torn_state"):
+        left: int
+        right: int
+
+    raw_file = tmpdir.join("pair.json")
+    raw_path = str(raw_file.realpath())
+
+    def write_raw(value):
+        raw_file.write(json.dumps({"data": [{"left": value},
+                                            {"right": value}]}))
+
+    write_raw(0)
+    loaded = Pair.instance_from_raw(raw_path)
+    shared = Pair(0, 0)
+    runtime = [Pair(index, index) for index in range(49)]
+
+    stop = Event()
+    failures = []
+
+    def reader():
+        while not stop.is_set():
+            seen = list(Pair.all_instances)
+            if len({id(instance) for instance in seen}) != len(seen):
+                failures.append("duplicated instance")
+
+            for instance in seen:
+                values = dict(instance.items())
+                if values["left"] != values["right"]:
+                    failures.append(values)
+
+                if list(instance) != ["left", "right"]:
+                    failures.append(list(instance))
+
+    def updater():
+        counter = 0
+        while not stop.is_set():
+            counter += 1
+            shared.update(left=counter, right=counter)
+
+    def reloader():
+        counter = 0
+        while not stop.is_set():
+            counter += 1
+            new_instance = Pair(counter, counter)
+            runtime.append(new_instance)
+            Pair.wrapper.instances.remove(runtime.pop(0))
+            new_instance.update(left=-counter, right=-counter)
+
+            write_raw(counter)
+            loaded.reload()
+
+    old_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [Thread(target=reader) for _ in range(4)]
+        threads.append(Thread(target=updater))
+        threads.append(Thread(target=reloader))
+        for thread in threads:
+            thread.start()
+
+        time.sleep(0.5)
+        stop.set()
+
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(old_interval)
+
+    assert not failures
+    assert len(Pair.wrapper.instances) == 51
+    assert shared in Pair.wrapper.instances
+    assert shared.left == shared.right > 0
+    assert loaded.left == loaded.right > 0
+
+
+def test_freeze():
+    data_core = DataCore(name="test_freeze")
+
+    class FrozenModel(Model, core_name="test_freeze"):
+        name: str
+
+    DataCore(name="test_freeze_writable")
+
+    class WritableModel(Model, core_name="test_freeze_writable"):
+        name: str
+
+    instanced = FrozenModel("test")
+    try:
+        data_core.freeze()
+        FrozenModel("still writable")
+        assert len(FrozenModel.wrapper.instances) == 2
+
+        data_core.freeze(read_only=True)
+    finally:
+        gc.unfreeze()
+
+    with pytest.raises(PCDReadOnly):
+        instanced.name = "changed"
+
+    with pytest.raises(PCDReadOnly):
+        instanced.update(name="changed")
+
+    with pytest.raises(PCDReadOnly):
+        del instanced["name"]
+
+    with pytest.raises(PCDReadOnly):
+        FrozenModel("new")
+
+    with pytest.raises(PCDReadOnly):
+        FrozenModel.wrapper.instances.remove(instanced)
+
+    with pytest.raises(PCDReadOnly):
+        data_core("invalid")
+
+    assert instanced.name == "test"
+    assert len(FrozenModel.wrapper.instances) == 2
+
+    WritableModel("not frozen").name = "changed"
+
+
+def test_remove_and_replace():
+    DataCore(name="test_remove_and_replace")
+
+    class Removed(Model, core_name="test_remove_and_replace"):
+        value: int
+
+    def ids(items):
+        return [id(item) for item in items]
+
+    instances = Removed.wrapper.instances
+    # equal instances must be told apart by identity
+    created = [Removed(index % 10) for index in range(300)]
+    removed = created[::3] + created[1::3][::-1]
+    for instance in removed:
+        instances.remove(instance)
+    assert ids(instances) == ids(created[2::3])
+
+    late = Removed(3)
+    replacement = Removed.__new__(Removed)
+    instances.replace(created[5], replacement)
+    instances.remove(late)
+    instances.remove(created[2])
+    assert ids(instances) == [id(replacement)] + ids(created[8::3])
+
+    with pytest.raises(ValueError):
+        instances.remove(late)
+    with pytest.raises(ValueError):
+        instances.remove(created[0])
+
+
+def test_group_instance_sequence():
+    DataCore(name="test_group_instance_sequence")
+
+    class Listed(Model, core_name="test_group_instance_sequence"):
+        value: int
+
+    instances = Listed.wrapper.instances
+    first, second, third = Listed(1), Listed(2), Listed(2)
+    assert isinstance(instances, Sequence)
+    assert instances == [first, second, third]
+    assert instances != [first, second]
+    assert instances[0:2] == [first, second]
+    assert instances[::-1][0] is third
+    assert list(reversed(instances)) == [third, second, first]
+    assert instances.index(second) == 1
+    assert instances.count(second) == 2
+
+    inserted = Listed.__new__(Listed)
+    object.__setattr__(inserted, "__dict__", {"value": 0})
+    instances.insert(0, inserted)
+    assert instances[0] is inserted
+    assert instances.pop() is third
+    assert instances.pop(0) is inserted
+    assert instances == [first, second]
+    with pytest.raises(ValueError):
+        instances.index(inserted)
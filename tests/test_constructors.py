@@ -0,0 +1,45 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+from dataclasses import field
+from typing import List
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import PCDInvalidRaw
+from panda_core_data.model import Model
+
+
+def test_fast_init(tmpdir):
+    DataCore(name="test_fast_init")
+
+    class FastInit(Model, core_name="test_fast_init"):
+        name: str
+        value: int
+        weight: float = 1
+        # models are dataclasses, which pylint can't see
+        #pylint: disable=invalid-field-call
+        tags: List[str] = field(default_factory=list)
+
+    raw_file = tmpdir.join("fast.json")
+    raw_file.write('{"data": [{"name": 10}, {"value": "5"}, {"extra": true}]}')
+
+    instanced = FastInit.instance_from_raw(str(raw_file.realpath()))
+
+    assert instanced.name == "10"
+    assert instanced.value == 5
+    assert instanced.weight == 1.0 and isinstance(instanced.weight, float)
+    assert isinstance(instanced.tags, list) and not instanced.tags
+    assert instanced.extra is True
+    assert instanced.all()[0] == {"name": 10}
+
+    raw_file.write('{"data": [{"name": "test"}, {"value": "not a number"}]}')
+    assert FastInit.instance_from_raw(
+        str(raw_file.realpath())).value == "not a number"
+
+    raw_file.write('{"data": [{"name": "test"}]}')
+    with pytest.raises(PCDInvalidRaw):
+        FastInit.instance_from_raw(str(raw_file.realpath()))
@@ -0,0 +1,69 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import PCDCircularDependency
+from panda_core_data.model import Model, Template
+
+
+def test_transitive_parents():
+    data_core = DataCore(name="test_transitive_parents")
+
+    class Base(Template, core_name="test_transitive_parents"):
+        value: int
+
+    class Middle(Template, dependencies=["Base"],
+                 core_name="test_transitive_parents"):
+        value: int
+
+    class Item(Model, dependencies=["Middle"],
+               core_name="test_transitive_parents"):
+        name: str
+
+    class Other(Model, core_name="test_transitive_parents"):
+        name: str
+
+    base = Base(1)
+    middle = Middle(2)
+    first, second = Item("first"), Item("second")
+
+    graph = data_core.dependency_graph
+    order = graph.order
+    assert order.index(Base) < order.index(Middle) < order.index(Item)
+    assert graph.closure(Item) == (Middle, Base)
+
+    assert dict(first.parents) == {"Middle": middle, "Base": base}
+    assert first.parents is second.parents is Item.parents
+    assert first.add_dependencies() is first.parents
+    assert not Other.parents
+    assert not Base.parents
+
+    with pytest.raises(TypeError):
+        first.parents["Other"] = Other("other")
+
+    new_base = Base(3)
+    assert Item.parents["Base"] is new_base
+
+
+def test_circular_dependency():
+    data_core = DataCore(name="test_circular_dependency")
+
+    class First(Template, dependencies=["Second"],
+                core_name="test_circular_dependency"):
+        value: int
+
+    class Second(Template, dependencies=["Third"],
+                 core_name="test_circular_dependency"):
+        value: int
+
+    class Third(Template, dependencies=["First"],
+                core_name="test_circular_dependency"):
+        value: int
+
+    with pytest.raises(PCDCircularDependency) as circular:
+        data_core.dependency_graph.build()
+    assert "First -> Second -> Third -> First" in str(circular.value)
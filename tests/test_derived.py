@@ -0,0 +1,79 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import PCDKeyError, PCDTypeError
+from panda_core_data.derived import CACHE_KEY, derived
+from panda_core_data.model import Model
+
+
+def test_derived():
+    DataCore(name="test_derived")
+    calls = []
+
+    class Weapon(Model, core_name="test_derived"):
+        name: str
+        damage: float
+        speed: float = 1.0
+
+        @derived
+        def dps(self) -> float:
+            calls.append("dps")
+            return self.damage * self["speed"]
+
+        @derived
+        def label(self) -> str:
+            calls.append("label")
+            return f"{self.name} ({self.dps:.1f})"
+
+        @derived
+        def described(self) -> str:
+            calls.append("described")
+            return self.describe()
+
+        def describe(self) -> str:
+            return self.name
+
+    sword = Weapon("sword", 10.0, 1.5)
+    assert sword.label == "sword (15.0)"
+    assert sword.dps == 15.0
+    assert sword.label == "sword (15.0)"
+    assert calls == ["label", "dps"]
+    assert dict(sword) == {"name": "sword", "damage": 10.0, "speed": 1.5}
+
+    sword.name = "blade"
+    assert sword.dps == 15.0
+    assert sword.label == "blade (15.0)"
+    assert calls == ["label", "dps", "label"]
+
+    sword["speed"] = 2.0
+    assert sword.label == "blade (20.0)"
+    assert calls[-2:] == ["label", "dps"]
+
+    assert sword.described == "blade"
+    sword.damage = 1.0
+    assert sword.described == "blade"
+    assert calls[-1] == "described"
+    calls.clear()
+
+    sword.update(damage=3.0)
+    assert sword.dps == 6.0
+    assert CACHE_KEY not in dict(sword)
+
+    with pytest.raises(PCDTypeError):
+        sword.dps = 1.0
+
+    Weapon("axe", 4.0)
+    calls.clear()
+    assert Weapon.precompute_derived("dps") == 1
+    assert Weapon.precompute_derived() == 4
+    assert Weapon.precompute_derived() == 0
+    assert Weapon.wrapper.instances[1].label == "axe (4.0)"
+    assert "label" in calls and calls.count("dps") == 1
+
+    with pytest.raises(PCDKeyError):
+        Weapon.precompute_derived("missing")
@@ -0,0 +1,247 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+from io import StringIO
+import json
+from typing import Dict, List, Optional
+
+from panda_core_data import DataCore
+from panda_core_data.diff import PatchEntry, content_hashes, write_patch
+from panda_core_data.model import Model, Template
+from panda_core_data.references import Ref
+
+
+def _version(name: str):
+    data_core = DataCore(name=name)
+
+    class DiffSettings(Template, core_name=name):
+        difficulty: str
+
+    class DiffMaterial(Model, core_name=name):
+        name: str
+
+    class DiffItem(Model, core_name=name):
+        name: str
+        value: int
+        tags: List[str]
+        material: Optional[Ref["DiffMaterial"]] = None
+
+    return data_core, DiffSettings, DiffMaterial, DiffItem
+
+
+def _populated_version(name: str, keys: range):
+    data_core, settings, material, item = _version(name)
+    settings("easy")
+    material("iron")
+    material("gold")
+    for index in keys:
+        item(f"item_{index}", index, ["tool"], "iron")
+    data_core.resolve_references()
+    return data_core, settings, item
+
+
+def _versions(name: str, old_keys=range(5), new_keys=range(1, 6)):
+    "Two versions of the same mod, with items of different keys"
+    return (_populated_version(f"{name}_old", old_keys),
+            _populated_version(f"{name}_new", new_keys))
+
+
+def test_diff_same_core():
+    (old_core, _, _), _ = _versions("test_diff_same_core")
+    assert not list(old_core.diff(old_core))
+
+
+def test_diff_added_and_removed():
+    (old_core, _, _), (new_core, _, _) = _versions("test_diff_added")
+    assert list(old_core.diff(new_core)) == [
+        PatchEntry("remove", "DiffItem", "item_0",
+                   {"name": "item_0", "value": 0, "tags": ["tool"],
+                    "material": "iron"}),
+        PatchEntry("add", "DiffItem", "item_5",
+                   {"name": "item_5", "value": 5, "tags": ["tool"],
+                    "material": "iron"}),
+    ]
+
+
+def test_diff_changed_fields():
+    (old_core, _, _), (new_core, _, new_item) = _versions(
+        "test_diff_changed", new_keys=range(5))
+    new_item.wrapper.instances[2].value = 20
+    new_item.wrapper.instances[3].update(material="gold",
+                                         tags=["tool", "new"])
+
+    assert list(old_core.diff(new_core)) == [
+        PatchEntry("change", "DiffItem", "item_2", {"value": (2, 20)}),
+        PatchEntry("change", "DiffItem", "item_3", {
+            "tags": (["tool"], ["tool", "new"]),
+            "material": ("iron", "gold")}),
+    ]
+
+
+def test_diff_with_hashes():
+    (old_core, _, old_item), (new_core, _, new_item) = _versions(
+        "test_diff_with_hashes")
+    new_item.wrapper.instances[1].value = 20
+    entries = list(old_core.diff(new_core))
+
+    content_hashes(old_item)
+    content_hashes(new_item)
+    assert list(old_core.diff(new_core)) == entries
+
+
+def test_content_hashes_cache():
+    _, (_, _, new_item) = _versions("test_content_hashes_cache")
+    hashes = content_hashes(new_item)
+    assert content_hashes(new_item) is hashes
+
+    new_item.wrapper.instances[0].value = 1
+    assert content_hashes(new_item) is not hashes
+
+
+def test_diff_templates():
+    (old_core, _, _), (new_core, new_settings, _) = _versions(
+        "test_diff_templates", new_keys=range(5))
+    new_settings("hard")
+
+    assert list(old_core.diff(new_core)) == [
+        PatchEntry("change", "DiffSettings", 0,
+                   {"difficulty": ("easy", "hard")})]
+
+
+def test_write_patch_file(tmpdir):
+    (old_core, _, _), (new_core, _, _) = _versions("test_write_patch_file")
+    patch = tmpdir.join("patch.ndjson")
+
+    assert write_patch(old_core.diff(new_core), str(patch)) == 2
+    lines = [json.loads(line) for line in patch.readlines()]
+    assert lines[1] == {"operation": "add", "model": "DiffItem",
+                        "key": "item_5",
+                        "fields": {"name": "item_5", "value": 5,
+                                   "tags": ["tool"], "material": "iron"}}
+
+
+def test_diff_new_field():
+    old_core = DataCore(name="test_diff_new_field_old")
+    new_core = DataCore(name="test_diff_new_field_new")
+
+    class LightItem(Model, core_name="test_diff_new_field_old",
+                    data_name="DiffItem"):
+        name: str
+        value: int
+
+    class WeightedItem(Model, core_name="test_diff_new_field_new",
+                       data_name="DiffItem"):
+        name: str
+        value: int
+        weight: float = 1.0
+
+    LightItem("item", 1)
+    WeightedItem("item", 1)
+    WeightedItem("item", 2, weight=3.0)
+
+    assert list(old_core.diff(new_core)) == [
+        PatchEntry("change", "DiffItem", "item", {"weight": (None, 1.0)}),
+        PatchEntry("add", "DiffItem", "item",
+                   {"name": "item", "value": 2, "weight": 3.0}),
+    ]
+    assert [entry.operation for entry in new_core.diff(old_core)] == [
+        "change", "remove"]
+
+
+def test_diff_new_model():
+    old_core = DataCore(name="test_diff_new_model_old")
+    new_core = DataCore(name="test_diff_new_model_new")
+
+    class AddedMaterial(Model, core_name="test_diff_new_model_new"):
+        name: str
+
+    AddedMaterial("iron")
+
+    assert list(old_core.diff(new_core)) == [
+        PatchEntry("add", "AddedMaterial", "iron", {"name": "iron"})]
+    assert list(new_core.diff(old_core)) == [
+        PatchEntry("remove", "AddedMaterial", "iron", {"name": "iron"})]
+
+
+def _duplicated_cores(core_name: str):
+    old_core = DataCore(name=f"{core_name}_old")
+    new_core = DataCore(name=f"{core_name}_new")
+
+    class OldDuplicated(Model, core_name=f"{core_name}_old", key_field="kind",
+                        data_name="Duplicated"):
+        kind: str
+        value: int
+
+    class NewDuplicated(Model, core_name=f"{core_name}_new", key_field="kind",
+                        data_name="Duplicated"):
+        kind: str
+        value: int
+
+    for value in (1, 1, 2):
+        OldDuplicated("sword", value)
+    for value in (1, 3):
+        NewDuplicated("sword", value)
+    return old_core, new_core, OldDuplicated, NewDuplicated
+
+
+def test_diff_duplicated_keys():
+    old_core, new_core, _, _ = _duplicated_cores("test_diff_duplicated")
+
+    assert list(old_core.diff(new_core)) == [
+        PatchEntry("change", "Duplicated", "sword", {"value": (1, 3)}),
+        PatchEntry("remove", "Duplicated", "sword",
+                   {"kind": "sword", "value": 2}),
+    ]
+
+
+def test_diff_duplicated_keys_hashed():
+    old_core, new_core, old_type, new_type = _duplicated_cores(
+        "test_diff_duplicated_hashed")
+
+    assert content_hashes(old_type).key_index["sword"] == 0
+    content_hashes(new_type)
+    assert [entry.operation for entry in old_core.diff(new_core)] == [
+        "change", "remove"]
+
+
+def _levels_cores(core_name: str):
+    old_core = DataCore(name=f"{core_name}_old")
+    new_core = DataCore(name=f"{core_name}_new")
+
+    class OldLevels(Model, core_name=f"{core_name}_old", data_name="Levels"):
+        name: str
+        levels: Dict[int, float]
+
+    class NewLevels(Model, core_name=f"{core_name}_new", data_name="Levels"):
+        name: str
+        levels: Dict[int, float]
+
+    OldLevels("table", {1: 0.5, 2: 1.0})
+    NewLevels("table", {1: 0.5, 2: float("nan"), "max": 3.0})
+    return old_core, new_core, OldLevels, NewLevels
+
+
+def test_diff_int_keys():
+    old_core, new_core, _, _ = _levels_cores("test_diff_int_keys")
+    assert [entry.operation for entry in old_core.diff(new_core)] == [
+        "change"]
+
+
+def test_diff_int_keys_hashed():
+    old_core, new_core, old_type, new_type = _levels_cores(
+        "test_diff_int_keys_hashed")
+    content_hashes(old_type)
+    content_hashes(new_type)
+    assert [entry.operation for entry in old_core.diff(new_core)] == [
+        "change"]
+
+
+def test_write_patch_stream():
+    old_core, new_core, _, _ = _levels_cores("test_write_patch_stream")
+    output = StringIO()
+
+    assert write_patch(old_core.diff(new_core), output) == 1
+    assert json.loads(output.getvalue())["fields"]["levels"] == [
+        {"1": 0.5, "2": 1.0}, {"1": 0.5, "2": None, "max": 3.0}]
@@ -0,0 +1,62 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+import json
+import os
+from pathlib import Path
+
+from panda_core_data import DataCore
+from panda_core_data.model import Model
+from panda_core_data.storages import (RawPath, fingerprint_raws,
+                                      get_storage_from_extension,
+                                      get_storage_table, iter_raw_files,
+                                      raw_glob_iterator, scan_folder)
+from panda_core_data.storages.json_db import JsonDB
+
+
+def test_discovery(tmpdir):
+    data_core = DataCore(name="test_discovery")
+
+    class DiscoveredItem(Model, core_name="test_discovery"):
+        name: str
+
+    models_dir = tmpdir.mkdir("models")
+    items_dir = models_dir.mkdir("DiscoveredItem")
+    nested_dir = items_dir.mkdir("weapons").mkdir("swords")
+    items_dir.join("axe.json").write(json.dumps({"data": [{"name": "axe"}]}))
+    items_dir.join("notes.txt").write("not a raw")
+    nested_dir.join("sword.json").write(json.dumps(
+        {"data": [{"name": "sword"}]}))
+
+    assert [path.name for path in raw_glob_iterator(str(items_dir))] == [
+        "axe.json"]
+    raw_files = list(iter_raw_files(str(models_dir)))
+    assert sorted(path.name for path in raw_files) == ["axe.json",
+                                                       "sword.json"]
+    assert all(isinstance(path, RawPath) and path.is_file()
+               for path in raw_files)
+    assert raw_files[0].stat().st_size == os.path.getsize(raw_files[0])
+    assert raw_files[0].parent.entry is None
+    assert sorted(raw_files) == sorted([
+        Path(str(items_dir), "axe.json"),
+        Path(str(nested_dir), "sword.json")])
+    assert raw_files[0].parent.is_dir()
+
+    assert [path.name for path in scan_folder(str(models_dir))] == [
+        "DiscoveredItem"]
+    assert get_storage_table()["json"] is JsonDB
+    assert get_storage_from_extension("json") is JsonDB
+
+    fingerprint = fingerprint_raws(raw_files, str(models_dir))
+    assert fingerprint == fingerprint_raws(iter_raw_files(str(models_dir)),
+                                           str(models_dir))
+    nested_dir.join("sword.json").write(json.dumps(
+        {"data": [{"name": "long sword"}]}))
+    assert fingerprint != fingerprint_raws(iter_raw_files(str(models_dir)),
+                                           str(models_dir))
+
+    data_core.recursively_instance_model(str(models_dir))
+    assert sorted(item.name for item in DiscoveredItem.all_instances) == [
+        "axe", "long sword"]
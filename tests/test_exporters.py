@@ -0,0 +1,166 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+import csv
+from importlib import reload
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import PCDKeyError, PCDTypeError
+from panda_core_data import exporters
+from panda_core_data.exporters import encode_json, export_instances
+from panda_core_data.model import Model
+from panda_core_data.references import Ref
+
+
+@pytest.fixture(name="exported_model")
+def fixture_exported_model():
+    data_core = DataCore(name="test_exporters", replace=True)
+
+    class ExportedMaterial(Model, core_name="test_exporters"):
+        name: str
+
+    class ExportedItem(Model, core_name="test_exporters"):
+        name: str
+        value: int
+        tags: List[str]
+        stats: Dict[str, float]
+        material: Optional[Ref["ExportedMaterial"]] = None
+
+    ExportedMaterial("iron")
+    for index in range(25):
+        ExportedItem(f"item_{index}", index, ["a", "b"], {"hp": index / 2},
+                     "iron" if index % 2 else None)
+    data_core.resolve_references()
+    return ExportedItem
+
+
+def test_export_ndjson(exported_model, tmpdir):
+    path = str(tmpdir.join("items.ndjson"))
+    assert exported_model.export(path, chunk_size=7) == 25
+
+    with open(path) as exported:
+        records = [json.loads(line) for line in exported]
+    assert len(records) == 25
+    assert records[3] == {"name": "item_3", "value": 3, "tags": ["a", "b"],
+                          "stats": {"hp": 1.5}, "material": "iron"}
+    assert records[4]["material"] is None
+
+    exported_model.export(path, fields=["value", "name"])
+    with open(path) as exported:
+        assert json.loads(exported.readline()) == {"value": 0,
+                                                   "name": "item_0"}
+
+
+def test_export_csv(exported_model, tmpdir):
+    path = str(tmpdir.join("items.csv"))
+    exported_model.export(path, format="csv", chunk_size=10)
+
+    with open(path, newline="") as exported:
+        rows = list(csv.DictReader(exported))
+    assert len(rows) == 25
+    assert rows[1]["value"] == "1"
+    assert rows[1]["material"] == "iron"
+    assert json.loads(rows[1]["tags"]) == ["a", "b"]
+
+
+def test_export_arrow(exported_model, tmpdir):
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+
+    path = str(tmpdir.join("items.arrow"))
+    exported_model.export(path, format="arrow", fields=["name", "value",
+                                                        "material"],
+                          chunk_size=10)
+
+    with pyarrow.ipc.open_file(path) as reader:
+        assert reader.num_record_batches == 3
+        table = reader.read_all()
+    assert table.column_names == ["name", "value", "material"]
+    assert table.column("value").to_pylist() == list(range(25))
+    assert table.column("material").to_pylist()[:2] == [None, "iron"]
+
+
+def test_export_arrow_schema(tmpdir):
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+
+    DataCore(name="test_exporters_schema", replace=True)
+
+    class SchemaItem(Model, core_name="test_exporters_schema"):
+        name: str
+        weight: float
+        note: Optional[str] = None
+        extra: Any = None
+
+    for index in range(25):
+        SchemaItem(f"item_{index}", index if index < 10 else index / 2,
+                   f"note_{index}" if index >= 10 else None,
+                   {"index": index} if index >= 20 else None)
+
+    path = str(tmpdir.join("schema.arrow"))
+    assert SchemaItem.export(path, format="arrow", chunk_size=10) == 25
+    with pyarrow.ipc.open_file(path) as reader:
+        assert reader.num_record_batches == 3
+        table = reader.read_all()
+    assert table.schema.field("weight").type == pyarrow.float64()
+    assert table.schema.field("note").type == pyarrow.string()
+    assert table.column("note").to_pylist()[9:11] == [None, "note_10"]
+    assert table.column("weight").to_pylist()[:2] == [0.0, 1.0]
+    assert json.loads(table.column("extra").to_pylist()[24]) == {
+        "index": 24}
+
+    path = str(tmpdir.join("empty.arrow"))
+    assert export_instances(SchemaItem, [], path, format="arrow") == 0
+    with pyarrow.ipc.open_file(path) as reader:
+        assert reader.schema.field("weight").type == pyarrow.float64()
+
+
+def test_export_errors(exported_model, tmpdir):
+    with pytest.raises(PCDTypeError):
+        exported_model.export(str(tmpdir.join("items.xml")), format="xml")
+
+    with pytest.raises(PCDKeyError):
+        exported_model.export(str(tmpdir.join("items.csv")), format="csv",
+                              fields=["missing"])
+
+
+def test_export_int_keys_and_nan(tmpdir):
+    DataCore(name="test_export_int_keys_and_nan")
+
+    class LevelTable(Model, core_name="test_export_int_keys_and_nan"):
+        name: str
+        levels: Dict[int, float]
+        ratio: float = 0.0
+
+    LevelTable("table", {1: 0.5, 2: float("nan")}, float("inf"))
+    output = tmpdir.join("levels.ndjson")
+    export_instances(LevelTable, LevelTable.all_instances, str(output))
+    assert json.loads(output.read()) == {
+        "name": "table", "levels": {"1": 0.5, "2": None}, "ratio": None}
+
+    export_instances(LevelTable, LevelTable.all_instances,
+                     str(tmpdir.join("levels.csv")), format="csv")
+    with open(tmpdir.join("levels.csv"), newline="") as csv_file:
+        row = list(csv.DictReader(csv_file))[0]
+    assert json.loads(row["levels"]) == {"1": 0.5, "2": None}
+
+
+def test_encode_json_without_orjson(monkeypatch):
+    value = {"name": "table", "levels": {1: [0.5, float("nan")]},
+             "other": object}
+    encoded = encode_json(value)
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    try:
+        fallback = reload(exporters).encode_json(value)
+    finally:
+        monkeypatch.undo()
+        reload(exporters)
+    assert json.loads(fallback) == json.loads(encoded) == {
+        "name": "table", "levels": {"1": [0.5, None]}, "other": str(object)}
@@ -0,0 +1,95 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+from typing import List, Optional
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import (PCDDanglingReference,
+                                               PCDKeyError, PCDValidationError)
+from panda_core_data.model import Model
+from panda_core_data.references import Ref
+
+
+def test_frames():
+    pandas = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    data_core = DataCore(name="test_frames")
+
+    class FrameMaterial(Model, core_name="test_frames"):
+        name: str
+
+    class FrameItem(Model, core_name="test_frames"):
+        name: str
+        value: int
+        tags: List[str]
+        material: Optional[Ref["FrameMaterial"]] = None
+
+    iron = FrameMaterial("iron")
+    for index in range(10):
+        FrameItem(f"item_{index}", index, ["tool"], "iron")
+    data_core.resolve_references()
+
+    frame = FrameItem.to_frame()
+    assert list(frame.columns) == ["name", "value", "tags", "material"]
+    assert frame["value"].sum() == 45
+    assert set(frame["material"]) == {"iron"}
+    assert FrameItem.to_frame(["name"]).shape == (10, 1)
+
+    table = FrameItem.to_frame(["name", "value"], backend="arrow")
+    assert table.column("value").to_pylist() == list(range(10))
+
+    changed = frame[["name", "value"]].copy()
+    changed["value"] *= 10
+    new_rows = pandas.DataFrame({"name": ["new_item"], "value": [7],
+                                 "tags": [["new"]], "material": ["iron"]})
+
+    instances = FrameItem.from_frame(changed)
+    created = FrameItem.from_frame(new_rows)
+    assert len(FrameItem.wrapper.instances) == 11
+    assert [instance.value for instance in instances] == list(range(0, 100,
+                                                                    10))
+    assert instances[0].tags == ["tool"]
+    assert created[0].material is iron
+    assert FrameItem.to_frame()["value"].sum() == 457
+
+    FrameItem.from_frame(table)
+    assert FrameItem.wrapper.instances[1].value == 1
+
+    with pytest.raises(PCDValidationError):
+        FrameItem.from_frame({"name": ["item_1", "item_2"],
+                              "value": [2, "invalid"]})
+    assert FrameItem.wrapper.instances[2].value == 2
+
+    with pytest.raises(PCDDanglingReference):
+        FrameItem.from_frame({"name": ["gold_item"], "value": [1],
+                              "tags": [[]], "material": ["gold"]})
+    assert len(FrameItem.wrapper.instances) == 11
+
+    with pytest.raises(PCDKeyError):
+        FrameItem.from_frame({"missing": [1]})
+
+
+def test_frames_missing_values():
+    pytest.importorskip("pandas")
+    DataCore(name="test_frames_missing_values")
+
+    class NullableRow(Model, core_name="test_frames_missing_values"):
+        name: str
+        count: Optional[int] = None
+        ratio: Optional[float] = None
+        enabled: Optional[bool] = None
+
+    NullableRow("full", 3, 0.5, True)
+    NullableRow("empty")
+    frame = NullableRow.to_frame()
+    assert str(frame["count"].dtype) == "Int64"
+    assert str(frame["enabled"].dtype) == "boolean"
+
+    rows = NullableRow.from_frame(frame)
+    assert [(row.count, row.ratio, row.enabled) for row in rows] == [
+        (3, 0.5, True), (None, None, None)]
+    assert rows[0].count.__class__ is int
@@ -31,16 +31,29 @@ def test_mappings():
         assert key_name in ["name", "value"]
         assert value in TESTING_VALUES
 
-    while True:
-        try:
-            next(instanced)
-        except StopIteration:
-            break
+    keys = iter(instanced)
+    assert next(keys) == "name"
+    assert list(instanced) == ["name", "value"]
+    assert [(outer, inner) for outer in instanced for inner in instanced] == [
+        ("name", "name"), ("name", "value"),
+        ("value", "name"), ("value", "value")]
+    assert next(keys) == "value"
+
+    assert len(instanced) == 2
+    assert instanced[1] == instanced[-1] == TESTING_VALUES[1]
+    assert "name" in instanced
+    assert "dataclass_instanced" not in instanced
 
     instanced["name"] = second_value
     assert instanced.name == second_value
     assert instanced[0] == second_value
 
+    assert instanced.pop("value") == TESTING_VALUES[1]
+    assert list(instanced.keys()) == ["name"]
+    assert instanced[0] == second_value
+    assert "value" not in instanced
+    assert len(instanced) == 1
+
     instanced.clear()
 
     #pylint: disable=len-as-condition
@@ -0,0 +1,90 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+from typing import List
+
+from panda_core_data import DataCore
+from panda_core_data.model import Model
+from panda_core_data.references import Ref
+
+
+def test_reference_graph():
+    data_core = DataCore(name="test_reference_graph")
+
+    class Material(Model, core_name="test_reference_graph"):
+        name: str
+
+    class Part(Model, core_name="test_reference_graph"):
+        name: str
+        materials: List[Ref["Material"]]
+
+    class Recipe(Model, core_name="test_reference_graph"):
+        name: str
+        parts: List[Ref["Part"]]
+
+    iron, wood = Material("iron"), Material("wood")
+    blade, handle = Part("blade", ["iron"]), Part("handle", ["wood", "iron"])
+    sword = Recipe("sword", ["blade", "handle"])
+    club = Recipe("club", ["handle"])
+    data_core.resolve_references()
+
+    graph = data_core.reference_graph
+    assert graph.references(sword) == (blade, handle)
+    assert graph.referenced_by(handle) == (sword, club)
+    assert graph.references(iron) == ()
+
+    assert list(graph.bfs(sword)) == [(blade, 1), (handle, 1), (iron, 2),
+                                      (wood, 2)]
+    assert list(graph.bfs(sword, max_depth=1)) == [(blade, 1), (handle, 1)]
+    assert list(graph.dfs(sword)) == [blade, iron, handle, wood]
+
+    closure = graph.closure(iron, reverse=True)
+    assert closure == (blade, handle, sword, club)
+    assert graph.closure(iron, reverse=True) is closure
+
+    assert graph.shortest_path(club, iron) == (club, handle, iron)
+    assert graph.shortest_path(iron, club) is None
+    assert graph.shortest_path(iron, club, reverse=True) == (iron, handle,
+                                                            club)
+
+    club.update(parts=["blade"])
+    assert graph.closure(iron, reverse=True) == (blade, handle, sword, club)
+    assert graph.closure(wood, reverse=True) == (handle, sword)
+    assert graph.shortest_path(club, iron) == (club, blade, iron)
+
+    axe = Recipe("axe", [blade])
+    assert graph.referenced_by(blade) == (sword, club, axe)
+
+    sword.parts = [handle]
+    assert graph.references(sword) == (handle,)
+    assert graph.referenced_by(blade) == (club, axe)
+    handle.name = "grip"
+    assert graph.referenced_by(handle) == (sword,)
+    assert data_core.references.key_index("Part")["grip"] is handle
+    Recipe.wrapper.instances.remove(club)
+    assert graph.referenced_by(blade) == (axe,)
+
+
+def test_field_writes_tracking():
+    DataCore(name="test_writes_tracking")
+
+    class Tracked(Model, core_name="test_writes_tracking"):
+        name: str
+        value: int = 0
+
+    first = Tracked("first")
+    Tracked("second", 1)
+    assert Tracked.__setattr__ is object.__setattr__
+    assert not Tracked.wrapper.tracking_writes
+
+    # the cached result reads the version, which tracks the writes
+    assert Tracked.aggregate(total=("value", "sum")) == {"total": 1}
+    assert Tracked.wrapper.tracking_writes
+    version = Tracked.wrapper.version
+    first.value = 10
+    assert Tracked.wrapper.version == version + 1
+    assert Tracked.aggregate(total=("value", "sum")) == {"total": 11}
+    Tracked("third", 5)
+    assert Tracked.wrapper.version == version + 2
@@ -0,0 +1,88 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+import json
+from typing import List, Optional
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import (PCDDanglingReference,
+                                               PCDValidationError)
+from panda_core_data.model import Model
+from panda_core_data.references import Ref, reference_fields
+
+
+def test_references(tmpdir):
+    data_core = DataCore(name="test_references")
+
+    class Item(Model, core_name="test_references"):
+        name: str
+
+    class Recipe(Model, key_field="title", core_name="test_references"):
+        title: str
+        result: Ref["Item"]
+        ingredients: List[Ref["Item"]]
+        upgrade: Optional[Ref["Recipe"]] = None
+
+    assert Ref["Item"] is Ref["Item"]
+    assert reference_fields(Recipe) == (("result", "Item", False),
+                                        ("ingredients", "Item", True),
+                                        ("upgrade", "Recipe", False))
+
+    iron, wood = Item("iron"), Item("wood")
+    sword = Recipe("sword", "iron", ["iron", "wood"], "axe")
+    axe = Recipe("axe", "iron", ["wood"])
+
+    assert data_core.resolve_references() == []
+    assert sword.result is iron
+    assert sword.ingredients == [iron, wood]
+    assert sword.upgrade is axe
+    assert axe.upgrade is None
+
+    sword.update(ingredients=["wood"])
+    assert sword.ingredients == [wood]
+
+    with pytest.raises(PCDDanglingReference):
+        sword.update(result="gold")
+    assert sword.result is iron
+
+    broken = Recipe("broken", "gold", ["iron", "stone"])
+    errors = data_core.resolve_references(raise_errors=False)
+    assert len(errors) == 2
+    assert all("instance of Recipe" in error for error in errors)
+    assert broken.ingredients[0] is iron
+    data_core.all_model_types["Recipe"].wrapper.instances.remove(broken)
+
+    raw_file = tmpdir.join("shield.json")
+    raw_path = str(raw_file.realpath())
+    raw_file.write(json.dumps({"data": [{"title": "shield"},
+                                        {"result": "wood"},
+                                        {"ingredients": ["wood"]}]}))
+    shield = Recipe.instance_from_raw(raw_path)
+    data_core.resolve_references()
+    assert shield.result is wood
+
+    raw_file.write(json.dumps({"data": [{"title": "shield"},
+                                        {"result": "iron"},
+                                        {"ingredients": ["iron", "wood"]}]}))
+    shield.reload()
+    assert shield.result is iron
+    assert shield.ingredients == [iron, wood]
+
+    raw_file.write(json.dumps({"data": [{"title": "shield"},
+                                        {"result": "missing"},
+                                        {"ingredients": []}]}))
+    with pytest.raises(PCDDanglingReference) as dangling:
+        shield.reload()
+    assert raw_path in dangling.value.errors[0]
+    assert shield.result is iron
+
+    shield.save_to_file()
+    assert json.loads(raw_file.read())["data"][1] == {"result": "iron"}
+
+    Recipe("invalid", 10.5, [])
+    with pytest.raises(PCDValidationError):
+        data_core.validate()
@@ -0,0 +1,98 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+import json
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import PCDTypeError
+from panda_core_data.model import Model
+
+
+def test_residency(tmpdir):
+    data_core = DataCore(name="test_residency")
+
+    class Crate(Model, core_name="test_residency"):
+        name: str
+        value: int = 0
+
+    raws = tmpdir.mkdir("models").mkdir("Crate")
+    for index in range(5):
+        raws.join(f"crate_{index}.json").write(json.dumps(
+            {"data": [{"name": f"crate_{index}"}, {"value": index}]}))
+    data_core.recursively_instance_model(str(tmpdir.join("models")))
+    runtime = Crate("runtime", 100)
+
+    with pytest.raises(PCDTypeError):
+        Crate.limit_residency()
+
+    residency = Crate.limit_residency(max_instances=2)
+    assert Crate.limit_residency(max_instances=2) is residency
+    crates = sorted(Crate.wrapper.snapshot()[:5],
+                    key=lambda crate: crate.__dict__.get("value", -1))
+    assert residency.evictions >= 3
+    assert residency.resident == 2
+    assert residency.is_resident(runtime)
+
+    misses = residency.misses
+    assert [crate.value for crate in crates] == [0, 1, 2, 3, 4]
+    assert residency.misses > misses
+    assert residency.resident == 2
+    assert not residency.is_resident(crates[0])
+    assert residency.is_resident(crates[4])
+    assert crates[4].name == "crate_4"
+    assert residency.hits > 0
+
+    # changed instances stay in memory until they are saved
+    crates[0].value = 10
+    crates[1].name
+    crates[2].name
+    crates[3].name
+    assert residency.is_resident(crates[0])
+    crates[0].save_to_file()
+    crates[4].name
+    crates[3].name
+    assert not residency.is_resident(crates[0])
+    assert crates[0].value == 10
+
+    residency.set_limits(max_bytes=1)
+    assert residency.resident == 0
+    assert dict(crates[2]) == {"name": "crate_2", "value": 2}
+
+    residency.close()
+    assert all(residency.is_resident(crate) for crate in crates)
+    assert "__getattribute__" not in Crate.__dict__
+    assert runtime.value == 100
+
+
+def test_residency_changed_in_place(tmpdir):
+    data_core = DataCore(name="test_residency_in_place")
+
+    class Bag(Model, core_name="test_residency_in_place"):
+        name: str
+        contents: list
+
+    raws = tmpdir.mkdir("models").mkdir("Bag")
+    for index in range(3):
+        raws.join(f"bag_{index}.json").write(json.dumps(
+            {"data": [{"name": f"bag_{index}"}, {"contents": [index]}]}))
+    data_core.recursively_instance_model(str(tmpdir.join("models")))
+    bags = sorted(Bag.wrapper.snapshot(), key=lambda bag: bag.name)
+
+    residency = Bag.limit_residency(max_instances=3)
+    bags[0].contents.append("apple")
+    bags[1].name
+    bags[2].name
+    residency.set_limits(max_instances=0)
+    assert residency.is_resident(bags[0])
+    assert not residency.is_resident(bags[1])
+    assert bags[0].contents == [0, "apple"]
+
+    bags[0].save_to_file()
+    residency.set_limits(max_instances=0)
+    assert not residency.is_resident(bags[0])
+    assert bags[0].contents == [0, "apple"]
+    residency.close()
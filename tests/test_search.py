@@ -0,0 +1,118 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+import json
+import pickle
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import PCDKeyError, PCDTypeError
+from panda_core_data.model import Model
+from panda_core_data.search import (_raws_fingerprint, build_search_indexes,
+                                    search_index)
+
+
+def test_search():
+    DataCore(name="test_search")
+
+    class Gear(Model, core_name="test_search",
+               search_fields=("name", "description")):
+        name: str
+        description: str = ""
+        value: int = 0
+
+    Gear("Copper Sword", "a sword made of copper")
+    Gear("Iron Sword", "heavier than copper")
+    Gear("Copper Ore", "")
+    Gear("Coal", "fuel for the forge")
+
+    def names(instances):
+        return [instance.name for instance in instances]
+
+    assert names(Gear.search("copper")) == ["Copper Ore", "Copper Sword",
+                                            "Iron Sword"]
+    assert names(Gear.search("COPP")) == names(Gear.search("copper"))
+    assert names(Gear.search("copper sw")) == ["Copper Sword", "Iron Sword"]
+    assert names(Gear.search("co", limit=1)) == ["Coal"]
+    assert Gear.search("silver") == []
+    assert Gear.search("  ") == []
+
+    sword = Gear.wrapper.instances[0]
+    sword.description = "a blade"
+    Gear("Silver Ring")
+    assert names(Gear.search("silver")) == ["Silver Ring"]
+    assert names(Gear.search("blade")) == ["Copper Sword"]
+    # only changes of the indexed fields tokenize the instance again
+    index = search_index(Gear)
+    tokenized = []
+    instance_terms = index._instance_terms
+    index._instance_terms = lambda instance: tokenized.append(instance) or \
+        instance_terms(instance)
+    sword.value = 5
+    sword.update(value=6)
+    assert tokenized == []
+    sword.update(value=7, name="Copper Blade")
+    assert tokenized == [sword]
+    assert names(Gear.search("copper bl")) == ["Copper Blade"]
+    del index._instance_terms
+
+    Gear.wrapper.instances.remove(sword)
+    assert Gear.search("blade") == []
+    sword.value = 10
+    assert "Copper Sword" not in names(Gear.search("copper"))
+
+    class Loose(Model, core_name="test_search"):
+        name: str
+
+    with pytest.raises(PCDTypeError):
+        Loose.search("anything")
+    with pytest.raises(PCDKeyError):
+        search_index(Loose, ("missing",))
+
+
+def test_search_cache(tmpdir):
+    data_core = DataCore(name="test_search_cache")
+
+    class CachedGear(Model, core_name="test_search_cache",
+                     search_fields=("name",)):
+        name: str
+
+    raws = tmpdir.mkdir("models").mkdir("CachedGear")
+    for name in ["copper axe", "copper pick", "iron axe"]:
+        raws.join(f"{name.replace(' ', '_')}.json").write(
+            json.dumps({"data": [{"name": name}]}))
+    cache_folder = tmpdir.join("cache")
+
+    data_core.recursively_instance_model(str(tmpdir.join("models")))
+    build_search_indexes(data_core, str(cache_folder))
+    index = search_index(CachedGear)
+    assert cache_folder.join("CachedGear.search.pickle").check()
+    expected = [instance.name for instance in CachedGear.search("axe")]
+
+    index.close()
+    restored = search_index(CachedGear)
+    assert restored is not index
+    assert restored.restore(str(cache_folder.join("CachedGear.search.pickle")),
+                            "other fingerprint") is False
+    build_search_indexes(data_core, str(cache_folder))
+    assert not restored._stale
+    assert [instance.name for instance in CachedGear.search("axe")] == \
+        expected
+
+    cache_file = cache_folder.join("CachedGear.search.pickle")
+    fingerprint = _raws_fingerprint(CachedGear)
+    saved = cache_file.read_binary()
+    state = pickle.loads(saved)
+    del state["postings"]
+    for corrupted in (saved[:len(saved) // 2], b"garbage",
+                      pickle.dumps(object()), pickle.dumps(state)):
+        cache_file.write_binary(corrupted)
+        assert restored.restore(str(cache_file), fingerprint) is False
+        build_search_indexes(data_core, str(cache_folder))
+        assert restored.restore(str(cache_file), fingerprint) is True
+
+    CachedGear.search("pick")[0].name = "bronze pick"
+    assert len(CachedGear.search("copper")) == 1
@@ -0,0 +1,110 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+from multiprocessing import get_context
+from typing import List, Optional
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import PCDReadOnly, PCDTypeError
+from panda_core_data.model import Model, Template
+
+shared_core = pytest.importorskip("panda_core_data.shared_core")
+
+
+def read_names(segment_name):
+    with shared_core.attach_shared_core(segment_name) as attached:
+        return [item.name for item in attached.get_model_type("shared_items")]
+
+
+def test_shared_core():
+    data_core = DataCore(name="test_shared_core")
+
+    class SharedItems(Model, data_name="shared_items",
+                      core_name="test_shared_core"):
+        name: str
+        value: int
+        tags: List[str]
+
+    class SharedConfig(Template, core_name="test_shared_core"):
+        version: int
+
+    class SharedNested(Model, core_name="test_shared_core"):
+        config: SharedConfig
+
+    SharedItems("Copper", 1, ["metal"])
+    SharedItems("Iron", 10, [])
+    config = SharedConfig(2)
+    SharedNested(config)
+
+    with data_core.export_shared() as exported:
+        with shared_core.attach_shared_core(exported.name) as attached:
+            items = attached.get_model_type("shared_items")
+            assert len(items) == 2
+            assert items[-1].name == "Iron"
+            assert [dict(item.items()) for item in items] == [
+                {"name": "Copper", "value": 1, "tags": ["metal"]},
+                {"name": "Iron", "value": 10, "tags": []}]
+            assert items[0]["value"] == items[0][1] == 1
+            assert list(items[0]) == ["name", "value", "tags"]
+
+            assert attached.get_template_type("SharedConfig").version == 2
+            nested = next(iter(attached.get_model_type("SharedNested")))
+            assert nested.config == {"version": 2}
+
+            with pytest.raises(PCDReadOnly):
+                items[0].name = "Gold"
+
+            with pytest.raises(PCDTypeError):
+                attached.get_model_type("invalid")
+
+        for method in ("fork", "spawn"):
+            with get_context(method).Pool(2) as pool:
+                assert pool.map(read_names, [exported.name] * 2) == [
+                    ["Copper", "Iron"], ["Copper", "Iron"]]
+
+
+def test_shared_core_columns(monkeypatch):
+    data_core = DataCore(name="test_shared_core_columns")
+
+    class SharedColumns(Model, core_name="test_shared_core_columns"):
+        name: str
+        value: Optional[int]
+        weight: float
+        rare: bool
+        note: Optional[str]
+        huge: int
+        tags: List[str]
+
+    SharedColumns("Ação", 2 ** 60 + 1, 1.5, True, None, 2 ** 70, ["a"])
+    SharedColumns("Iron", None, 2.0, False, "heavy", 1, [])
+
+    with data_core.export_shared() as exported:
+        with shared_core.attach_shared_core(exported.name) as attached:
+            first, second = attached.get_model_type("SharedColumns")
+
+            def unpickle(_):
+                raise AssertionError("scalar columns aren't pickled")
+
+            monkeypatch.setattr(shared_core.pickle, "loads", unpickle)
+            assert (first.name, first.value, first.weight, first.rare,
+                    first.note) == ("Ação", 2 ** 60 + 1, 1.5, True, None)
+            assert (second.value, second.note, second.rare) == (None,
+                                                                "heavy",
+                                                                False)
+            assert type(first.rare) is bool
+            monkeypatch.undo()
+            assert first.huge == 2 ** 70
+            assert second.tags == []
+
+    DataCore(name="test_shared_core_clash")
+
+    class SharedClash(Model, core_name="test_shared_core_clash"):
+        name: str
+        items: int
+
+    with pytest.raises(PCDTypeError):
+        shared_core.export_shared_core(SharedClash.data_core)
@@ -0,0 +1,70 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+from typing import Optional
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import PCDKeyError
+from panda_core_data.model import Model
+
+
+def test_sorted_views():
+    DataCore(name="test_sorted_views")
+
+    class RankedItem(Model, core_name="test_sorted_views"):
+        name: str
+        value: Optional[int] = None
+
+    for index, value in enumerate([5, 3, 9, 3, 1]):
+        RankedItem(f"item_{index}", value)
+
+    ascending = RankedItem.order_by("value")
+    descending = RankedItem.order_by("value", descending=True)
+    assert RankedItem.order_by("value") is ascending
+
+    def names(instances):
+        return [instance.name for instance in instances]
+
+    assert names(ascending) == ["item_4", "item_1", "item_3", "item_0",
+                                "item_2"]
+    assert names(descending.page(0, 3)) == ["item_2", "item_0", "item_1"]
+    assert names(descending.page(3)) == ["item_3", "item_4"]
+
+    RankedItem("item_5", 4)
+    RankedItem("item_6")
+    assert names(ascending)[2:4] == ["item_3", "item_5"]
+    assert ascending[-1].name == "item_6"
+    assert descending[-1].name == "item_6"
+
+    RankedItem.wrapper.instances[2].value = 0
+    assert ascending[0].name == "item_2"
+    assert descending[0].name == "item_0"
+
+    RankedItem.wrapper.instances[0].update(value=3)
+    assert names(ascending)[:5] == ["item_2", "item_4", "item_0", "item_1",
+                                    "item_3"]
+
+    first_page, cursor = descending.cursor_page(limit=3)
+    assert names(first_page) == ["item_5", "item_0", "item_1"]
+    RankedItem.wrapper.instances.remove(first_page[0])
+    RankedItem("item_7", 10)
+    second_page, cursor = descending.cursor_page(cursor, limit=3)
+    assert names(second_page) == ["item_3", "item_4", "item_2"]
+    last_page, cursor = descending.cursor_page(cursor, limit=3)
+    assert names(last_page) == ["item_6"]
+    assert cursor is None
+
+    RankedItem.from_frame({"name": [f"bulk_{index}" for index in range(20)],
+                           "value": list(range(20))}, update=False)
+    assert len(ascending) == len(RankedItem.wrapper.instances) == 27
+    assert ascending[-2].name == "bulk_19"
+
+    ascending.close()
+    assert RankedItem.order_by("value") is not ascending
+
+    with pytest.raises(PCDKeyError):
+        RankedItem.order_by("missing")
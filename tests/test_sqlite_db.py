@@ -0,0 +1,127 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+import json
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import PCDInvalidPath, PCDInvalidRaw
+from panda_core_data.model import Model, Template
+from panda_core_data.storages.sqlite_db import SqliteDB, pack_raws
+
+
+def test_sqlite_db(tmpdir):
+    data_core = DataCore(name="test_sqlite_db")
+
+    class PackedItem(Model, core_name="test_sqlite_db"):
+        name: str
+        value: int
+
+    class PackedTool(Model, core_name="test_sqlite_db"):
+        name: str
+
+    class PackedSettings(Template, core_name="test_sqlite_db"):
+        difficulty: str
+
+    source = tmpdir.mkdir("raws")
+    items_dir = source.mkdir("models").mkdir("PackedItem")
+    for index in range(10):
+        items_dir.join(f"item_{index}.json").write(json.dumps(
+            {"data": [{"name": f"item_{index}"}, {"value": index}]}))
+    source.join("models").mkdir("PackedTool").join("hammer.json").write(
+        json.dumps({"data": [{"name": "hammer"}]}))
+    source.mkdir("templates").join("PackedSettings.json").write(
+        json.dumps({"data": [{"difficulty": "hard"}]}))
+
+    models_dir = tmpdir.mkdir("packed_models")
+    templates_dir = tmpdir.mkdir("packed_templates")
+    assert pack_raws(str(source.join("models")),
+                     str(models_dir.join("mod.sqlite"))) == 11
+    assert pack_raws(str(source.join("templates")),
+                     str(templates_dir.join("mod.sqlite"))) == 1
+
+    loaded = data_core.recursively_instance_model(str(models_dir))
+    assert len(loaded) == 11
+    assert sorted(item.value for item in PackedItem.all_instances) == list(
+        range(10))
+    assert PackedTool.wrapper.instances[0].name == "hammer"
+
+    data_core.recursively_instance_template(str(templates_dir))
+    assert PackedSettings.instanced().difficulty == "hard"
+
+    item = next(item for item in PackedItem.all_instances
+                if item.name == "item_3")
+    assert item.raw_file == models_dir.join("mod.sqlite")
+    item.value = 30
+    item.save_to_file()
+
+    storage = SqliteDB(str(models_dir.join("mod.sqlite")))
+    try:
+        assert storage.get_record("PackedItem", "item_3") == {
+            "name": "item_3", "value": 30}
+        assert storage.find_records("hammer") == [("PackedTool",
+                                                   {"name": "hammer"})]
+        assert storage.get_record("PackedItem", "missing") is None
+
+        storage.write_records("PackedItem", [("item_3", {"name": "item_3",
+                                                         "value": 300})])
+        item.reload()
+        assert item.value == 300
+
+        with storage.batch():
+            for current_item in PackedItem.all_instances:
+                current_item.value += 1
+                current_item.save_to_file()
+            assert storage.get_record("PackedItem", "item_0")["value"] == 0
+        assert storage.get_record("PackedItem", "item_0")["value"] == 1
+
+        with pytest.raises(PCDInvalidRaw):
+            storage.read()
+    finally:
+        storage.close()
+
+    streamed = list(data_core.iter_models(str(models_dir), "PackedItem"))
+    assert len(streamed) == 10
+    registered = {id(instance) for instance in PackedItem.all_instances}
+    assert not any(id(instance) in registered for instance in streamed)
+
+
+def test_convert_command(tmpdir):
+    from scripts.panda_core_data_commands import main
+
+    source = tmpdir.mkdir("raws")
+    source.mkdir("Item").join("sword.json").write(json.dumps(
+        {"data": [{"name": "sword"}]}))
+    main(["--convert", str(source), "--into", str(tmpdir.join("mod.sqlite"))])
+
+    storage = SqliteDB(str(tmpdir.join("mod.sqlite")))
+    try:
+        assert storage.read_records() == [("Item", "sword", {"name": "sword"})]
+    finally:
+        storage.close()
+
+
+def test_pack_raws_root(tmpdir):
+    from scripts.panda_core_data_commands import main
+
+    source = tmpdir.mkdir("raws")
+    source.mkdir("models").mkdir("Item").join("sword.json").write(
+        json.dumps({"data": [{"name": "sword"}]}))
+    source.mkdir("templates").join("Settings.json").write(
+        json.dumps({"data": [{"difficulty": "easy"}]}))
+
+    with pytest.raises(PCDInvalidPath):
+        pack_raws(str(source), str(tmpdir.join("mod.sqlite")))
+    with pytest.raises(SystemExit):
+        main(["--convert", str(source), "--into",
+              str(tmpdir.join("mod.sqlite"))])
+
+    nested = tmpdir.mkdir("nested")
+    nested.mkdir("mod").mkdir("Item").join("sword.json").write(
+        json.dumps({"data": [{"name": "sword"}]}))
+    with pytest.raises(PCDInvalidPath):
+        pack_raws(str(nested), str(tmpdir.join("mod.sqlite")))
+    assert not tmpdir.join("mod.sqlite").check()
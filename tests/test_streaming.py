@@ -0,0 +1,64 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+import json
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import PCDValidationError
+from panda_core_data.model import Model
+
+
+def test_iter_models(tmpdir):
+    data_core = DataCore(name="test_iter_models")
+
+    class StreamedItem(Model, core_name="test_iter_models"):
+        name: str
+        value: int
+
+    class StreamedTool(Model, core_name="test_iter_models"):
+        name: str
+
+    items_dir = tmpdir.mkdir("StreamedItem")
+    nested_dir = items_dir.mkdir("nested")
+    for index in range(20):
+        folder = nested_dir if index % 2 else items_dir
+        folder.join(f"item_{index}.json").write(json.dumps(
+            {"data": [{"name": f"item_{index}"}, {"value": str(index)}]}))
+    items_dir.join("ignored.txt").write("not a raw")
+    tmpdir.mkdir("StreamedTool").join("hammer.json").write(
+        json.dumps({"data": [{"name": "hammer"}]}))
+
+    streamed = list(data_core.iter_models(str(items_dir), "StreamedItem"))
+    assert sorted(item.value for item in streamed) == list(range(20))
+    assert all(isinstance(item, StreamedItem) for item in streamed)
+    assert all(item.raw_file is None for item in streamed)
+    assert not StreamedItem.wrapper.instances
+
+    threaded = list(data_core.iter_models(str(items_dir), StreamedItem,
+                                          workers=3))
+    assert [item.name for item in threaded] == [item.name for item
+                                                 in streamed]
+
+    odd = data_core.iter_models(str(items_dir), "StreamedItem", workers=2,
+                                where=lambda item: item.value % 2)
+    assert sorted(item.value for item in odd) == list(range(1, 20, 2))
+
+    flat = data_core.iter_models(str(items_dir), "StreamedItem",
+                                 recursive=False)
+    assert len(list(flat)) == 10
+
+    everything = list(data_core.iter_models(str(tmpdir)))
+    assert len(everything) == 21
+    assert everything[-1].name == "hammer"
+    assert not StreamedTool.wrapper.instances
+
+    items_dir.join("invalid.json").write(json.dumps(
+        {"data": [{"name": "invalid"}, {"value": "ten"}]}))
+    with pytest.raises(PCDValidationError):
+        list(data_core.iter_models(str(items_dir), "StreamedItem"))
+    assert len(list(data_core.iter_models(str(items_dir), "StreamedItem",
+                                          validate=False))) == 21
@@ -0,0 +1,70 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+from typing import Dict, List, Optional
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import PCDValidationError
+from panda_core_data.model import Model, Template
+from panda_core_data.validators import validate_instances
+
+
+def test_validation(tmpdir):
+    data_core = DataCore(name="test_validation")
+
+    class ValidationTemplate(Template, core_name="test_validation"):
+        weight: float
+
+    class ValidationModel(Model, core_name="test_validation"):
+        name: str
+        value: int
+        tags: List[str]
+        stats: Dict[str, float]
+        parent: Optional[ValidationTemplate] = None
+        enabled: bool = True
+
+    valid = ValidationModel("valid", "10", ["a"], {"hp": 1},
+                            {"weight": "2.5"})
+    invalid = ValidationModel("invalid", "ten", ["a", []], {"hp": "high"},
+                              {"weight": "heavy"}, "yes")
+    ValidationTemplate("1")
+
+    errors = validate_instances(ValidationModel, [valid])
+    assert errors == []
+    assert valid.value == 10
+    assert valid.stats == {"hp": 1.0}
+    assert isinstance(valid.parent, ValidationTemplate)
+    assert valid.parent.weight == 2.5
+
+    errors = data_core.validate(raise_errors=False)
+    assert len(errors) == 5
+    assert all("instance of ValidationModel" in error for error in errors)
+
+    with pytest.raises(PCDValidationError) as validation_error:
+        data_core.validate()
+    assert validation_error.value.errors == errors
+
+    raw_file = tmpdir.join("invalid.json")
+    raw_file.write('{"data": [{"name": "a"}, {"value": 1.5}, {"tags": []}, '
+                   '{"stats": {}}]}')
+    ValidationModel.instance_from_raw(str(raw_file.realpath()))
+
+    errors = data_core.validate(raise_errors=False)
+    assert str(raw_file.realpath()) in errors[-1]
+
+
+def test_validation_union_message():
+    DataCore(name="test_validation_union_message")
+
+    class UnionModel(Model, core_name="test_validation_union_message"):
+        name: str
+        value: Optional[int] = None
+
+    invalid = UnionModel("invalid", "many")
+    errors = validate_instances(UnionModel, [invalid])
+    assert len(errors) == 1
+    assert "expected Optional[int]" in errors[0]
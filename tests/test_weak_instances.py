@@ -0,0 +1,94 @@
+'''
+:created: 19-10-2026
+
+:author: Leandro (Cerberus1746) Benedet Garcia
+'''
+import gc
+import json
+from typing import Optional
+
+import pytest
+
+from panda_core_data import DataCore
+from panda_core_data.custom_exceptions import PCDTypeError
+from panda_core_data.data_core_bases import WeakGroupInstance
+from panda_core_data.model import Model
+from panda_core_data.references import Ref
+
+
+def test_weak_instances(tmpdir):
+    data_core = DataCore(name="test_weak_instances")
+
+    class Spawned(Model, core_name="test_weak_instances",
+                  weak_instances=True):
+        name: str
+
+    raws = tmpdir.mkdir("models").mkdir("Spawned")
+    raws.join("loaded.json").write(json.dumps({"data": [{"name": "loaded"}]}))
+    data_core.recursively_instance_model(str(tmpdir.join("models")))
+    instances = Spawned.wrapper.instances
+    assert isinstance(instances, WeakGroupInstance)
+
+    kept = Spawned("kept")
+    Spawned("dropped")
+    gc.collect()
+
+    def names():
+        return [instance.name for instance in Spawned.all_instances]
+
+    assert names() == ["loaded", "kept"]
+    assert len(instances) == 2
+    assert instances[1] is kept
+    assert kept in instances
+
+    version = Spawned.wrapper.version
+    del kept
+    gc.collect()
+    assert names() == ["loaded"]
+    assert Spawned.wrapper.version > version
+
+    for index in range(1000):
+        Spawned(f"churn_{index}")
+    assert len(instances._items) < 100
+    gc.collect()
+    assert names() == ["loaded"]
+
+    replacement = Spawned("replacement")
+    assert names() == ["loaded", "replacement"]
+    instances.remove(instances[0])
+    assert names() == ["replacement"]
+    del replacement
+    gc.collect()
+    assert not instances
+
+    class Strong(Model, core_name="test_weak_instances"):
+        name: str
+
+    Strong("kept")
+    gc.collect()
+    assert len(Strong.wrapper.instances) == 1
+    assert not isinstance(Strong.wrapper.instances, WeakGroupInstance)
+
+
+def test_weak_instances_views():
+    data_core = DataCore(name="test_weak_instances_views")
+
+    with pytest.raises(PCDTypeError):
+        class Searched(Model, core_name="test_weak_instances_views",
+                       weak_instances=True, search_fields=("name",)):
+            name: str
+
+    class Mob(Model, core_name="test_weak_instances_views",
+              weak_instances=True):
+        name: str
+        target: Optional[Ref["Mob"]] = None
+
+    with pytest.raises(PCDTypeError):
+        Mob.order_by("name")
+
+    for index in range(100):
+        Mob(f"mob_{index}")
+    data_core.resolve_references()
+    assert data_core.references.key_index("Mob") is not None
+    gc.collect()
+    assert not Mob.wrapper.instances